@@ -1,3 +1,4 @@
+import structlog
 from flask import Flask
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
@@ -12,6 +13,15 @@ def create_app():
 
     app.config.from_object("config.settings.Settings")
 
+    from config.settings import settings
+    if settings.META_ADS_ACCESS_TOKEN and not settings.PUBLIC_BASE_URL:
+        # Phase 8 hands stored creatives to Meta by URL; without a public base it can
+        # only use provider URLs, and creatives composited locally are skipped
+        structlog.get_logger(__name__).warning(
+            "config.public_base_url_missing",
+            detail="Set PUBLIC_BASE_URL so Meta Ads can fetch locally stored creatives",
+        )
+
     CORS(app, resources={r"/api/*": {"origins": "*"}})
 
     db.init_app(app)
@@ -27,8 +37,18 @@ def create_app():
         learning,
         ad_performance,
         phase_toggle,
+        asset,
+        sync_state,
+        product_performance,
+        dashboard_counter,
+        ad_rollup,
+        learning_rollup,
+        prompt_test_run,
     )
 
+    # Keep dashboard counters current on every flush
+    from app.services import rollups  # noqa: F401
+
     # Register API blueprints
     from app.api.routes import api_bp
     app.register_blueprint(api_bp, url_prefix="/api")
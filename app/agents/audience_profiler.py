@@ -2,7 +2,7 @@
 Builds buyer personas using search data, Reddit, and AI synthesis.
 """
 
-from app.agents.base import BaseAgent
+from app.agents.base import BaseAgent, Step
 
 
 class AudienceProfilerAgent(BaseAgent):
@@ -14,29 +14,32 @@ class AudienceProfilerAgent(BaseAgent):
         phase_1 = input_data.get("phase_1_output", {})
         phase_2 = input_data.get("phase_2_output", {})
 
-        # Step 1: Get search questions (People Also Ask, autocomplete)
-        search_questions = self._get_search_questions(niche)
-
-        # Step 2: Get Reddit discussions
-        reddit_data = self._get_reddit_discussions(niche)
-
-        # Step 3: Perplexity deep research
-        research = self._deep_research(niche)
-
-        # Step 4: Build audience profile with LLM
-        audience_profile = self._build_profile(
-            niche, search_questions, reddit_data, research,
-            phase_1.get("analysis", {}), learning_context,
-        )
-
-        # Step 5: Extract pain points
-        pain_points = self._extract_pain_points(niche, reddit_data, search_questions)
+        # Steps 1-3 (search questions, Reddit, Perplexity) run concurrently;
+        # the two LLM steps start as soon as their inputs are ready.
+        results = self.run_steps({
+            "search_questions": Step(self._get_search_questions, niche),
+            "reddit_data": Step(self._get_reddit_discussions, niche),
+            "research": Step(self._deep_research, niche),
+            "audience_profile": Step(
+                lambda search_questions, reddit_data, research: self._build_profile(
+                    niche, search_questions, reddit_data, research,
+                    phase_1.get("analysis", {}), learning_context,
+                ),
+                after=("search_questions", "reddit_data", "research"),
+            ),
+            "pain_points": Step(
+                lambda search_questions, reddit_data: self._extract_pain_points(
+                    niche, reddit_data, search_questions,
+                ),
+                after=("search_questions", "reddit_data"),
+            ),
+        })
 
         return {
-            "audience_profile": audience_profile,
-            "pain_points": pain_points,
-            "search_questions": search_questions,
-            "reddit_insights": reddit_data,
+            "audience_profile": results["audience_profile"],
+            "pain_points": results["pain_points"],
+            "search_questions": results["search_questions"],
+            "reddit_insights": results["reddit_data"],
             "phase": self.phase_number,
             "agent": self.agent_name,
         }
@@ -90,7 +93,7 @@ class AudienceProfilerAgent(BaseAgent):
         )
         prompt += learning_text
 
-        response = self.call_llm("openai", prompt, json_mode=True)
+        response = self.call_llm("openai", prompt, json_mode=True, template_key="build_audience_profile")
         return self.parse_json_response(response)
 
     def _extract_pain_points(self, niche, reddit, questions) -> dict:
@@ -99,5 +102,5 @@ class AudienceProfilerAgent(BaseAgent):
             niche=niche,
             discussions=str({"reddit": reddit, "search_questions": questions}),
         )
-        response = self.call_llm("openai", prompt, json_mode=True)
+        response = self.call_llm("openai", prompt, json_mode=True, template_key="extract_pain_points")
         return self.parse_json_response(response)
@@ -1,30 +1,60 @@
 """Base agent class — shared logic for all pipeline agents."""
 
+import contextvars
 import json
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 import structlog
 import yaml
+from flask import current_app, has_app_context
 
 from app import db
 from app.models.prompt_template import PromptTemplate
 from app.models.learning import LearningLog
+from app.services import events
 
 logger = structlog.get_logger(__name__)
 
 
+class Step:
+    """A unit of work in an agent's step graph.
+
+    `after` names the steps this one depends on. Their results are passed to
+    `fn` as keyword arguments named after the steps, or under the names given
+    when `after` is a {step_name: kwarg_name} mapping.
+    """
+
+    def __init__(self, fn, *args, after: tuple | dict = (), **kwargs):
+        self.fn = fn
+        self.args = args
+        self.after = dict(after) if isinstance(after, dict) else {dep: dep for dep in after}
+        self.kwargs = kwargs
+
+
 class BaseAgent(ABC):
     """Base class for all ZEULE pipeline agents."""
 
     agent_name: str = "base"
     phase_number: int = 0
+    max_concurrency: int = 4  # parallel steps per agent in run_steps()
 
-    def __init__(self):
+    def __init__(self, dry_run: bool = False, prompt_overrides: dict = None, bypass_cache: bool = False):
+        """`dry_run` skips writes to the database and external systems and caches
+        every LLM call; `prompt_overrides` maps template keys to PromptTemplates
+        used instead of the active version (prompt replays); `bypass_cache`
+        forces fresh LLM responses (re-running a rejected phase)."""
         self.logger = structlog.get_logger(agent=self.agent_name, phase=self.phase_number)
+        self.pipeline_run_id = None
+        self.dry_run = dry_run
+        self.prompt_overrides = prompt_overrides or {}
+        self.bypass_cache = bypass_cache
 
     def execute(self, pipeline_run_id: str, input_data: dict, phase_result_id: str) -> dict:
         """Main execution method — called by the orchestrator."""
         self.logger.info("agent.execute.start", pipeline_run_id=pipeline_run_id)
+        self.pipeline_run_id = pipeline_run_id
 
         # Get relevant learning context from past runs
         learning_context = self._get_learning_context(input_data.get("niche", ""))
@@ -40,8 +70,87 @@ class BaseAgent(ABC):
         """Agent-specific logic — must be implemented by each agent."""
         pass
 
+    def run_steps(self, steps: dict, max_concurrency: int = None) -> dict:
+        """Run a graph of named steps, executing independent ones concurrently.
+
+        A failing step does not stop the others; steps depending on it are
+        skipped. Once the graph settles the first failure is re-raised, so
+        steps that should degrade gracefully must handle their own errors.
+        """
+        for name, step in steps.items():
+            unknown = [dep for dep in step.after if dep not in steps]
+            if unknown:
+                raise ValueError(f"Step '{name}' depends on unknown steps: {unknown}")
+
+        app = current_app._get_current_object() if has_app_context() else None
+        limit = max(1, min(max_concurrency or self.max_concurrency, len(steps)))
+
+        results, errors = {}, {}
+        pending = dict(steps)
+        running = {}
+
+        def call(name, step, deps):
+            start = time.time()
+            if app is None:
+                result = step.fn(*step.args, **step.kwargs, **deps)
+            else:
+                # Worker threads need their own app context (and DB session)
+                with app.app_context():
+                    result = step.fn(*step.args, **step.kwargs, **deps)
+            duration = round(time.time() - start, 2)
+            self.logger.info("step.done", step=name, duration=duration)
+            self._publish_step("step_done", name, duration=duration)
+            return result
+
+        with ThreadPoolExecutor(max_workers=limit) as pool:
+            while pending or running:
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for name, step in list(pending.items()):
+                        failed = [dep for dep in step.after if dep in errors]
+                        if failed:
+                            self.logger.warning("step.skipped", step=name, failed_dependency=failed[0])
+                            errors[name] = errors[failed[0]]
+                        elif all(dep in results for dep in step.after):
+                            deps = {arg: results[dep] for dep, arg in step.after.items()}
+                            # Steps see the caller's context vars (e.g. LLM usage tracking)
+                            context = contextvars.copy_context()
+                            running[pool.submit(context.run, call, name, step, deps)] = name
+                        else:
+                            continue
+                        del pending[name]
+                        progressed = True
+
+                if not running:
+                    if pending:
+                        raise ValueError(f"Step graph has a dependency cycle: {sorted(pending)}")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        self.logger.warning("step.failed", step=name, error=str(e))
+                        self._publish_step("step_failed", name, error=str(e))
+                        errors[name] = e
+
+        for name in steps:
+            if name in errors:
+                raise errors[name]
+        return results
+
+    def _publish_step(self, event_type: str, step: str, **data):
+        if self.pipeline_run_id:
+            events.publish(event_type, self.pipeline_run_id, phase=self.phase_number, agent=self.agent_name, step=step, **data)
+
     def get_prompt(self, template_key: str, **variables) -> str:
         """Load and render a prompt template from the database."""
+        if template_key in self.prompt_overrides:
+            return self.prompt_overrides[template_key].render(**variables)
+
         # Try database first (user-edited prompts)
         template = PromptTemplate.query.filter_by(
             template_key=template_key,
@@ -96,14 +205,37 @@ class BaseAgent(ABC):
             for log in logs
         ]
 
-    def call_llm(self, provider: str, prompt: str, system_prompt: str = None, json_mode: bool = True) -> dict | str:
-        """Call an LLM provider (openai, anthropic, perplexity)."""
+    def call_llm(
+        self,
+        provider: str,
+        prompt: str,
+        system_prompt: str = None,
+        json_mode: bool = True,
+        template_key: str = None,
+        bypass_cache: bool = False,
+    ) -> dict | str:
+        """Call an LLM provider (openai, anthropic, perplexity).
+
+        Passing the prompt's `template_key` opts the call into the LLM response
+        cache; perplexity is research and goes through the research cache instead.
+        Dry runs cache every call, so replaying the same inputs again is free.
+        """
+        if self.dry_run and not template_key:
+            template_key = f"replay:{self.agent_name}"
+        bypass_cache = bypass_cache or self.bypass_cache
+
         if provider == "openai":
             from app.integrations.openai_client import call_openai
-            return call_openai(prompt, system_prompt=system_prompt, json_mode=json_mode)
+            return call_openai(
+                prompt, system_prompt=system_prompt, json_mode=json_mode,
+                cache_template=template_key, bypass_cache=bypass_cache,
+            )
         elif provider == "anthropic":
             from app.integrations.anthropic_client import call_anthropic
-            return call_anthropic(prompt, system_prompt=system_prompt, json_mode=json_mode)
+            return call_anthropic(
+                prompt, system_prompt=system_prompt, json_mode=json_mode,
+                cache_template=template_key, bypass_cache=bypass_cache,
+            )
         elif provider == "perplexity":
             from app.integrations.perplexity_client import call_perplexity
             return call_perplexity(prompt, system_prompt=system_prompt)
@@ -1,15 +1,24 @@
 """Phase 8 — Campaign Launch Agent
-Generates ad creatives with Ideogram + Bannerbear and launches Meta Ads campaigns.
+Generates ad creatives with Ideogram, brands them and launches Meta Ads campaigns.
+One Ideogram render per hook; the 4:5 and 9:16 formats are derived from it locally
+and branding is composited locally (or by Bannerbear, see BRANDING_BACKEND).
+All creatives are kept in the asset store.
 """
 
-from app.agents.base import BaseAgent
+from app.agents.base import BaseAgent, Step
 from app import db
 from app.models.product import Product
+from app.services.asset_store import external_url, object_path
+from config.settings import settings
+
+AD_FORMATS = ["1:1", "4:5", "9:16"]
+MASTER_FORMAT = "1:1"  # rendered by Ideogram; other formats are derived locally
 
 
 class CampaignLauncherAgent(BaseAgent):
     agent_name = "campaign_launcher"
     phase_number = 8
+    max_concurrency = 8
 
     def run(self, input_data: dict, learning_context: list) -> dict:
         niche = input_data.get("niche", "")
@@ -29,18 +38,24 @@ class CampaignLauncherAgent(BaseAgent):
         config = input_data.get("pipeline_config", {})
         brand_colors = config.get("brand_colors", "#1a1a2e, #16213e, #e94560")
 
-        # Get cover image URL
-        cover_url = None
+        # Get the main product's cover (stored copy from Phase 6 when available)
+        main_product_id, cover_url = None, None
         for p in products:
             if p.get("product_type") == "main":
-                cover_url = (p.get("assets") or {}).get("cover_url")
+                main_product_id = p.get("id")
+                product = Product.query.get(main_product_id)
+                assets = (product.assets if product else None) or {}
+                cover_url = self._image_source(
+                    assets.get("cover_sha256"), assets.get("cover_source_url") or assets.get("cover_url"),
+                )
                 break
+        self.main_product_id = main_product_id
 
-        # Step 1: Generate ad creative images with Ideogram
-        creatives = self._generate_creatives(product_name, ad_copy, brand_colors)
-
-        # Step 2: Apply branded templates with Bannerbear
-        branded_creatives = self._apply_templates(product_name, ad_copy, creatives, cover_url, brand_colors)
+        # Steps 1-2: Ideogram creatives (one render per variation, other formats
+        # derived locally) and branding, pipelined per variation
+        creatives, branded_creatives = self._generate_creatives(
+            product_name, ad_copy, cover_url, brand_colors,
+        )
 
         # Step 3: Create Meta Ads campaign
         campaign = self._create_campaign(
@@ -56,15 +71,49 @@ class CampaignLauncherAgent(BaseAgent):
             "agent": self.agent_name,
         }
 
-    def _generate_creatives(self, product_name: str, ad_copy: dict, brand_colors: str) -> list:
-        """Generate ad images with Ideogram for each ad variation."""
-        creatives = []
+    def _generate_creatives(self, product_name, ad_copy, cover_url, brand_colors) -> tuple[list, list]:
+        """Build Ideogram prompts, render one master per variation and brand it.
+
+        Only the square master is rendered by Ideogram; the other ad formats
+        are derived from it locally. Each variation flows prompt -> master ->
+        (derived formats, branding) independently, so a slow or failed
+        variation never holds up the others. Provider calls are capped and
+        retried by the integrations themselves (`adaptive_retry`).
+        """
         variations = ad_copy if isinstance(ad_copy, list) else ad_copy.get("variations", [])
+        variations = variations[:4]
 
-        for i, variation in enumerate(variations[:4]):
+        steps = {}
+        for i, variation in enumerate(variations):
             hook = variation.get("primary_text", "") if isinstance(variation, dict) else str(variation)
+            steps[f"prompt_{i}"] = Step(self._build_image_prompt, product_name, hook, brand_colors)
+            steps[f"master_{i}"] = Step(
+                self._render_creative, product_name, i, hook,
+                after={f"prompt_{i}": "prompt_config"},
+            )
+            steps[f"derived_{i}"] = Step(
+                self._derive_formats, brand_colors,
+                after={f"master_{i}": "master"},
+            )
+            steps[f"brand_{i}"] = Step(
+                self._apply_template, product_name, i, variation, cover_url, brand_colors,
+                after={f"master_{i}": "creative"},
+            )
+
+        results = self.run_steps(steps)
 
-            # Generate prompt for Ideogram
+        creatives = []
+        for i in range(len(variations)):
+            if results[f"master_{i}"]:
+                creatives.append(results[f"master_{i}"])
+            creatives.extend(results[f"derived_{i}"])
+        # One branded creative per variation, tagged so Meta pairs it with its copy
+        branded = [{**results[f"brand_{i}"], "variation": i + 1} for i in range(len(variations))]
+        return creatives, branded
+
+    def _build_image_prompt(self, product_name: str, hook: str, brand_colors: str) -> dict:
+        """Have GPT turn an ad hook into an Ideogram prompt config."""
+        try:
             ideogram_prompt_text = self.get_prompt(
                 "ideogram_prompt",
                 product_name=product_name,
@@ -72,58 +121,131 @@ class CampaignLauncherAgent(BaseAgent):
                 brand_colors=brand_colors,
             )
             prompt_config = self.call_llm("openai", ideogram_prompt_text, json_mode=True)
-            prompt_config = self.parse_json_response(prompt_config)
-
-            # Generate images in multiple formats
-            for aspect_ratio in ["1:1", "4:5", "9:16"]:
-                try:
-                    from app.integrations.ideogram_client import generate_image
-                    result = generate_image(
-                        prompt=prompt_config.get("prompt", f"Ad creative for {product_name}"),
-                        aspect_ratio=aspect_ratio,
-                        style=prompt_config.get("style", "design"),
-                        negative_prompt=prompt_config.get("negative_prompt", ""),
-                    )
-                    creatives.append({
-                        "variation": i + 1,
-                        "hook": hook[:50],
-                        "aspect_ratio": aspect_ratio,
-                        "url": result.get("url"),
-                    })
-                except Exception as e:
-                    self.logger.warning("ideogram.creative.failed", variation=i, error=str(e))
-
-        return creatives
-
-    def _apply_templates(self, product_name, ad_copy, creatives, cover_url, brand_colors) -> list:
-        """Apply branded templates using Bannerbear."""
-        branded = []
+            return self.parse_json_response(prompt_config)
+        except Exception as e:
+            # Fall back to a generic prompt rather than losing the variation
+            self.logger.warning("ideogram.prompt.failed", error=str(e))
+            return {}
+
+    def _render_creative(self, product_name, index, hook, prompt_config) -> dict | None:
+        """Generate a variation's master ad image with Ideogram and store a copy."""
         try:
-            from app.integrations.bannerbear_client import generate_image as bb_generate
-
-            variations = ad_copy if isinstance(ad_copy, list) else ad_copy.get("variations", [])
-            for i, variation in enumerate(variations[:4]):
-                headline = variation.get("headline", "") if isinstance(variation, dict) else ""
-                description = variation.get("description", "") if isinstance(variation, dict) else ""
-
-                result = bb_generate(
-                    template_id=None,  # will use default template
-                    modifications={
-                        "headline": headline,
-                        "description": description,
-                        "product_name": product_name,
-                        "background_image": creatives[i * 3]["url"] if i * 3 < len(creatives) else None,
-                        "cover_image": cover_url,
-                    },
+            from app.integrations.ideogram_client import generate_image
+            result = generate_image(
+                prompt=prompt_config.get("prompt", f"Ad creative for {product_name}"),
+                aspect_ratio=MASTER_FORMAT,
+                style=prompt_config.get("style", "design"),
+                negative_prompt=prompt_config.get("negative_prompt", ""),
+            )
+        except Exception as e:
+            self.logger.warning("ideogram.creative.failed", variation=index, error=str(e))
+            return None
+
+        creative = {
+            "variation": index + 1,
+            "hook": hook[:50],
+            "aspect_ratio": MASTER_FORMAT,
+            "url": result.get("url"),
+        }
+        if creative["url"]:
+            try:
+                from app.services.image_service import download_image, to_png_bytes
+                stored = self._store_creative(
+                    to_png_bytes(download_image(creative["url"])),
+                    f"variation_{index + 1}_{MASTER_FORMAT.replace(':', 'x')}.png",
                 )
-                branded.append(result)
+                creative.update(source_url=creative["url"], url=stored["url"], sha256=stored["sha256"])
+            except Exception as e:
+                self.logger.warning("creative.store.failed", variation=index, error=str(e))
+        return creative
+
+    def _derive_formats(self, brand_colors, master) -> list:
+        """Crop or pad the master locally into the remaining ad formats."""
+        if not master or not master.get("url"):
+            return []
+
+        try:
+            from app.services.image_service import load_image, derive_format, to_png_bytes
+
+            image = load_image(object_path(master["sha256"]) if master.get("sha256") else master["url"])
+
+            derived = []
+            for aspect_ratio in AD_FORMATS:
+                if aspect_ratio == MASTER_FORMAT:
+                    continue
+                stored = self._store_creative(
+                    to_png_bytes(derive_format(image, aspect_ratio, brand_colors)),
+                    f"variation_{master['variation']}_{aspect_ratio.replace(':', 'x')}.png",
+                )
+                derived.append({
+                    "variation": master["variation"],
+                    "hook": master["hook"],
+                    "aspect_ratio": aspect_ratio,
+                    "url": stored["url"],
+                    "sha256": stored["sha256"],
+                    "derived_from": master.get("sha256") or master["url"],
+                })
+            return derived
         except Exception as e:
-            self.logger.warning("bannerbear.failed", error=str(e))
+            self.logger.warning("creative.derive.failed", variation=master.get("variation"), error=str(e))
+            return []
 
-        return branded
+    def _apply_template(self, product_name, index, variation, cover_url, brand_colors, creative) -> dict:
+        """Brand a variation's master creative (local compositor or Bannerbear)."""
+        headline = variation.get("headline", "") if isinstance(variation, dict) else ""
+        description = variation.get("description", "") if isinstance(variation, dict) else ""
+
+        background = None
+        if creative:
+            background = self._image_source(creative.get("sha256"), creative.get("source_url") or creative.get("url"))
+
+        try:
+            from app.services.branding_service import apply_branding
+            return apply_branding(
+                modifications={
+                    "headline": headline,
+                    "description": description,
+                    "product_name": product_name,
+                    "background_image": background,
+                    "cover_image": cover_url,
+                },
+                brand_colors=brand_colors,
+                pipeline_run_id=self.pipeline_run_id,
+                product_id=self.main_product_id,
+                name=f"variation_{index + 1}_branded.png",
+            )
+        except Exception as e:
+            self.logger.warning("branding.failed", variation=index, error=str(e))
+            return {"error": str(e)}
+
+    def _image_source(self, sha256: str | None, url: str | None) -> str | None:
+        """Where the branding backend should read an image from.
+
+        The local compositor reads stored copies straight from disk; Bannerbear
+        is remote and needs an absolute URL it can fetch.
+        """
+        if not sha256:
+            return url
+        if settings.BRANDING_BACKEND == "bannerbear":
+            return external_url(sha256, url)
+        return object_path(sha256)
+
+    def _store_creative(self, png: bytes, name: str) -> dict:
+        from app.services.asset_store import put_bytes
+        asset = put_bytes(
+            png,
+            pipeline_run_id=self.pipeline_run_id,
+            kind="creative",
+            product_id=self.main_product_id,
+            name=name,
+            mime_type="image/png",
+        )
+        return asset.to_dict()
 
     def _create_campaign(self, product_name, niche, audience, ad_copy, creatives, learning_context) -> dict:
         """Create a Meta Ads campaign."""
+        # Meta fetches images by URL: stored copies only work with PUBLIC_BASE_URL
+        creatives = [self._for_meta(c) for c in creatives]
         try:
             from app.integrations.meta_ads import create_campaign
 
@@ -141,8 +263,29 @@ class CampaignLauncherAgent(BaseAgent):
                 ad_copy=ad_copy,
                 creatives=creatives,
                 daily_budget=1000,  # $10 daily budget in cents
+                idempotency_key=self.pipeline_run_id,
             )
-            return result
         except Exception as e:
             self.logger.warning("meta_ads.failed", error=str(e))
             return {"error": str(e)}
+
+        # Performance sync reads the campaign from the main product
+        product = Product.query.get(self.main_product_id) if self.main_product_id else None
+        if product and result.get("campaign_id"):
+            product.assets = {
+                **(product.assets or {}),
+                "campaign_id": result["campaign_id"],
+                "ad_set_id": result.get("ad_set_id"),
+            }
+            db.session.commit()
+        return result
+
+    def _for_meta(self, creative: dict) -> dict:
+        """A creative with an absolute URL Meta can fetch (meta_ads skips ones without)."""
+        if not creative or creative.get("error") or not creative.get("sha256"):
+            return creative
+        url = external_url(creative["sha256"], creative.get("source_url"))
+        if not url:
+            self.logger.warning("creative.no_external_url", sha256=creative["sha256"])
+            return {**creative, "url": None, "error": "No absolute URL for stored creative (set PUBLIC_BASE_URL)"}
+        return {**creative, "url": url}
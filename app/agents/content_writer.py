@@ -127,7 +127,7 @@ class ContentWriterAgent(BaseAgent):
         """Run the QA review agent on written content."""
         prompt = self.get_prompt("review_content", content=content[:5000])
         try:
-            response = self.call_llm("openai", prompt, json_mode=True)
+            response = self.call_llm("openai", prompt, json_mode=True, template_key="review_content")
             return self.parse_json_response(response)
         except Exception as e:
             self.logger.warning("review.failed", error=str(e))
@@ -135,6 +135,9 @@ class ContentWriterAgent(BaseAgent):
 
     def _update_product_records(self, products: list, all_content: dict):
         """Update product records with written content."""
+        if self.dry_run:
+            return
+
         type_to_key = {
             "main": "main_product",
             "bonus": ["bonus_1", "bonus_2"],
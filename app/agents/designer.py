@@ -1,10 +1,12 @@
 """Phase 6 — Visual Design Agent
-Generates ebook PDFs with Gamma and covers with Ideogram.
+Generates ebook PDFs with Gamma and covers with Ideogram, and keeps local
+copies of both in the asset store.
 """
 
 from app.agents.base import BaseAgent
 from app import db
 from app.models.product import Product
+from app.services.asset_store import external_url
 
 
 class DesignerAgent(BaseAgent):
@@ -21,9 +23,11 @@ class DesignerAgent(BaseAgent):
         products = phase_4.get("products_created", [])
 
         results = {}
+        downloads = []
 
         # Generate covers for all products
         for product_data in products:
+            product_id = product_data.get("id")
             product_name = product_data.get("name", "")
             product_type = product_data.get("product_type", "main")
 
@@ -37,20 +41,39 @@ class DesignerAgent(BaseAgent):
             if product_type == "main" and content.get("main_product"):
                 pdf_url = self._generate_pdf(product_name, content["main_product"])
 
-            results[product_data.get("id", product_name)] = {
+            results[product_id or product_name] = {
                 "cover": cover,
                 "pdf_url": pdf_url,
             }
 
-            # Update product record
+            if product_id and cover.get("url"):
+                downloads.append({"url": cover["url"], "kind": "cover", "product_id": product_id, "name": "cover.png"})
+            if product_id and pdf_url:
+                downloads.append({"url": pdf_url, "kind": "pdf", "product_id": product_id, "name": f"{product_name}.pdf"})
+
+        # Step 3: Keep our own copies — provider-hosted URLs expire
+        stored = self._store_assets(downloads)
+
+        # Update product records
+        for product_data in products:
             product = Product.query.get(product_data.get("id"))
-            if product:
-                assets = product.assets or {}
-                assets["cover_url"] = cover.get("url")
-                if pdf_url:
-                    assets["pdf_url"] = pdf_url
-                product.assets = assets
-                db.session.commit()
+            if not product:
+                continue
+            result = results[product.id]
+            assets = dict(product.assets or {})
+            assets["cover_url"] = result["cover"].get("url")
+            if result["pdf_url"]:
+                assets["pdf_url"] = result["pdf_url"]
+            for kind in ("cover", "pdf"):
+                asset = stored.get((product.id, kind))
+                if asset:
+                    # {kind}_url stays absolute: later phases hand it to Meta/Bannerbear
+                    assets[f"{kind}_source_url"] = assets[f"{kind}_url"]
+                    assets[f"{kind}_url"] = external_url(asset["sha256"], assets[f"{kind}_source_url"])
+                    assets[f"{kind}_sha256"] = asset["sha256"]
+            product.assets = assets
+            result["assets"] = assets
+        db.session.commit()
 
         return {
             "design_results": results,
@@ -58,6 +81,23 @@ class DesignerAgent(BaseAgent):
             "agent": self.agent_name,
         }
 
+    def _store_assets(self, downloads: list) -> dict:
+        """Download covers and PDFs into the asset store, keyed by (product_id, kind)."""
+        if not downloads or not self.pipeline_run_id:
+            return {}
+        try:
+            from app.services.asset_store import store_urls
+            assets = store_urls(downloads, self.pipeline_run_id)
+        except Exception as e:
+            self.logger.warning("asset_store.failed", error=str(e))
+            return {}
+
+        return {
+            (item["product_id"], item["kind"]): asset.to_dict()
+            for item, asset in zip(downloads, assets)
+            if asset
+        }
+
     def _generate_cover(self, product_name: str, niche: str, product_type: str) -> dict:
         """Generate a book/product cover using Ideogram."""
         try:
@@ -3,7 +3,7 @@ Generates all marketing copy (landing page, emails, checkout)
 and prepares funnel assets.
 """
 
-from app.agents.base import BaseAgent
+from app.agents.base import BaseAgent, Step
 from app import db
 from app.models.product import Product
 
@@ -33,27 +33,38 @@ class FunnelBuilderAgent(BaseAgent):
             if bonus:
                 bonuses_text += f"- {bonus.get('title', '')}: {bonus.get('content_outline', '')}\n"
 
-        # Step 1: Generate landing page copy
-        landing_page = self._generate_landing_page(
-            product_name, str(main_product), audience_profile,
-            pain_points, price, bonuses_text, learning_context,
-        )
-
-        # Step 2: Generate email sequence
-        email_sequence = self._generate_emails(
-            product_name, str(main_product), audience_profile,
-        )
-
-        # Step 3: Generate ad copy variations
-        ad_copy = self._generate_ad_copy(
-            product_name, str(main_product), audience_profile, pain_points,
-        )
-
-        # Step 4: Set up Stripe product (if key available)
-        stripe_result = self._setup_stripe(product_name, price, products)
-
-        # Step 5: Set up GHL workflow
-        ghl_result = self._setup_ghl_workflow(product_name, email_sequence)
+        # The three copy steps run in parallel. Stripe and GHL create external
+        # records, so they only start once all copy has succeeded — a failed
+        # (and retried) phase must not leave duplicates behind.
+        copy_steps = ("landing_page", "email_sequence", "ad_copy")
+        results = self.run_steps({
+            "landing_page": Step(
+                self._generate_landing_page,
+                product_name, str(main_product), audience_profile,
+                pain_points, price, bonuses_text, learning_context,
+            ),
+            "email_sequence": Step(
+                self._generate_emails,
+                product_name, str(main_product), audience_profile,
+            ),
+            "ad_copy": Step(
+                self._generate_ad_copy,
+                product_name, str(main_product), audience_profile, pain_points,
+            ),
+            "stripe": Step(
+                lambda **_: self._setup_stripe(product_name, price, products),
+                after=copy_steps,
+            ),
+            "ghl": Step(
+                lambda email_sequence, **_: self._setup_ghl_workflow(product_name, email_sequence),
+                after=copy_steps,
+            ),
+        })
+        landing_page = results["landing_page"]
+        email_sequence = results["email_sequence"]
+        ad_copy = results["ad_copy"]
+        stripe_result = results["stripe"]
+        ghl_result = results["ghl"]
 
         return {
             "landing_page_copy": landing_page,
@@ -109,6 +120,8 @@ class FunnelBuilderAgent(BaseAgent):
 
     def _setup_stripe(self, product_name: str, price: str, products: list) -> dict:
         """Create Stripe product and price."""
+        if self.dry_run:
+            return {"skipped": "dry run"}
         try:
             from app.integrations.stripe_client import create_product_with_price
 
@@ -132,6 +145,8 @@ class FunnelBuilderAgent(BaseAgent):
 
     def _setup_ghl_workflow(self, product_name: str, email_sequence: dict) -> dict:
         """Set up GoHighLevel workflow for email automation."""
+        if self.dry_run:
+            return {"skipped": "dry run"}
         try:
             from app.integrations.ghl_client import create_workflow
             return create_workflow(product_name, email_sequence)
@@ -2,7 +2,7 @@
 Validates demand using Meta Ad Library, Hotmart, and competitor analysis.
 """
 
-from app.agents.base import BaseAgent
+from app.agents.base import BaseAgent, Step
 
 
 class NicheValidatorAgent(BaseAgent):
@@ -14,14 +14,15 @@ class NicheValidatorAgent(BaseAgent):
         phase_1 = input_data.get("phase_1_output", {})
         trends = phase_1.get("analysis", {})
 
-        # Step 1: Check Meta Ad Library for active advertisers
-        competitor_ads = self._get_competitor_ads(niche)
-
-        # Step 2: Check Hotmart marketplace for existing products
-        marketplace_data = self._get_marketplace_data(niche)
-
-        # Step 3: Get keyword data for demand signals
-        keyword_data = self._get_keyword_data(niche)
+        # Steps 1-3: Meta Ad Library, Hotmart and keyword data, fetched concurrently
+        research = self.run_steps({
+            "competitor_ads": Step(self._get_competitor_ads, niche),
+            "marketplace_data": Step(self._get_marketplace_data, niche),
+            "keyword_data": Step(self._get_keyword_data, niche),
+        })
+        competitor_ads = research["competitor_ads"]
+        marketplace_data = research["marketplace_data"]
+        keyword_data = research["keyword_data"]
 
         # Step 4: LLM validates the niche
         validation = self._validate(niche, trends, competitor_ads, marketplace_data, keyword_data, learning_context)
@@ -75,5 +76,5 @@ class NicheValidatorAgent(BaseAgent):
         )
         prompt += learning_text
 
-        response = self.call_llm("openai", prompt, json_mode=True)
+        response = self.call_llm("openai", prompt, json_mode=True, template_key="validate_niche")
         return self.parse_json_response(response)
@@ -61,7 +61,7 @@ class ProductArchitectAgent(BaseAgent):
 
     def _create_product_records(self, pipeline_run_id: str, niche: str, blueprint: dict) -> list:
         """Create Product records in the database from the blueprint."""
-        if not pipeline_run_id:
+        if not pipeline_run_id or self.dry_run:
             return []
 
         products = []
@@ -34,7 +34,7 @@ class QAReviewerAgent(BaseAgent):
             "Return JSON: {\"score\": <1-100>, \"issues\": [{\"type\": \"...\", \"description\": \"...\"}], "
             "\"summary\": \"...\"}"
         )
-        response = self.call_llm("openai", prompt, json_mode=True)
+        response = self.call_llm("openai", prompt, json_mode=True, template_key="qa_review")
         return self.parse_json_response(response)
 
     def _review_marketing_copy(self, content: str) -> dict:
@@ -48,7 +48,7 @@ class QAReviewerAgent(BaseAgent):
             f"COPY:\n{content[:5000]}\n\n"
             "Return JSON: {\"score\": <1-100>, \"strengths\": [...], \"improvements\": [...], \"summary\": \"...\"}"
         )
-        response = self.call_llm("openai", prompt, json_mode=True)
+        response = self.call_llm("openai", prompt, json_mode=True, template_key="qa_review")
         return self.parse_json_response(response)
 
     def _review_brand_consistency(self, content: str, guidelines: dict) -> dict:
@@ -57,7 +57,7 @@ class QAReviewerAgent(BaseAgent):
             f"CONTENT:\n{content[:5000]}\n\n"
             "Return JSON: {\"consistent\": <bool>, \"issues\": [...], \"suggestions\": [...]}"
         )
-        response = self.call_llm("openai", prompt, json_mode=True)
+        response = self.call_llm("openai", prompt, json_mode=True, template_key="qa_review")
         return self.parse_json_response(response)
 
     def _general_review(self, content: str) -> dict:
@@ -65,5 +65,5 @@ class QAReviewerAgent(BaseAgent):
             f"Review this content for overall quality:\n{content[:5000]}\n\n"
             "Return JSON: {\"score\": <1-100>, \"feedback\": \"...\"}"
         )
-        response = self.call_llm("openai", prompt, json_mode=True)
+        response = self.call_llm("openai", prompt, json_mode=True, template_key="qa_review")
         return self.parse_json_response(response)
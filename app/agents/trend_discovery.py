@@ -3,7 +3,7 @@ Combines Google Trends, Reddit, and news signals to identify
 digital product opportunities.
 """
 
-from app.agents.base import BaseAgent
+from app.agents.base import BaseAgent, Step
 
 
 class TrendDiscoveryAgent(BaseAgent):
@@ -31,40 +31,54 @@ class TrendDiscoveryAgent(BaseAgent):
         }
 
     def _gather_signals(self, niche: str, region: str) -> dict:
-        """Collect trend data from all configured sources."""
-        signals = {}
+        """Collect trend data from all configured sources concurrently."""
+        return self.run_steps({
+            "google_trends": Step(self._get_google_trends, niche),
+            "related_searches": Step(self._get_related_searches, niche),
+            "people_also_ask": Step(self._get_people_also_ask, niche),
+            "reddit": Step(self._get_reddit_posts, niche),
+            "hotmart": Step(self._get_hotmart_products, niche),
+        })
 
-        # Google Trends via SerpAPI
+    def _get_google_trends(self, niche: str) -> dict:
         try:
-            from app.integrations.serpapi_client import (
-                get_google_trends,
-                get_related_searches,
-                get_people_also_ask,
-            )
-            signals["google_trends"] = get_google_trends(niche)
-            signals["related_searches"] = get_related_searches(niche)
-            signals["people_also_ask"] = get_people_also_ask(niche)
+            from app.integrations.serpapi_client import get_google_trends
+            return get_google_trends(niche)
         except Exception as e:
             self.logger.warning("serpapi.failed", error=str(e))
-            signals["google_trends"] = {"error": str(e)}
+            return {"error": str(e)}
 
-        # Reddit trending discussions
+    def _get_related_searches(self, niche: str) -> dict:
+        try:
+            from app.integrations.serpapi_client import get_related_searches
+            return get_related_searches(niche)
+        except Exception as e:
+            self.logger.warning("serpapi_related.failed", error=str(e))
+            return {"error": str(e)}
+
+    def _get_people_also_ask(self, niche: str) -> list | dict:
+        try:
+            from app.integrations.serpapi_client import get_people_also_ask
+            return get_people_also_ask(niche)
+        except Exception as e:
+            self.logger.warning("serpapi_paa.failed", error=str(e))
+            return {"error": str(e)}
+
+    def _get_reddit_posts(self, niche: str) -> list | dict:
         try:
             from app.integrations.reddit_client import get_trending_posts
-            signals["reddit"] = get_trending_posts(niche, limit=20)
+            return get_trending_posts(niche, limit=20)
         except Exception as e:
             self.logger.warning("reddit.failed", error=str(e))
-            signals["reddit"] = {"error": str(e)}
+            return {"error": str(e)}
 
-        # Hotmart marketplace (what's selling)
+    def _get_hotmart_products(self, niche: str) -> dict:
         try:
             from app.integrations.hotmart_client import search_marketplace
-            signals["hotmart"] = search_marketplace(niche)
+            return search_marketplace(niche)
         except Exception as e:
             self.logger.warning("hotmart.failed", error=str(e))
-            signals["hotmart"] = {"error": str(e)}
-
-        return signals
+            return {"error": str(e)}
 
     def _analyze_trends(self, niche, signals, category, region, timeframe, learning_context) -> dict:
         """Use LLM to analyze and score trend signals."""
@@ -83,5 +97,5 @@ class TrendDiscoveryAgent(BaseAgent):
         )
         prompt += learning_text
 
-        response = self.call_llm("openai", prompt, json_mode=True)
+        response = self.call_llm("openai", prompt, json_mode=True, template_key="analyze_trends")
         return self.parse_json_response(response)
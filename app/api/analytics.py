@@ -1,26 +1,31 @@
 """Analytics API — learning logs, ad performance, system stats."""
 
+from datetime import date
+
 from flask import Blueprint, request, jsonify
-from sqlalchemy import func
 
 from app import db
 from app.models.learning import LearningLog
 from app.models.ad_performance import AdPerformance
-from app.models.product import Product
-from app.models.pipeline_run import PipelineRun
 from app.models.phase_toggle import PhaseToggle
+from app.services import rollups, timeseries
+from app.utils.pagination import keyset_page
 
 analytics_bp = Blueprint("analytics", __name__)
 
 
 @analytics_bp.route("/learning", methods=["GET"])
 def learning_logs():
-    """Get learning logs with filters."""
+    """Get learning logs with filters, newest first.
+
+    Paginated by ?cursor= (the previous page's next_cursor); ?total=approx|exact
+    adds a total.
+    """
     niche = request.args.get("niche")
     phase = request.args.get("phase", type=int)
     feedback = request.args.get("feedback")
 
-    query = LearningLog.query.order_by(LearningLog.created_at.desc())
+    query = LearningLog.query
 
     if niche:
         query = query.filter(LearningLog.niche == niche)
@@ -29,89 +34,175 @@ def learning_logs():
     if feedback:
         query = query.filter(LearningLog.feedback == feedback)
 
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 50, type=int)
-    pagination = query.paginate(page=page, per_page=per_page)
+    try:
+        page = keyset_page(
+            query,
+            LearningLog.created_at,
+            LearningLog.id,
+            cursor=request.args.get("cursor"),
+            per_page=request.args.get("per_page", 50, type=int),
+            total=request.args.get("total"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     return jsonify({
-        "logs": [l.to_dict() for l in pagination.items],
-        "total": pagination.total,
-        "page": page,
+        "logs": [l.to_dict() for l in page["items"]],
+        "next_cursor": page["next_cursor"],
+        "total": page["total"],
     })
 
 
 @analytics_bp.route("/ads", methods=["GET"])
 def ad_performance():
-    """Get ad performance data."""
+    """Get ad performance data, most recent days first (cursor-paginated like /learning)."""
     product_id = request.args.get("product_id")
 
-    query = AdPerformance.query.order_by(AdPerformance.date.desc())
+    query = AdPerformance.query
 
     if product_id:
         query = query.filter(AdPerformance.product_id == product_id)
 
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 50, type=int)
-    pagination = query.paginate(page=page, per_page=per_page)
+    try:
+        page = keyset_page(
+            query,
+            AdPerformance.date,
+            AdPerformance.id,
+            cursor=request.args.get("cursor"),
+            per_page=request.args.get("per_page", 50, type=int),
+            total=request.args.get("total"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     return jsonify({
-        "performance": [p.to_dict() for p in pagination.items],
-        "total": pagination.total,
-        "page": page,
+        "performance": [p.to_dict() for p in page["items"]],
+        "next_cursor": page["next_cursor"],
+        "total": page["total"],
     })
 
 
+@analytics_bp.route("/timeseries", methods=["GET"])
+def timeseries_query():
+    """Metrics over day/week buckets, sliced by any dimensions, from the rollup tables.
+
+    e.g. ?source=ads&bucket=week&group_by=niche&metrics=roas,ctr
+         ?source=ads&group_by=creative_variant&niche=keto
+         ?source=learning&bucket=day&group_by=phase&metrics=approval_rate
+    """
+    source = request.args.get("source", "ads")
+    spec = timeseries.SOURCES.get(source, {})
+    try:
+        series = timeseries.query(
+            source=source,
+            bucket=request.args.get("bucket", "week"),
+            group_by=_list_arg("group_by"),
+            metrics=_list_arg("metrics"),
+            since=_date_arg("since"),
+            until=_date_arg("until"),
+            filters={
+                name: request.args[name]
+                for name in spec.get("dimensions", {})
+                if name in request.args
+            },
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"source": source, "series": series})
+
+
+def _list_arg(name: str) -> list:
+    return [item.strip() for item in request.args.get(name, "").split(",") if item.strip()]
+
+
+def _date_arg(name: str):
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+
+
 @analytics_bp.route("/dashboard", methods=["GET"])
 def dashboard_stats():
-    """Get dashboard summary statistics."""
-    total_pipelines = PipelineRun.query.count()
-    completed_pipelines = PipelineRun.query.filter_by(status="completed").count()
-    total_products = Product.query.count()
-    published_products = Product.query.filter_by(status="published").count()
-
-    # Top niches by product count
-    top_niches = db.session.query(
-        Product.niche, func.count(Product.id).label("count")
-    ).group_by(Product.niche).order_by(func.count(Product.id).desc()).limit(10).all()
-
-    # Approval rate by phase
-    approval_stats = db.session.query(
-        LearningLog.phase_number,
-        LearningLog.feedback,
-        func.count(LearningLog.id).label("count"),
-    ).group_by(LearningLog.phase_number, LearningLog.feedback).all()
-
-    # Total ad spend and revenue
-    ad_totals = db.session.query(
-        func.sum(AdPerformance.spend).label("total_spend"),
-        func.sum(AdPerformance.revenue).label("total_revenue"),
-        func.sum(AdPerformance.clicks).label("total_clicks"),
-        func.sum(AdPerformance.impressions).label("total_impressions"),
-    ).first()
+    """Get dashboard summary statistics (precomputed counters, see app.services.rollups)."""
+    counters = rollups.counters()
+    pipelines = counters.get("pipelines.status", {})
+    products = counters.get("products.status", {})
+    niches = counters.get("products.niche", {})
+    ads = counters.get("ads", {})
+
+    top_niches = sorted(
+        ((niche, int(count)) for niche, count in niches.items() if count > 0),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:10]
+
+    approval_stats = []
+    for key, count in sorted(counters.get("learning.feedback", {}).items()):
+        phase, _, feedback = key.partition(":")
+        if count > 0:
+            approval_stats.append({"phase": int(phase), "feedback": feedback or None, "count": int(count)})
 
     return jsonify({
         "pipelines": {
-            "total": total_pipelines,
-            "completed": completed_pipelines,
+            "total": int(sum(pipelines.values())),
+            "completed": int(pipelines.get("completed", 0)),
         },
         "products": {
-            "total": total_products,
-            "published": published_products,
+            "total": int(sum(products.values())),
+            "published": int(products.get("published", 0)),
         },
         "top_niches": [{"niche": n, "count": c} for n, c in top_niches],
-        "approval_stats": [
-            {"phase": p, "feedback": f, "count": c}
-            for p, f, c in approval_stats
-        ],
+        "approval_stats": approval_stats,
         "ad_totals": {
-            "spend": float(ad_totals.total_spend or 0),
-            "revenue": float(ad_totals.total_revenue or 0),
-            "clicks": int(ad_totals.total_clicks or 0),
-            "impressions": int(ad_totals.total_impressions or 0),
+            "spend": float(ads.get("spend", 0)),
+            "revenue": float(ads.get("revenue", 0)),
+            "clicks": int(ads.get("clicks", 0)),
+            "impressions": int(ads.get("impressions", 0)),
         },
     })
 
 
+@analytics_bp.route("/llm-cache", methods=["GET"])
+def llm_cache_stats():
+    """Get LLM response cache hit rates per prompt template."""
+    import redis
+    from app.utils.llm_cache import llm_cache
+
+    try:
+        return jsonify(llm_cache.stats())
+    except redis.RedisError as e:
+        return jsonify({"error": f"Cache unavailable: {e}"}), 503
+
+
+@analytics_bp.route("/research-cache", methods=["GET"])
+def research_cache_stats():
+    """Get research API cache hit rates per integration call."""
+    import redis
+    from app.utils.research_cache import research_cache
+
+    try:
+        return jsonify(research_cache.stats())
+    except redis.RedisError as e:
+        return jsonify({"error": f"Cache unavailable: {e}"}), 503
+
+
+@analytics_bp.route("/circuit-breakers", methods=["GET"])
+def circuit_breaker_states():
+    """Get the state of every provider circuit breaker that has seen failures."""
+    import redis
+    from app.utils.circuit_breaker import breaker_states
+
+    try:
+        return jsonify({"breakers": breaker_states()})
+    except redis.RedisError as e:
+        return jsonify({"error": f"Redis unavailable: {e}"}), 503
+
+
 @analytics_bp.route("/toggles", methods=["GET"])
 def get_toggles():
     """Get all phase toggle settings."""
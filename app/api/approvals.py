@@ -1,28 +1,56 @@
 """Approvals API — human-in-the-loop approval management."""
 
+from datetime import datetime, timezone
+
 from flask import Blueprint, request, jsonify
+from sqlalchemy import cast, func
 
+from app import db
 from app.models.approval import Approval
 from app.models.phase_result import PhaseResult
-from app.orchestrator.gates import resolve_approval
+from app.models.pipeline_run import PipelineRun
+from app.orchestrator.gates import resolve_approval, resolve_approvals
+from app.orchestrator.state import PHASE_NAMES
 
 approvals_bp = Blueprint("approvals", __name__)
 
 
 @approvals_bp.route("/pending", methods=["GET"])
 def list_pending():
-    """List all pending approvals."""
-    approvals = Approval.query.filter_by(status="pending").order_by(
-        Approval.created_at.desc()
-    ).all()
-
+    """List pending approvals as summaries — one query, no phase payloads.
+
+    The full output (whole books for Phase 5) is only loaded by GET /<approval_id>.
+    """
+    rows = db.session.query(
+        Approval.id,
+        Approval.pipeline_run_id,
+        Approval.phase_number,
+        Approval.created_at,
+        func.octet_length(cast(PhaseResult.output_data, db.Text)).label("output_size"),
+        PipelineRun.niche,
+        PipelineRun.topic,
+    ).join(
+        PhaseResult, PhaseResult.id == Approval.phase_result_id
+    ).join(
+        PipelineRun, PipelineRun.id == Approval.pipeline_run_id
+    ).filter(
+        Approval.status == "pending"
+    ).order_by(Approval.created_at.desc()).all()
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
     results = []
-    for a in approvals:
-        phase_result = PhaseResult.query.get(a.phase_result_id)
+    for row in rows:
+        created_at = row.created_at.replace(tzinfo=None) if row.created_at else None
         results.append({
-            **a.to_dict(),
-            "phase_output": phase_result.output_data if phase_result else None,
-            "phase_name": phase_result.agent_name if phase_result else None,
+            "id": row.id,
+            "pipeline_run_id": row.pipeline_run_id,
+            "phase_number": row.phase_number,
+            "phase_name": PHASE_NAMES[row.phase_number],
+            "niche": row.niche,
+            "topic": row.topic,
+            "output_size": row.output_size or 0,  # bytes of serialized output
+            "created_at": created_at.isoformat() if created_at else None,
+            "age_seconds": int((now - created_at).total_seconds()) if created_at else None,
         })
 
     return jsonify({"approvals": results})
@@ -35,7 +63,9 @@ def get_approval(approval_id):
     if not approval:
         return jsonify({"error": "Approval not found"}), 404
 
-    phase_result = PhaseResult.query.get(approval.phase_result_id)
+    phase_result = PhaseResult.query.options(
+        db.undefer_group("payload")
+    ).get(approval.phase_result_id)
 
     return jsonify({
         **approval.to_dict(),
@@ -45,6 +75,55 @@ def get_approval(approval_id):
     })
 
 
+MAX_BULK_RESOLVE = 100
+
+
+@approvals_bp.route("/resolve", methods=["POST"])
+def resolve_bulk():
+    """Resolve many approvals in one transaction.
+
+    Body: {"items": [{"approval_id", "decision", "notes", "edited_output"}, ...]}
+    or, for one decision across many gates, {"approval_ids": [...], "decision", "notes"}.
+    Returns a result per item; approved/edited pipelines resume as one Celery group.
+    """
+    data = request.get_json() or {}
+
+    items = data.get("items")
+    if items is None:
+        items = [
+            {"approval_id": approval_id, "decision": data.get("decision"), "notes": data.get("notes")}
+            for approval_id in data.get("approval_ids") or []
+        ]
+    if not items or not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return jsonify({"error": "items (a list of objects) or approval_ids is required"}), 400
+    if not all(isinstance(item.get("approval_id"), str) for item in items):
+        return jsonify({"error": "approval_id must be a string for every item"}), 400
+    if len(items) > MAX_BULK_RESOLVE:
+        return jsonify({"error": f"At most {MAX_BULK_RESOLVE} approvals per request"}), 400
+
+    results = resolve_approvals(items)
+
+    # One resume per pipeline, from the latest approved phase
+    resumes = {}
+    for result in results:
+        if result["ok"] and result["status"] in ("approved", "edited"):
+            pipeline_run_id = result["pipeline_run_id"]
+            resumes[pipeline_run_id] = max(result["phase_number"], resumes.get(pipeline_run_id, 0))
+    if resumes:
+        from celery import group
+        from worker.tasks import resume_after_approval
+        group(
+            resume_after_approval.s(pipeline_run_id, phase_number)
+            for pipeline_run_id, phase_number in resumes.items()
+        ).apply_async()
+
+    return jsonify({
+        "results": results,
+        "resolved": sum(1 for r in results if r["ok"]),
+        "failed": sum(1 for r in results if not r["ok"]),
+    })
+
+
 @approvals_bp.route("/<approval_id>/resolve", methods=["POST"])
 def resolve(approval_id):
     """Approve, reject, or edit a phase output."""
@@ -0,0 +1,76 @@
+"""Assets API — list a pipeline's stored files and serve them by content hash."""
+
+import os
+import re
+
+from flask import Blueprint, request, jsonify, send_file
+
+from app.models.asset import Asset
+from app.services.asset_store import THUMBNAIL_WIDTHS, list_assets, object_path, thumbnail_path
+
+assets_bp = Blueprint("assets", __name__)
+
+ONE_YEAR = 365 * 24 * 3600
+
+
+def _is_sha256(value: str) -> bool:
+    # Hashes become filesystem paths; only accept what the store writes
+    return re.fullmatch(r"[0-9a-f]{64}", value) is not None
+
+
+@assets_bp.route("/", methods=["GET"])
+def list_pipeline_assets():
+    """List assets for a pipeline (optionally one product or kind)."""
+    pipeline_id = request.args.get("pipeline_id")
+    if not pipeline_id:
+        return jsonify({"error": "pipeline_id is required"}), 400
+
+    assets = list_assets(
+        pipeline_id,
+        product_id=request.args.get("product_id"),
+        kind=request.args.get("kind"),
+    )
+    return jsonify({"assets": [a.to_dict() for a in assets]})
+
+
+@assets_bp.route("/<sha256>", methods=["GET"])
+def get_asset(sha256):
+    """Serve a stored file. Content never changes for a hash, so it is cached for good."""
+    path = object_path(sha256) if _is_sha256(sha256) else None
+    if not path or not os.path.exists(path):
+        return jsonify({"error": "Asset not found"}), 404
+
+    asset = Asset.query.filter_by(sha256=sha256).first()
+    mime_type = asset.mime_type if asset else None
+
+    response = send_file(
+        os.path.abspath(path),
+        mimetype=mime_type or "application/octet-stream",
+        etag=sha256,
+        max_age=ONE_YEAR,
+        conditional=True,
+    )
+    response.headers["Cache-Control"] = f"public, max-age={ONE_YEAR}, immutable"
+    return response
+
+
+@assets_bp.route("/<sha256>/thumbnail", methods=["GET"])
+def get_thumbnail(sha256):
+    """Serve a WebP thumbnail of a stored image (?w= one of THUMBNAIL_WIDTHS), cached for good."""
+    width = request.args.get("w", THUMBNAIL_WIDTHS[1], type=int)
+    if width not in THUMBNAIL_WIDTHS:
+        return jsonify({"error": f"w must be one of: {', '.join(map(str, THUMBNAIL_WIDTHS))}"}), 400
+
+    path = thumbnail_path(sha256, width) if _is_sha256(sha256) else None
+    if not path:
+        return jsonify({"error": "Thumbnail not found"}), 404
+
+    response = send_file(
+        os.path.abspath(path),
+        mimetype="image/webp",
+        etag=f"{sha256}-{width}",
+        max_age=ONE_YEAR,
+        conditional=True,
+    )
+    response.headers["Cache-Control"] = f"public, max-age={ONE_YEAR}, immutable"
+    return response
@@ -1,34 +1,57 @@
 """Pipeline API — create, list, start, and manage pipelines."""
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 
 from app import db
 from app.models.pipeline_run import PipelineRun
 from app.models.phase_result import PhaseResult
 from app.models.product import Product
 from app.orchestrator.engine import create_pipeline
+from app.services import events, rollups
+from app.utils.fieldsets import parse_include, parse_list, sparse
+from app.utils.pagination import keyset_page
 
 pipeline_bp = Blueprint("pipeline", __name__)
 
 
 @pipeline_bp.route("/", methods=["GET"])
 def list_pipelines():
-    """List all pipeline runs."""
+    """List pipeline runs, newest first.
+
+    Paginated by ?cursor= (the previous page's next_cursor); ?total=approx|exact
+    adds a total. `config` is only loaded with ?include=config; ?fields=
+    trims each entry.
+    """
+    try:
+        include = parse_include(PipelineRun.HEAVY_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    fields = parse_list("fields")
+
     status_filter = request.args.get("status")
-    query = PipelineRun.query.order_by(PipelineRun.created_at.desc())
+    query = PipelineRun.query
+    if "config" not in include:
+        query = query.options(db.defer(PipelineRun.config))
 
     if status_filter:
         query = query.filter_by(status=status_filter)
 
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 20, type=int)
-    pagination = query.paginate(page=page, per_page=per_page)
+    try:
+        page = keyset_page(
+            query,
+            PipelineRun.created_at,
+            PipelineRun.id,
+            cursor=request.args.get("cursor"),
+            per_page=request.args.get("per_page", 20, type=int),
+            total=request.args.get("total"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     return jsonify({
-        "pipelines": [p.to_dict() for p in pagination.items],
-        "total": pagination.total,
-        "page": page,
-        "pages": pagination.pages,
+        "pipelines": [sparse(p.to_dict(include=include), fields) for p in page["items"]],
+        "next_cursor": page["next_cursor"],
+        "total": page["total"],
     })
 
 
@@ -56,22 +79,73 @@ def create_new_pipeline():
 
 @pipeline_bp.route("/<pipeline_id>", methods=["GET"])
 def get_pipeline(pipeline_id):
-    """Get a pipeline with all phase results."""
-    pipeline = PipelineRun.query.get(pipeline_id)
+    """Get a pipeline with its phase results and products.
+
+    Heavy JSON (phase input/output, product assets/blueprint/content, config)
+    is only loaded when named in ?include=. ?fields= picks top-level keys;
+    leaving out "phases" or "products" skips their queries entirely.
+    """
+    try:
+        include = parse_include(
+            PipelineRun.HEAVY_FIELDS + PhaseResult.HEAVY_FIELDS + Product.HEAVY_FIELDS
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    fields = parse_list("fields")
+
+    query = PipelineRun.query
+    if "config" not in include:
+        query = query.options(db.defer(PipelineRun.config))
+    pipeline = query.get(pipeline_id)
     if not pipeline:
         return jsonify({"error": "Pipeline not found"}), 404
 
-    phases = PhaseResult.query.filter_by(
-        pipeline_run_id=pipeline_id
-    ).order_by(PhaseResult.phase_number).all()
+    result = pipeline.to_dict(include=include)
 
-    products = Product.query.filter_by(pipeline_run_id=pipeline_id).all()
+    if fields is None or "phases" in fields:
+        phases = PhaseResult.query.filter_by(
+            pipeline_run_id=pipeline_id
+        ).options(
+            *[db.undefer(getattr(PhaseResult, f)) for f in PhaseResult.HEAVY_FIELDS if f in include]
+        ).order_by(PhaseResult.phase_number).all()
+        result["phases"] = [p.to_dict(include=include) for p in phases]
 
-    return jsonify({
-        **pipeline.to_dict(),
-        "phases": [p.to_dict() for p in phases],
-        "products": [p.to_dict() for p in products],
-    })
+    if fields is None or "products" in fields:
+        options = [db.undefer(getattr(Product, f)) for f in ("blueprint", "content") if f in include]
+        if "assets" not in include:
+            options.append(db.defer(Product.assets))
+        products = Product.query.filter_by(pipeline_run_id=pipeline_id).options(*options).all()
+        result["products"] = [p.to_dict(include=include) for p in products]
+
+    return jsonify(sparse(result, fields))
+
+
+def _sse_response(stream: str, default_start: str) -> Response:
+    # EventSource sends Last-Event-ID on reconnect; the query param covers a fresh page load
+    last_id = events.resume_id(
+        request.headers.get("Last-Event-ID") or request.args.get("last_event_id"),
+        default_start,
+    )
+    return Response(
+        events.sse_stream(stream, last_id),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@pipeline_bp.route("/events", methods=["GET"])
+def stream_all_events():
+    """SSE stream of progress events from every pipeline, from now on."""
+    return _sse_response(events.GLOBAL_STREAM, "$")
+
+
+@pipeline_bp.route("/<pipeline_id>/events", methods=["GET"])
+def stream_pipeline_events(pipeline_id):
+    """SSE stream of one pipeline's progress events, replayed from the start."""
+    if not db.session.query(PipelineRun.query.filter_by(id=pipeline_id).exists()).scalar():
+        return jsonify({"error": "Pipeline not found"}), 404
+    db.session.remove()  # don't hold a DB connection for the life of the stream
+    return _sse_response(events.pipeline_stream(pipeline_id), "0")
 
 
 @pipeline_bp.route("/<pipeline_id>/start", methods=["POST"])
@@ -101,25 +175,22 @@ def stop_pipeline(pipeline_id):
     pipeline.status = "failed"
     pipeline.error_message = "Manually stopped by user"
     db.session.commit()
+    events.publish("pipeline_stopped", pipeline_id, phase=pipeline.current_phase)
 
     return jsonify({"message": "Pipeline stopped", "pipeline_id": pipeline_id})
 
 
 @pipeline_bp.route("/stats", methods=["GET"])
 def pipeline_stats():
-    """Get pipeline statistics for the dashboard."""
-    total = PipelineRun.query.count()
-    running = PipelineRun.query.filter_by(status="running").count()
-    paused = PipelineRun.query.filter_by(status="paused").count()
-    completed = PipelineRun.query.filter_by(status="completed").count()
-    failed = PipelineRun.query.filter_by(status="failed").count()
-    total_products = Product.query.count()
+    """Get pipeline statistics for the dashboard (precomputed counters)."""
+    counters = rollups.counters()
+    statuses = counters.get("pipelines.status", {})
 
     return jsonify({
-        "total_pipelines": total,
-        "running": running,
-        "paused": paused,
-        "completed": completed,
-        "failed": failed,
-        "total_products": total_products,
+        "total_pipelines": int(sum(statuses.values())),
+        "running": int(statuses.get("running", 0)),
+        "paused": int(statuses.get("paused", 0)),
+        "completed": int(statuses.get("completed", 0)),
+        "failed": int(statuses.get("failed", 0)),
+        "total_products": int(sum(counters.get("products.status", {}).values())),
     })
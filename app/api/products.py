@@ -0,0 +1,93 @@
+"""Products API — browse generated products across pipelines."""
+
+from datetime import date, datetime, timedelta
+
+from flask import Blueprint, request, jsonify
+
+from app import db
+from app.models.product import Product
+from app.utils.fieldsets import parse_include, parse_list, sparse
+from app.utils.pagination import keyset_page
+
+products_bp = Blueprint("products", __name__)
+
+FILTERS = ("niche", "status", "product_type", "pipeline_run_id")
+
+
+@products_bp.route("/", methods=["GET"])
+def list_products():
+    """List products, newest first.
+
+    Filter by ?niche=, ?status=, ?product_type=, ?pipeline_run_id= and
+    ?since= / ?until= (creation dates, inclusive). Paginated by ?cursor=
+    (the previous page's next_cursor); ?total=approx|exact adds a total.
+    Each entry carries a cover thumbnail_url; assets, blueprint and content
+    are only loaded with ?include=, and ?fields= trims each entry.
+    """
+    try:
+        include = parse_include(Product.HEAVY_FIELDS)
+        since = _date_arg("since")
+        until = _date_arg("until")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    fields = parse_list("fields")
+
+    query = Product.query.options(*_load_options(include))
+    for name in FILTERS:
+        value = request.args.get(name)
+        if value:
+            query = query.filter(getattr(Product, name) == value)
+    if since:
+        query = query.filter(Product.created_at >= datetime.combine(since, datetime.min.time()))
+    if until:
+        query = query.filter(Product.created_at < datetime.combine(until + timedelta(days=1), datetime.min.time()))
+
+    try:
+        page = keyset_page(
+            query,
+            Product.created_at,
+            Product.id,
+            cursor=request.args.get("cursor"),
+            per_page=request.args.get("per_page", 20, type=int),
+            total=request.args.get("total"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "products": [sparse(p.to_dict(include=include), fields) for p in page["items"]],
+        "next_cursor": page["next_cursor"],
+        "total": page["total"],
+    })
+
+
+@products_bp.route("/<product_id>", methods=["GET"])
+def get_product(product_id):
+    """Get a single product; ?include= adds assets, blueprint and/or content."""
+    try:
+        include = parse_include(Product.HEAVY_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    product = Product.query.options(*_load_options(include)).filter(Product.id == product_id).first()
+    if not product:
+        return jsonify({"error": "Product not found"}), 404
+    return jsonify(sparse(product.to_dict(include=include), parse_list("fields")))
+
+
+def _load_options(include: set) -> list:
+    """Load exactly the heavy columns asked for (blueprint/content are deferred on the model)."""
+    options = [db.undefer(getattr(Product, f)) for f in ("blueprint", "content") if f in include]
+    if "assets" not in include:
+        options.append(db.defer(Product.assets))
+    return options
+
+
+def _date_arg(name: str):
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
@@ -5,6 +5,7 @@ from flask import Blueprint, request, jsonify
 
 from app import db
 from app.models.prompt_template import PromptTemplate
+from app.models.prompt_test_run import PromptTestRun
 
 prompts_bp = Blueprint("prompts", __name__)
 
@@ -91,24 +92,85 @@ def create_prompt():
 
 @prompts_bp.route("/<prompt_id>/test", methods=["POST"])
 def test_prompt(prompt_id):
-    """Test a prompt with sample variables and return the AI response."""
+    """Queue a prompt test across versions x sample variable sets x providers.
+
+    Body: `variables` (one set) or `variable_sets` (a list), `versions` of this
+    template (default: this prompt's), `providers` (default: ["openai"]) and
+    `bypass_cache`. Poll GET /test-runs/<run_id> for the results.
+    """
     prompt = PromptTemplate.query.get(prompt_id)
     if not prompt:
         return jsonify({"error": "Prompt not found"}), 404
 
-    data = request.get_json()
-    variables = data.get("variables", {})
-
-    rendered = prompt.render(**variables)
+    data = request.get_json() or {}
+    variable_sets = data.get("variable_sets") or [data.get("variables", {})]
+    if not isinstance(variable_sets, list) or not all(isinstance(v, dict) for v in variable_sets):
+        return jsonify({"error": "variable_sets must be a list of objects"}), 400
+
+    from app.services.prompt_tests import create_run
+    try:
+        run = create_run(
+            prompt,
+            versions=data.get("versions"),
+            variable_sets=variable_sets,
+            providers=data.get("providers"),
+            bypass_cache=bool(data.get("bypass_cache")),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    from worker.tasks import run_prompt_test
+    run_prompt_test.delay(run.id)
+
+    return jsonify({"run_id": run.id, "status": run.status}), 202
+
+
+@prompts_bp.route("/<prompt_id>/replay", methods=["POST"])
+def replay_prompt(prompt_id):
+    """Queue an offline regression run of this prompt version on past phase inputs.
+
+    Body: `limit` (latest N completed phases of the prompt's agent),
+    `phase_result_ids` and `niche` to narrow the selection. The agent runs in
+    dry-run mode — no product, Stripe or GHL writes. Poll GET /test-runs/<run_id>.
+    """
+    prompt = PromptTemplate.query.get(prompt_id)
+    if not prompt:
+        return jsonify({"error": "Prompt not found"}), 404
 
-    # Call OpenAI to test
-    from app.integrations.openai_client import call_openai
-    response = call_openai(rendered, json_mode=False)
+    data = request.get_json(silent=True) or {}
+    try:
+        limit = int(data["limit"]) if data.get("limit") is not None else None
+    except (TypeError, ValueError):
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    from app.services.prompt_tests import create_replay
+    try:
+        run = create_replay(
+            prompt,
+            limit=limit,
+            phase_result_ids=data.get("phase_result_ids"),
+            niche=data.get("niche"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    from worker.tasks import run_prompt_test
+    run_prompt_test.delay(run.id)
 
     return jsonify({
-        "rendered_prompt": rendered,
-        "ai_response": response,
-    })
+        "run_id": run.id,
+        "status": run.status,
+        "inputs": len(run.config["phase_result_ids"]),
+    }), 202
+
+
+@prompts_bp.route("/test-runs/<run_id>", methods=["GET"])
+def get_test_run(run_id):
+    """Status and results of a prompt test run."""
+    run = PromptTestRun.query.get(run_id)
+    if not run:
+        return jsonify({"error": "Test run not found"}), 404
+    return jsonify(run.to_dict(include=("results",)))
 
 
 @prompts_bp.route("/<prompt_id>/history", methods=["GET"])
@@ -9,8 +9,12 @@ from app.api.pipeline import pipeline_bp
 from app.api.prompts import prompts_bp
 from app.api.approvals import approvals_bp
 from app.api.analytics import analytics_bp
+from app.api.assets import assets_bp
+from app.api.products import products_bp
 
 api_bp.register_blueprint(pipeline_bp, url_prefix="/pipelines")
 api_bp.register_blueprint(prompts_bp, url_prefix="/prompts")
 api_bp.register_blueprint(approvals_bp, url_prefix="/approvals")
 api_bp.register_blueprint(analytics_bp, url_prefix="/analytics")
+api_bp.register_blueprint(assets_bp, url_prefix="/assets")
+api_bp.register_blueprint(products_bp, url_prefix="/products")
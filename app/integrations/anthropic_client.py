@@ -2,18 +2,26 @@
 
 import json
 import anthropic
+from app.integrations.http import get_client, get_sdk_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.llm_cache import cached_llm
+from app.utils.llm_usage import record_usage
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
-_client = None
-
 
 def _get_client() -> anthropic.Anthropic:
-    global _client
-    if _client is None:
-        _client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-    return _client
+    return get_sdk_client(
+        "anthropic",
+        lambda: anthropic.Anthropic(
+            api_key=settings.ANTHROPIC_API_KEY, http_client=get_client("anthropic"), max_retries=0,
+        ),
+    )
 
 
+@cached_llm("anthropic")
+@circuit_breaker("anthropic")
+@adaptive_retry("anthropic")
 def call_anthropic(
     prompt: str,
     system_prompt: str = None,
@@ -22,7 +30,10 @@ def call_anthropic(
     max_tokens: int = 8192,
     temperature: float = 0.7,
 ) -> str | dict:
-    """Call Anthropic Claude API."""
+    """Call Anthropic Claude API.
+
+    Pass `cache_template` to opt into the response cache (see app.utils.llm_cache).
+    """
     client = _get_client()
 
     kwargs = {
@@ -36,6 +47,7 @@ def call_anthropic(
         kwargs["system"] = system_prompt
 
     response = client.messages.create(**kwargs)
+    record_usage(model, response.usage.input_tokens, response.usage.output_tokens)
     content = response.content[0].text
 
     if json_mode:
@@ -1,7 +1,9 @@
 """Bannerbear API integration — branded template-based image generation."""
 
 import time
-import httpx
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://api.bannerbear.com/v2"
@@ -11,6 +13,8 @@ def _headers() -> dict:
     return {"Authorization": f"Bearer {settings.BANNERBEAR_API_KEY}"}
 
 
+@circuit_breaker("bannerbear")
+@adaptive_retry("bannerbear", idempotent=False)
 def generate_image(template_id: str, modifications: dict, timeout_seconds: int = 60) -> dict:
     """Generate an image using a Bannerbear template.
 
@@ -33,7 +37,7 @@ def generate_image(template_id: str, modifications: dict, timeout_seconds: int =
             mods.append({"name": layer_name, "text": str(value)})
 
     # Create the image
-    response = httpx.post(
+    response = get_client("bannerbear").post(
         f"{BASE_URL}/images",
         headers=_headers(),
         json={
@@ -52,7 +56,7 @@ def generate_image(template_id: str, modifications: dict, timeout_seconds: int =
 
     elapsed = 0
     while elapsed < timeout_seconds:
-        check = httpx.get(f"{BASE_URL}/images/{image_uid}", headers=_headers(), timeout=15)
+        check = get_client("bannerbear").get(f"{BASE_URL}/images/{image_uid}", headers=_headers(), timeout=15)
         check.raise_for_status()
         result = check.json()
 
@@ -71,8 +75,10 @@ def generate_image(template_id: str, modifications: dict, timeout_seconds: int =
     return {"uid": image_uid, "status": "timeout"}
 
 
+@circuit_breaker("bannerbear")
+@adaptive_retry("bannerbear")
 def list_templates() -> list:
     """List all available Bannerbear templates."""
-    response = httpx.get(f"{BASE_URL}/templates", headers=_headers(), timeout=15)
+    response = get_client("bannerbear").get(f"{BASE_URL}/templates", headers=_headers(), timeout=15)
     response.raise_for_status()
     return response.json()
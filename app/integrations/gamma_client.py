@@ -1,6 +1,8 @@
 """Gamma API integration — document/ebook formatting and PDF generation."""
 
-import httpx
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://api.gamma.app/v1"
@@ -24,22 +26,12 @@ def create_document(
         }
 
     try:
-        response = httpx.post(
-            f"{BASE_URL}/generate",
-            headers={
-                "Authorization": f"Bearer {settings.GAMMA_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "title": title,
-                "content": content,
-                "format": output_format,
-                "theme": theme,
-            },
-            timeout=120,
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = _generate({
+            "title": title,
+            "content": content,
+            "format": output_format,
+            "theme": theme,
+        })
 
         return {
             "url": data.get("url"),
@@ -48,3 +40,19 @@ def create_document(
         }
     except Exception as e:
         return {"error": str(e), "status": "failed"}
+
+
+@circuit_breaker("gamma")
+@adaptive_retry("gamma", idempotent=False)
+def _generate(payload: dict) -> dict:
+    response = get_client("gamma").post(
+        f"{BASE_URL}/generate",
+        headers={
+            "Authorization": f"Bearer {settings.GAMMA_API_KEY}",
+            "Content-Type": "application/json",
+        },
+        json=payload,
+        timeout=120,
+    )
+    response.raise_for_status()
+    return response.json()
@@ -1,6 +1,8 @@
 """GoHighLevel API integration — CRM, workflows, email automation."""
 
-import httpx
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://services.leadconnectorhq.com"
@@ -14,6 +16,22 @@ def _headers() -> dict:
     }
 
 
+@circuit_breaker("ghl")
+@adaptive_retry("ghl", idempotent=False)
+def _post(path: str, payload: dict) -> dict:
+    response = get_client("ghl").post(f"{BASE_URL}/{path}", headers=_headers(), json=payload, timeout=15)
+    response.raise_for_status()
+    return response.json()
+
+
+@circuit_breaker("ghl")
+@adaptive_retry("ghl")
+def _get(path: str, params: dict) -> dict:
+    response = get_client("ghl").get(f"{BASE_URL}/{path}", headers=_headers(), params=params, timeout=15)
+    response.raise_for_status()
+    return response.json()
+
+
 def create_contact(email: str, name: str, tags: list = None) -> dict:
     """Create a contact in GoHighLevel."""
     payload = {
@@ -24,26 +42,12 @@ def create_contact(email: str, name: str, tags: list = None) -> dict:
     if tags:
         payload["tags"] = tags
 
-    response = httpx.post(
-        f"{BASE_URL}/contacts/",
-        headers=_headers(),
-        json=payload,
-        timeout=15,
-    )
-    response.raise_for_status()
-    return response.json()
+    return _post("contacts/", payload)
 
 
 def add_tag(contact_id: str, tags: list) -> dict:
     """Add tags to a contact."""
-    response = httpx.post(
-        f"{BASE_URL}/contacts/{contact_id}/tags",
-        headers=_headers(),
-        json={"tags": tags},
-        timeout=15,
-    )
-    response.raise_for_status()
-    return response.json()
+    return _post(f"contacts/{contact_id}/tags", {"tags": tags})
 
 
 def create_workflow(product_name: str, email_sequence: dict) -> dict:
@@ -55,24 +59,18 @@ def create_workflow(product_name: str, email_sequence: dict) -> dict:
     """
     try:
         # Create a pipeline for tracking
-        pipeline_response = httpx.post(
-            f"{BASE_URL}/opportunities/pipelines",
-            headers=_headers(),
-            json={
-                "name": f"ZEULE - {product_name}",
-                "locationId": settings.GHL_LOCATION_ID,
-                "stages": [
-                    {"name": "Lead", "position": 0},
-                    {"name": "Customer", "position": 1},
-                    {"name": "Upsell", "position": 2},
-                ],
-            },
-            timeout=15,
-        )
-        pipeline_response.raise_for_status()
+        pipeline = _post("opportunities/pipelines", {
+            "name": f"ZEULE - {product_name}",
+            "locationId": settings.GHL_LOCATION_ID,
+            "stages": [
+                {"name": "Lead", "position": 0},
+                {"name": "Customer", "position": 1},
+                {"name": "Upsell", "position": 2},
+            ],
+        })
 
         return {
-            "pipeline": pipeline_response.json(),
+            "pipeline": pipeline,
             "status": "created",
             "note": "Email workflow steps should be configured in GHL dashboard using the generated copy.",
         }
@@ -83,13 +81,6 @@ def create_workflow(product_name: str, email_sequence: dict) -> dict:
 def list_funnels() -> dict:
     """List existing funnels in GHL."""
     try:
-        response = httpx.get(
-            f"{BASE_URL}/funnels/",
-            headers=_headers(),
-            params={"locationId": settings.GHL_LOCATION_ID},
-            timeout=15,
-        )
-        response.raise_for_status()
-        return response.json()
+        return _get("funnels/", {"locationId": settings.GHL_LOCATION_ID})
     except Exception as e:
         return {"error": str(e)}
@@ -1,34 +1,47 @@
 """Hotmart API integration — marketplace search and product validation."""
 
-import httpx
+import threading
+import time
+
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.research_cache import cached_research
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://developers.hotmart.com/payments/api/v1"
 AUTH_URL = "https://api-sec-vlc.hotmart.com/security/oauth/token"
+TOKEN_REFRESH_MARGIN = 60  # seconds before expiry to fetch a new token
 
 _token = None
+_token_expires_at = 0.0
+_token_lock = threading.Lock()
 
 
 def _get_token() -> str:
-    """Get OAuth token for Hotmart API."""
-    global _token
-    if _token:
-        return _token
+    """Get OAuth token for Hotmart API (one fetch at a time, renewed before expiry)."""
+    global _token, _token_expires_at
+    with _token_lock:
+        if _token and time.time() < _token_expires_at - TOKEN_REFRESH_MARGIN:
+            return _token
 
-    response = httpx.post(
-        AUTH_URL,
-        data={
-            "grant_type": "client_credentials",
-            "client_id": settings.HOTMART_CLIENT_ID,
-            "client_secret": settings.HOTMART_CLIENT_SECRET,
-        },
-        timeout=15,
-    )
-    response.raise_for_status()
-    _token = response.json().get("access_token")
-    return _token
+        response = get_client("hotmart").post(
+            AUTH_URL,
+            data={
+                "grant_type": "client_credentials",
+                "client_id": settings.HOTMART_CLIENT_ID,
+                "client_secret": settings.HOTMART_CLIENT_SECRET,
+            },
+            timeout=15,
+        )
+        response.raise_for_status()
+        data = response.json()
+        _token = data.get("access_token")
+        _token_expires_at = time.time() + int(data.get("expires_in", 3600))
+        return _token
 
 
+@cached_research("hotmart")
 def search_marketplace(query: str, max_results: int = 20) -> dict:
     """Search Hotmart marketplace for existing products in a niche.
 
@@ -36,18 +49,7 @@ def search_marketplace(query: str, max_results: int = 20) -> dict:
     marketplace search when available, with fallback to web data.
     """
     try:
-        token = _get_token()
-        headers = {"Authorization": f"Bearer {token}"}
-
-        # Hotmart affiliate API for marketplace search
-        response = httpx.get(
-            f"{BASE_URL}/products",
-            headers=headers,
-            params={"product_name": query, "max_results": max_results},
-            timeout=30,
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = _get_products(query, max_results)
 
         products = []
         for item in data.get("items", []):
@@ -62,3 +64,17 @@ def search_marketplace(query: str, max_results: int = 20) -> dict:
 
     except Exception as e:
         return {"products": [], "total": 0, "query": query, "error": str(e)}
+
+
+@circuit_breaker("hotmart")
+@adaptive_retry("hotmart")
+def _get_products(query: str, max_results: int) -> dict:
+    """Hotmart affiliate API marketplace search."""
+    response = get_client("hotmart").get(
+        f"{BASE_URL}/products",
+        headers={"Authorization": f"Bearer {_get_token()}"},
+        params={"product_name": query, "max_results": max_results},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()
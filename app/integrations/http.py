@@ -0,0 +1,88 @@
+"""Shared HTTP clients — one long-lived, pooled client per provider.
+
+Integrations call `get_client("<provider>")` instead of module-level
+`httpx.get`/`httpx.post`, so connections (and their TLS sessions) are reused
+across calls and threads. HTTP/2 is used when the `h2` package is installed.
+SDK clients (OpenAI, Anthropic, Reddit) are kept in the same registry via
+`get_sdk_client`. Everything is dropped in a forked child (Celery prefork,
+gunicorn) so no pool is ever shared between processes.
+"""
+
+import importlib.util
+import os
+import threading
+
+import httpx
+
+from config.settings import settings
+
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+_clients = {}
+_async_clients = {}
+_sdk_clients = {}
+_lock = threading.RLock()
+
+
+def _client_options(provider: str) -> dict:
+    max_connections = settings.HTTP_MAX_CONNECTIONS.get(provider, settings.HTTP_DEFAULT_MAX_CONNECTIONS)
+    return {
+        "http2": HTTP2,
+        "timeout": httpx.Timeout(
+            settings.HTTP_TIMEOUTS.get(provider, settings.HTTP_TIMEOUT), connect=settings.HTTP_CONNECT_TIMEOUT,
+        ),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "follow_redirects": True,
+    }
+
+
+def get_client(provider: str) -> httpx.Client:
+    """Get the provider's shared client (thread-safe)."""
+    with _lock:
+        client = _clients.get(provider)
+        if client is None:
+            client = _clients[provider] = httpx.Client(**_client_options(provider))
+        return client
+
+
+def get_async_client(provider: str) -> httpx.AsyncClient:
+    """Get the provider's shared async client. Use it from a single event loop."""
+    with _lock:
+        client = _async_clients.get(provider)
+        if client is None:
+            client = _async_clients[provider] = httpx.AsyncClient(**_client_options(provider))
+        return client
+
+
+def get_sdk_client(name: str, factory):
+    """Get a shared third-party SDK client, creating it with `factory()` on first use."""
+    with _lock:
+        client = _sdk_clients.get(name)
+        if client is None:
+            client = _sdk_clients[name] = factory()
+        return client
+
+
+def close_clients():
+    """Close every pooled sync client (e.g. on worker shutdown)."""
+    with _lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+        _sdk_clients.clear()
+
+
+def _reset_after_fork():
+    # The parent's sockets and locks are not ours to use; start from scratch.
+    global _lock
+    _lock = threading.RLock()
+    _clients.clear()
+    _async_clients.clear()
+    _sdk_clients.clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,11 +1,15 @@
 """Ideogram API integration — AI image generation for covers and ad creatives."""
 
-import httpx
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://api.ideogram.ai"
 
 
+@circuit_breaker("ideogram")
+@adaptive_retry("ideogram", idempotent=False)
 def generate_image(
     prompt: str,
     aspect_ratio: str = "1:1",
@@ -14,7 +18,7 @@ def generate_image(
     model: str = "V_2",
 ) -> dict:
     """Generate an image using Ideogram API."""
-    response = httpx.post(
+    response = get_client("ideogram").post(
         f"{BASE_URL}/generate",
         headers={
             "Api-Key": settings.IDEOGRAM_API_KEY,
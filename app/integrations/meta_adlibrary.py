@@ -1,11 +1,17 @@
 """Meta Ad Library API — competitor ad intelligence."""
 
-import httpx
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.research_cache import cached_research
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://graph.facebook.com/v21.0/ads_archive"
 
 
+@cached_research("meta_adlibrary")
+@circuit_breaker("meta")
+@adaptive_retry("meta")
 def search_ads(
     query: str,
     limit: int = 20,
@@ -23,7 +29,7 @@ def search_ads(
         "access_token": settings.META_AD_LIBRARY_ACCESS_TOKEN,
     }
 
-    response = httpx.get(BASE_URL, params=params, timeout=30)
+    response = get_client("meta").get(BASE_URL, params=params, timeout=30)
     response.raise_for_status()
     data = response.json()
 
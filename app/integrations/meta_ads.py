@@ -1,15 +1,50 @@
 """Meta Marketing API — campaign creation and management."""
 
-import httpx
+import json
+import re
+from urllib.parse import urlencode
+
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://graph.facebook.com/v21.0"
+BATCH_LIMIT = 50  # operations per Graph API batch request
+AD_NAME_VARIATION = re.compile(r" - Ad (\d+)$")
+
+
+def ad_name(name: str, variation: int) -> str:
+    """Ads are named after their ad copy variation, so insights map back to it."""
+    return f"{name} - Ad {variation}"
+
+
+def ad_variation(name: str) -> int | None:
+    """The ad copy variation (1-based) encoded in an ad's name by ad_name()."""
+    match = AD_NAME_VARIATION.search(name or "")
+    return int(match.group(1)) if match else None
 
 
 def _headers() -> dict:
     return {"Authorization": f"Bearer {settings.META_ADS_ACCESS_TOKEN}"}
 
 
+@circuit_breaker("meta")
+@adaptive_retry("meta", idempotent=False)
+def _post(path: str, payload: dict) -> dict:
+    response = get_client("meta").post(f"{BASE_URL}/{path}", headers=_headers(), json=payload, timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+
+@circuit_breaker("meta")
+@adaptive_retry("meta")
+def _get(path: str, params: dict) -> dict:
+    response = get_client("meta").get(f"{BASE_URL}/{path}", headers=_headers(), params=params, timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+
 def create_campaign(
     name: str,
     objective: str = "OUTCOME_SALES",
@@ -17,128 +52,211 @@ def create_campaign(
     ad_copy: dict = None,
     creatives: list = None,
     daily_budget: int = 1000,
+    idempotency_key: str = None,
 ) -> dict:
-    """Create a full Meta Ads campaign (campaign + ad set + ads)."""
+    """Create a full Meta Ads campaign (campaign + ad set + ads).
+
+    Everything still missing is created in a single Graph API batch request,
+    later operations referencing the ids of earlier ones. With an
+    `idempotency_key` (e.g. the pipeline run id) the campaign is named after
+    it and existing objects are looked up first, so a retried launch fills in
+    whatever is missing instead of creating a duplicate campaign.
+    """
     account_id = settings.META_ADS_ACCOUNT_ID
+    campaign_name = f"{name} [{idempotency_key}]" if idempotency_key else name
+    ad_set_name = f"{name} - Ad Set"
+
+    campaign_id = ad_set_id = None
+    existing_ads = {}
+    if idempotency_key:
+        campaign_id = _find_by_name(f"act_{account_id}/campaigns", campaign_name)
+        if campaign_id:
+            ad_set_id = _find_by_name(f"{campaign_id}/adsets", ad_set_name)
+        if ad_set_id:
+            existing_ads = {
+                ad["name"]: ad
+                for ad in _get(f"{ad_set_id}/ads", {"fields": "id,name,creative", "limit": 100}).get("data", [])
+            }
 
-    # Step 1: Create campaign
-    campaign_response = httpx.post(
-        f"{BASE_URL}/act_{account_id}/campaigns",
-        headers=_headers(),
-        json={
-            "name": name,
+    operations = []
+    if not campaign_id:
+        operations.append(_operation("campaign", f"act_{account_id}/campaigns", {
+            "name": campaign_name,
             "objective": objective,
             "status": "PAUSED",  # always start paused for safety
             "special_ad_categories": [],
-        },
-        timeout=30,
-    )
-    campaign_response.raise_for_status()
-    campaign_id = campaign_response.json().get("id")
-
-    # Step 2: Create ad set
-    ad_set_payload = {
-        "name": f"{name} - Ad Set",
-        "campaign_id": campaign_id,
-        "daily_budget": daily_budget,
-        "billing_event": "IMPRESSIONS",
-        "optimization_goal": "OFFSITE_CONVERSIONS",
-        "status": "PAUSED",
-        "targeting": targeting or {"geo_locations": {"countries": ["US"]}},
-    }
+        }))
+    if not ad_set_id:
+        operations.append(_operation("ad_set", f"act_{account_id}/adsets", {
+            "name": ad_set_name,
+            "campaign_id": campaign_id or "{result=campaign:$.id}",
+            "daily_budget": daily_budget,
+            "billing_event": "IMPRESSIONS",
+            "optimization_goal": "OFFSITE_CONVERSIONS",
+            "status": "PAUSED",
+            "targeting": targeting or {"geo_locations": {"countries": ["US"]}},
+        }))
 
-    ad_set_response = httpx.post(
-        f"{BASE_URL}/act_{account_id}/adsets",
-        headers=_headers(),
-        json=ad_set_payload,
-        timeout=30,
-    )
-    ad_set_response.raise_for_status()
-    ad_set_id = ad_set_response.json().get("id")
-
-    # Step 3: Create ads with creatives
-    ads_created = []
+    # Creative + ad per ad copy variation, each ad referencing its creative. A
+    # creative's `variation` (1-based) picks its copy and is kept in the ad name,
+    # so performance synced back later maps to the right variation.
+    ads_created, numbers = [], []
     if creatives and ad_copy:
         variations = ad_copy if isinstance(ad_copy, list) else ad_copy.get("variations", [])
-        for i, creative in enumerate(creatives[:4]):
-            variation = variations[i] if i < len(variations) else {}
-            try:
-                ad = _create_ad(
-                    account_id=account_id,
-                    ad_set_id=ad_set_id,
-                    name=f"{name} - Ad {i+1}",
-                    image_url=creative.get("url"),
-                    primary_text=variation.get("primary_text", ""),
-                    headline=variation.get("headline", ""),
-                    description=variation.get("description", ""),
-                )
-                ads_created.append(ad)
-            except Exception as e:
-                ads_created.append({"error": str(e), "variation": i + 1})
+        by_variation = {}
+        for i, creative in enumerate(creatives):
+            by_variation.setdefault(creative.get("variation") or i + 1, creative)
+        numbers = sorted(by_variation)[:4]
+        ads_created = [None] * len(numbers)
+        for i, number in enumerate(numbers):
+            creative = by_variation[number]
+            name_of_ad = ad_name(name, number)
+            if name_of_ad in existing_ads:
+                ad = existing_ads[name_of_ad]
+                ads_created[i] = {
+                    "ad_id": ad["id"],
+                    "creative_id": (ad.get("creative") or {}).get("id"),
+                    "status": "PAUSED",
+                    "variation": number,
+                }
+                continue
+            if not creative.get("url"):
+                ads_created[i] = {"error": creative.get("error") or "No creative image", "variation": number}
+                continue
+
+            variation = variations[number - 1] if number <= len(variations) else {}
+            operations.append(_operation(f"creative_{i}", f"act_{account_id}/adcreatives", {
+                "name": f"{name_of_ad} Creative",
+                "object_story_spec": {
+                    "link_data": {
+                        "message": variation.get("primary_text", ""),
+                        "name": variation.get("headline", ""),
+                        "description": variation.get("description", ""),
+                        "image_url": creative.get("url"),
+                        "call_to_action": {"type": "LEARN_MORE"},
+                    },
+                },
+            }))
+            operations.append(_operation(f"ad_{i}", f"act_{account_id}/ads", {
+                "name": name_of_ad,
+                "adset_id": ad_set_id or "{result=ad_set:$.id}",
+                "creative": {"creative_id": f"{{result=creative_{i}:$.id}}"},
+                "status": "PAUSED",
+            }))
+
+    reused_existing = campaign_id is not None
+    results = _batch(operations) if operations else {}
+
+    campaign_id = campaign_id or _result_id(results, "campaign")
+    ad_set_id = ad_set_id or _result_id(results, "ad_set")
+    for i, ad in enumerate(ads_created):
+        if ad is not None:
+            continue
+        creative_result, ad_result = results.get(f"creative_{i}", {}), results.get(f"ad_{i}", {})
+        error = creative_result.get("error") or ad_result.get("error")
+        ads_created[i] = {"error": error, "variation": numbers[i]} if error else {
+            "ad_id": ad_result.get("id"),
+            "creative_id": creative_result.get("id"),
+            "status": "PAUSED",
+            "variation": numbers[i],
+        }
 
     return {
         "campaign_id": campaign_id,
         "ad_set_id": ad_set_id,
         "ads": ads_created,
         "status": "PAUSED",
+        "reused_existing": reused_existing,
         "note": "Campaign created in PAUSED state. Review and activate manually.",
     }
 
 
-def _create_ad(account_id, ad_set_id, name, image_url, primary_text, headline, description) -> dict:
-    """Create a single ad within an ad set."""
-    # First create the ad creative
-    creative_response = httpx.post(
-        f"{BASE_URL}/act_{account_id}/adcreatives",
-        headers=_headers(),
-        json={
-            "name": f"{name} Creative",
-            "object_story_spec": {
-                "link_data": {
-                    "message": primary_text,
-                    "name": headline,
-                    "description": description,
-                    "image_url": image_url,
-                    "call_to_action": {"type": "LEARN_MORE"},
-                },
-            },
-        },
-        timeout=30,
-    )
-    creative_response.raise_for_status()
-    creative_id = creative_response.json().get("id")
-
-    # Then create the ad
-    ad_response = httpx.post(
-        f"{BASE_URL}/act_{account_id}/ads",
-        headers=_headers(),
-        json={
-            "name": name,
-            "adset_id": ad_set_id,
-            "creative": {"creative_id": creative_id},
-            "status": "PAUSED",
-        },
-        timeout=30,
-    )
-    ad_response.raise_for_status()
-
+def _operation(name: str, relative_url: str, params: dict) -> dict:
+    """A POST operation for a Graph API batch request."""
+    body = {k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in params.items()}
     return {
-        "ad_id": ad_response.json().get("id"),
-        "creative_id": creative_id,
-        "status": "PAUSED",
+        "method": "POST",
+        "name": name,
+        "relative_url": relative_url,
+        "body": urlencode(body),
+        "omit_response_on_success": False,  # we need every created id
     }
 
 
+def _batch(operations: list) -> dict:
+    """Run operations in one batch request; returns each one's body (or error) by name."""
+    if len(operations) > BATCH_LIMIT:
+        raise ValueError(f"Graph API batches are limited to {BATCH_LIMIT} operations")
+
+    responses = _post("", {"batch": operations, "include_headers": False})
+
+    results = {}
+    for operation, response in zip(operations, responses):
+        if response is None:
+            # Not executed — an operation it depends on failed
+            results[operation["name"]] = {"error": "Skipped: a dependency in the batch failed"}
+            continue
+        try:
+            body = json.loads(response.get("body") or "{}")
+        except ValueError:
+            body = {}
+        if response.get("code", 500) >= 400:
+            error = body.get("error", {})
+            results[operation["name"]] = {"error": error.get("message") or f"HTTP {response.get('code')}"}
+        else:
+            results[operation["name"]] = body
+    return results
+
+
+def _result_id(results: dict, name: str) -> str | None:
+    result = results.get(name, {})
+    if result.get("error"):
+        raise RuntimeError(f"Meta {name} creation failed: {result['error']}")
+    return result.get("id")
+
+
+def _find_by_name(edge: str, name: str) -> str | None:
+    """Id of the object on `edge` with exactly this name, if any."""
+    data = _get(edge, {
+        "fields": "id,name",
+        "filtering": json.dumps([{"field": "name", "operator": "EQUAL", "value": name}]),
+    }).get("data", [])
+    return data[0]["id"] if data else None
+
+
 def get_campaign_insights(campaign_id: str, date_range: str = "last_7d") -> dict:
     """Get performance insights for a campaign."""
-    response = httpx.get(
-        f"{BASE_URL}/{campaign_id}/insights",
-        headers=_headers(),
-        params={
-            "fields": "impressions,clicks,ctr,cpc,conversions,spend,actions",
-            "date_preset": date_range,
-        },
-        timeout=30,
-    )
-    response.raise_for_status()
-    return response.json()
+    return _get(f"{campaign_id}/insights", {
+        "fields": "impressions,clicks,ctr,cpc,conversions,spend,actions",
+        "date_preset": date_range,
+    })
+
+
+INSIGHTS_FIELDS = "campaign_id,adset_id,ad_id,ad_name,impressions,clicks,ctr,cpc,spend,actions,action_values"
+
+
+def get_account_insights(since: str, until: str, page_size: int = 500) -> list:
+    """Get per-ad, per-day insights for the whole ad account.
+
+    Args:
+        since, until: Inclusive date range, YYYY-MM-DD.
+        page_size: Rows per page; all pages are fetched.
+    """
+    account_id = settings.META_ADS_ACCOUNT_ID
+    params = {
+        "level": "ad",
+        "time_increment": 1,
+        "time_range": json.dumps({"since": since, "until": until}),
+        "fields": INSIGHTS_FIELDS,
+        "limit": page_size,
+    }
+
+    rows = []
+    while True:
+        page = _get(f"act_{account_id}/insights", params)
+        rows.extend(page.get("data", []))
+        paging = page.get("paging", {})
+        if not paging.get("next"):
+            return rows
+        params = {**params, "after": paging["cursors"]["after"]}
+
@@ -2,18 +2,24 @@
 
 import json
 from openai import OpenAI
+from app.integrations.http import get_client, get_sdk_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.llm_cache import cached_llm
+from app.utils.llm_usage import record_usage
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
-_client = None
-
 
 def _get_client() -> OpenAI:
-    global _client
-    if _client is None:
-        _client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    return _client
+    return get_sdk_client(
+        "openai",
+        lambda: OpenAI(api_key=settings.OPENAI_API_KEY, http_client=get_client("openai"), max_retries=0),
+    )
 
 
+@cached_llm("openai")
+@circuit_breaker("openai")
+@adaptive_retry("openai")
 def call_openai(
     prompt: str,
     system_prompt: str = None,
@@ -22,7 +28,10 @@ def call_openai(
     max_tokens: int = 4096,
     temperature: float = 0.7,
 ) -> str | dict:
-    """Call OpenAI API with a prompt."""
+    """Call OpenAI API with a prompt.
+
+    Pass `cache_template` to opt into the response cache (see app.utils.llm_cache).
+    """
     client = _get_client()
 
     messages = []
@@ -41,6 +50,8 @@ def call_openai(
         kwargs["response_format"] = {"type": "json_object"}
 
     response = client.chat.completions.create(**kwargs)
+    if response.usage:
+        record_usage(model, response.usage.prompt_tokens, response.usage.completion_tokens)
     content = response.choices[0].message.content
 
     if json_mode:
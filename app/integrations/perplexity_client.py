@@ -1,9 +1,15 @@
 """Perplexity API integration — AI-powered research."""
 
-import httpx
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.research_cache import cached_research
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 
+@cached_research("perplexity")
+@circuit_breaker("perplexity")
+@adaptive_retry("perplexity")
 def call_perplexity(
     prompt: str,
     system_prompt: str = None,
@@ -16,7 +22,7 @@ def call_perplexity(
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
 
-    response = httpx.post(
+    response = get_client("perplexity").post(
         "https://api.perplexity.ai/chat/completions",
         headers={
             "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
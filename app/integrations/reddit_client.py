@@ -1,22 +1,22 @@
 """Reddit API integration — trending discussions and community signals."""
 
 import praw
+from app.integrations.http import get_sdk_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.research_cache import cached_research
 from config.settings import settings
 
-_client = None
-
 
 def _get_client() -> praw.Reddit:
-    global _client
-    if _client is None:
-        _client = praw.Reddit(
-            client_id=settings.REDDIT_CLIENT_ID,
-            client_secret=settings.REDDIT_CLIENT_SECRET,
-            user_agent=settings.REDDIT_USER_AGENT,
-        )
-    return _client
+    return get_sdk_client("reddit", lambda: praw.Reddit(
+        client_id=settings.REDDIT_CLIENT_ID,
+        client_secret=settings.REDDIT_CLIENT_SECRET,
+        user_agent=settings.REDDIT_USER_AGENT,
+    ))
 
 
+@cached_research("reddit")
+@circuit_breaker("reddit")
 def get_trending_posts(query: str, limit: int = 20, sort: str = "relevance", time_filter: str = "month") -> list:
     """Search Reddit for trending posts related to a topic."""
     reddit = _get_client()
@@ -36,6 +36,8 @@ def get_trending_posts(query: str, limit: int = 20, sort: str = "relevance", tim
     return posts
 
 
+@cached_research("reddit")
+@circuit_breaker("reddit")
 def get_comments(post_url: str, limit: int = 20) -> list:
     """Get top comments from a Reddit post."""
     reddit = _get_client()
@@ -53,6 +55,8 @@ def get_comments(post_url: str, limit: int = 20) -> list:
     return comments
 
 
+@cached_research("reddit")
+@circuit_breaker("reddit")
 def get_subreddit_trending(subreddit_name: str, limit: int = 10) -> list:
     """Get hot posts from a specific subreddit."""
     reddit = _get_client()
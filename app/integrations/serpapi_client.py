@@ -1,19 +1,49 @@
 """SerpAPI integration — Google Trends, autocomplete, People Also Ask."""
 
-import httpx
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.concurrency import singleflight
+from app.utils.research_cache import cached_research
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://serpapi.com/search"
 
+SERP_NUM = 20
+SERP_FIELDS = ("organic_results", "search_information", "related_searches", "related_questions")
 
+
+@circuit_breaker("serpapi")
+@adaptive_retry("serpapi")
 def _search(params: dict) -> dict:
     """Make a SerpAPI request."""
     params["api_key"] = settings.SERPAPI_API_KEY
-    response = httpx.get(BASE_URL, params=params, timeout=30)
+    response = get_client("serpapi").get(BASE_URL, params=params, timeout=30)
     response.raise_for_status()
     return response.json()
 
 
+def get_serp(query: str, gl: str = "us", num: int = SERP_NUM) -> dict:
+    """Get a Google results page, fetched once per (query, gl, num).
+
+    Related searches, People Also Ask and keyword data are all views of this
+    page. Concurrent callers share one request; results are cached.
+    """
+    return singleflight(("serp", query, gl, num), lambda: _fetch_serp(query, gl, num))
+
+
+@cached_research("serpapi")
+def _fetch_serp(query: str, gl: str, num: int) -> dict:
+    result = _search({
+        "engine": "google",
+        "q": query,
+        "gl": gl,
+        "num": num,
+    })
+    return {field: result[field] for field in SERP_FIELDS if field in result}
+
+
+@cached_research("serpapi")
 def get_google_trends(query: str, geo: str = "US", timeframe: str = "today 12-m") -> dict:
     """Get Google Trends data for a query."""
     return _search({
@@ -26,11 +56,7 @@ def get_google_trends(query: str, geo: str = "US", timeframe: str = "today 12-m"
 
 def get_related_searches(query: str, geo: str = "US") -> dict:
     """Get related searches from Google."""
-    result = _search({
-        "engine": "google",
-        "q": query,
-        "gl": geo.lower(),
-    })
+    result = get_serp(query, gl=geo.lower())
     return {
         "related_searches": result.get("related_searches", []),
         "related_questions": result.get("related_questions", []),
@@ -39,14 +65,10 @@ def get_related_searches(query: str, geo: str = "US") -> dict:
 
 def get_people_also_ask(query: str, gl: str = "us") -> list:
     """Get People Also Ask questions from Google."""
-    result = _search({
-        "engine": "google",
-        "q": query,
-        "gl": gl,
-    })
-    return result.get("related_questions", [])
+    return get_serp(query, gl=gl).get("related_questions", [])
 
 
+@cached_research("serpapi")
 def get_autocomplete(query: str, gl: str = "us") -> list:
     """Get Google autocomplete suggestions."""
     result = _search({
@@ -59,12 +81,7 @@ def get_autocomplete(query: str, gl: str = "us") -> list:
 
 def get_keyword_data(query: str, gl: str = "us") -> dict:
     """Get keyword search results with organic data."""
-    result = _search({
-        "engine": "google",
-        "q": query,
-        "gl": gl,
-        "num": 20,
-    })
+    result = get_serp(query, gl=gl)
     return {
         "organic_results": result.get("organic_results", [])[:10],
         "search_information": result.get("search_information", {}),
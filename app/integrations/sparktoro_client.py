@@ -1,6 +1,8 @@
 """SparkToro API integration — audience intelligence."""
 
-import httpx
+from app.integrations.http import get_client
+from app.utils.circuit_breaker import circuit_breaker
+from app.utils.retry import adaptive_retry
 from config.settings import settings
 
 BASE_URL = "https://api.sparktoro.com/v1"
@@ -19,13 +21,19 @@ def get_audience_data(query: str) -> dict:
         }
 
     try:
-        response = httpx.get(
-            f"{BASE_URL}/audience",
-            headers={"Authorization": f"Bearer {settings.SPARKTORO_API_KEY}"},
-            params={"q": query},
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
+        return _get_audience(query)
     except Exception as e:
         return {"error": str(e)}
+
+
+@circuit_breaker("sparktoro")
+@adaptive_retry("sparktoro")
+def _get_audience(query: str) -> dict:
+    response = get_client("sparktoro").get(
+        f"{BASE_URL}/audience",
+        headers={"Authorization": f"Bearer {settings.SPARKTORO_API_KEY}"},
+        params={"q": query},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()
@@ -6,6 +6,13 @@ from app.models.approval import Approval
 from app.models.learning import LearningLog
 from app.models.ad_performance import AdPerformance
 from app.models.phase_toggle import PhaseToggle
+from app.models.asset import Asset
+from app.models.sync_state import SyncState
+from app.models.product_performance import ProductPerformance
+from app.models.dashboard_counter import DashboardCounter
+from app.models.ad_rollup import AdRollup
+from app.models.learning_rollup import LearningRollup
+from app.models.prompt_test_run import PromptTestRun
 
 __all__ = [
     "PipelineRun",
@@ -16,4 +23,11 @@ __all__ = [
     "LearningLog",
     "AdPerformance",
     "PhaseToggle",
+    "Asset",
+    "SyncState",
+    "ProductPerformance",
+    "DashboardCounter",
+    "AdRollup",
+    "LearningRollup",
+    "PromptTestRun",
 ]
@@ -8,7 +8,7 @@ class AdPerformance(db.Model):
     __tablename__ = "ad_performance"
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    product_id = db.Column(db.String(36), db.ForeignKey("products.id"), nullable=False, index=True)
+    product_id = db.Column(db.String(36), db.ForeignKey("products.id"), nullable=False)
     campaign_id = db.Column(db.String(100), nullable=True)
     ad_set_id = db.Column(db.String(100), nullable=True)
     ad_id = db.Column(db.String(100), nullable=True)
@@ -24,6 +24,19 @@ class AdPerformance(db.Model):
     date = db.Column(db.Date, nullable=False)
     fetched_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (
+        # One row per ad per day; the sync upserts against this (ON CONFLICT)
+        db.Index(
+            "uq_ad_performance_product_campaign_ad_date",
+            "product_id", "campaign_id", "ad_id", "date",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        # Keyset pagination order (most recent day first), overall and per product
+        db.Index("ix_ad_performance_date_id", "date", "id"),
+        db.Index("ix_ad_performance_product_date_id", "product_id", "date", "id"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from app import db
+
+
+class AdRollup(db.Model):
+    """Ad metrics pre-aggregated per day or week, product and creative variant.
+
+    Refreshed from ad_performance by the ad sync (app.services.timeseries);
+    niche and product_type are copied from the product so slices need no joins.
+    """
+
+    __tablename__ = "ad_rollups"
+
+    bucket = db.Column(db.String(10), primary_key=True)  # day | week
+    bucket_start = db.Column(db.Date, primary_key=True)  # the day, or the Monday of the week
+    product_id = db.Column(db.String(36), db.ForeignKey("products.id"), primary_key=True)
+    creative_variant = db.Column(db.String(100), primary_key=True, default="")  # "" when unknown
+    niche = db.Column(db.String(255), nullable=True)
+    product_type = db.Column(db.String(50), nullable=True)
+    impressions = db.Column(db.BigInteger, nullable=False, default=0)
+    clicks = db.Column(db.BigInteger, nullable=False, default=0)
+    conversions = db.Column(db.BigInteger, nullable=False, default=0)
+    spend = db.Column(db.Float, nullable=False, default=0.0)
+    revenue = db.Column(db.Float, nullable=False, default=0.0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
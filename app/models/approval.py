@@ -15,6 +15,7 @@ class Approval(db.Model):
         db.String(20),
         nullable=False,
         default="pending",
+        index=True,
     )  # pending | approved | rejected | edited
     reviewer_notes = db.Column(db.Text, nullable=True)
     original_output = db.Column(db.JSON, nullable=True)
@@ -0,0 +1,47 @@
+import uuid
+from datetime import datetime, timezone
+
+from app import db
+
+
+class Asset(db.Model):
+    """Manifest entry for a stored file. Content lives once on disk, keyed by sha256."""
+
+    __tablename__ = "assets"
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    sha256 = db.Column(db.String(64), nullable=False, index=True)
+    pipeline_run_id = db.Column(db.String(36), db.ForeignKey("pipeline_runs.id"), nullable=False)
+    product_id = db.Column(db.String(36), db.ForeignKey("products.id"), nullable=True, index=True)
+    kind = db.Column(db.String(50), nullable=False)  # cover | pdf | creative | branded_creative
+    name = db.Column(db.String(255), nullable=True)
+    source_url = db.Column(db.Text, nullable=True)  # provider URL it was downloaded from
+    size = db.Column(db.BigInteger, nullable=False)
+    mime_type = db.Column(db.String(100), nullable=True)
+    width = db.Column(db.Integer, nullable=True)
+    height = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.UniqueConstraint("pipeline_run_id", "sha256", "kind", name="uq_asset_pipeline_sha_kind"),
+        db.Index("ix_assets_pipeline_created", "pipeline_run_id", "created_at"),
+    )
+
+    def to_dict(self):
+        from app.services.asset_store import public_url
+
+        return {
+            "id": self.id,
+            "sha256": self.sha256,
+            "pipeline_run_id": self.pipeline_run_id,
+            "product_id": self.product_id,
+            "kind": self.kind,
+            "name": self.name,
+            "url": public_url(self.sha256),
+            "source_url": self.source_url,
+            "size": self.size,
+            "mime_type": self.mime_type,
+            "width": self.width,
+            "height": self.height,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
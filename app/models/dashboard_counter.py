@@ -0,0 +1,25 @@
+from datetime import datetime, timezone
+
+from app import db
+
+
+class DashboardCounter(db.Model):
+    """A precomputed dashboard aggregate, kept current by app.services.rollups.
+
+    e.g. ("pipelines.status", "running") -> 3, ("ads", "spend") -> 1234.5
+    """
+
+    __tablename__ = "dashboard_counters"
+
+    metric = db.Column(db.String(50), primary_key=True)
+    key = db.Column(db.String(255), primary_key=True)
+    value = db.Column(db.Float, nullable=False, default=0.0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self):
+        return {
+            "metric": self.metric,
+            "key": self.key,
+            "value": self.value,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
@@ -19,11 +19,18 @@ class LearningLog(db.Model):
         nullable=True,
     )  # approved | rejected | edited
     performance_score = db.Column(db.Float, nullable=True)  # filled later from ad_performance
-    niche = db.Column(db.String(255), nullable=True, index=True)
+    niche = db.Column(db.String(255), nullable=True)
     tags = db.Column(db.JSON, nullable=True, default=list)
-    metadata = db.Column(db.JSON, nullable=True, default=dict)  # extra context
+    # "metadata" is reserved on declarative models; the column keeps its name
+    extra_metadata = db.Column("metadata", db.JSON, nullable=True, default=dict)  # extra context
     created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (
+        # Keyset pagination order (newest first), overall and per niche
+        db.Index("ix_learning_logs_created_at_id", "created_at", "id"),
+        db.Index("ix_learning_logs_niche_created_at_id", "niche", "created_at", "id"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
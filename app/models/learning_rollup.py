@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from app import db
+
+
+class LearningRollup(db.Model):
+    """Approval feedback and performance scores per day or week, phase, niche and outcome.
+
+    Refreshed from learning_logs by the ad sync (app.services.timeseries).
+    """
+
+    __tablename__ = "learning_rollups"
+
+    bucket = db.Column(db.String(10), primary_key=True)  # day | week
+    bucket_start = db.Column(db.Date, primary_key=True)
+    phase_number = db.Column(db.Integer, primary_key=True)
+    agent_name = db.Column(db.String(100), primary_key=True)
+    niche = db.Column(db.String(255), primary_key=True, default="")  # "" when unknown
+    feedback = db.Column(db.String(20), primary_key=True, default="")  # "" when none given
+    logs = db.Column(db.Integer, nullable=False, default=0)
+    score_sum = db.Column(db.Float, nullable=False, default=0.0)
+    scored = db.Column(db.Integer, nullable=False, default=0)  # logs with a performance score
+    updated_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
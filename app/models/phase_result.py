@@ -16,8 +16,9 @@ class PhaseResult(db.Model):
         nullable=False,
         default="running",
     )  # running | waiting_approval | approved | rejected | completed | failed
-    input_data = db.Column(db.JSON, nullable=True)
-    output_data = db.Column(db.JSON, nullable=True)
+    # Inputs embed every earlier output, so both are only loaded when accessed
+    input_data = db.deferred(db.Column(db.JSON, nullable=True), group="payload")
+    output_data = db.deferred(db.Column(db.JSON, nullable=True), group="payload")
     prompt_used = db.Column(db.Text, nullable=True)  # snapshot of prompt at execution time
     duration_seconds = db.Column(db.Float, nullable=True)
     error_log = db.Column(db.Text, nullable=True)
@@ -29,15 +30,16 @@ class PhaseResult(db.Model):
     # Relationships
     approval = db.relationship("Approval", backref="phase_result", uselist=False)
 
-    def to_dict(self):
-        return {
+    HEAVY_FIELDS = ("input_data", "output_data")
+
+    def to_dict(self, include=()):
+        """Serialize; heavy payload fields only when named in `include`."""
+        data = {
             "id": self.id,
             "pipeline_run_id": self.pipeline_run_id,
             "phase_number": self.phase_number,
             "agent_name": self.agent_name,
             "status": self.status,
-            "input_data": self.input_data,
-            "output_data": self.output_data,
             "prompt_used": self.prompt_used,
             "duration_seconds": self.duration_seconds,
             "error_log": self.error_log,
@@ -46,3 +48,7 @@ class PhaseResult(db.Model):
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "approved_at": self.approved_at.isoformat() if self.approved_at else None,
         }
+        for field in self.HEAVY_FIELDS:
+            if field in include:
+                data[field] = getattr(self, field)
+        return data
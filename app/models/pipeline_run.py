@@ -12,7 +12,6 @@ class PipelineRun(db.Model):
         db.String(20),
         nullable=False,
         default="pending",
-        index=True,
     )  # pending | running | paused | completed | failed
     current_phase = db.Column(db.Integer, nullable=False, default=1)
     niche = db.Column(db.String(255), nullable=False)
@@ -27,16 +26,28 @@ class PipelineRun(db.Model):
     products = db.relationship("Product", backref="pipeline_run", lazy="dynamic")
     phase_results = db.relationship("PhaseResult", backref="pipeline_run", lazy="dynamic", order_by="PhaseResult.phase_number")
 
-    def to_dict(self):
-        return {
+    __table_args__ = (
+        # Keyset pagination order (newest first), overall and per status
+        db.Index("ix_pipeline_runs_created_at_id", "created_at", "id"),
+        db.Index("ix_pipeline_runs_status_created_at_id", "status", "created_at", "id"),
+    )
+
+    HEAVY_FIELDS = ("config",)
+
+    def to_dict(self, include=HEAVY_FIELDS):
+        """Serialize; `config` can be left out (and left unloaded) via `include`."""
+        data = {
             "id": self.id,
             "status": self.status,
             "current_phase": self.current_phase,
             "niche": self.niche,
             "topic": self.topic,
-            "config": self.config,
             "error_message": self.error_message,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
         }
+        for field in self.HEAVY_FIELDS:
+            if field in include:
+                data[field] = getattr(self, field)
+        return data
@@ -20,13 +20,15 @@ class Product(db.Model):
         db.String(20),
         nullable=False,
         default="draft",
-        index=True,
     )  # draft | review | approved | published
     description = db.Column(db.Text, nullable=True)
     price = db.Column(db.Float, nullable=True)
-    blueprint = db.Column(db.JSON, nullable=True)  # product structure from Phase 4
-    content = db.Column(db.JSON, nullable=True)  # written content from Phase 5
+    blueprint = db.deferred(db.Column(db.JSON, nullable=True), group="payload")  # product structure from Phase 4
+    content = db.deferred(db.Column(db.JSON, nullable=True), group="payload")  # written content from Phase 5
     assets = db.Column(db.JSON, nullable=True, default=dict)  # file paths, URLs, cover images
+    # Read out of `assets` by the query itself, so listings can link the cover
+    # thumbnail with `assets` deferred
+    cover_sha256 = db.column_property(assets["cover_sha256"].as_string())
     funnel_url = db.Column(db.String(500), nullable=True)
     stripe_product_id = db.Column(db.String(100), nullable=True)
     stripe_price_id = db.Column(db.String(100), nullable=True)
@@ -37,8 +39,25 @@ class Product(db.Model):
     ad_performances = db.relationship("AdPerformance", backref="product", lazy="dynamic")
     learning_logs = db.relationship("LearningLog", backref="product", lazy="dynamic")
 
-    def to_dict(self):
-        return {
+    __table_args__ = (
+        # Keyset pagination order (newest first), overall and per niche / status
+        db.Index("ix_products_created_at_id", "created_at", "id"),
+        db.Index("ix_products_niche_created_at_id", "niche", "created_at", "id"),
+        db.Index("ix_products_status_created_at_id", "status", "created_at", "id"),
+    )
+
+    HEAVY_FIELDS = ("assets", "blueprint", "content")
+
+    def thumbnail_url(self) -> str | None:
+        """Thumbnail of the stored cover, if the designer has stored one."""
+        if not self.cover_sha256:
+            return None
+        from app.services.asset_store import thumbnail_url
+        return thumbnail_url(self.cover_sha256)
+
+    def to_dict(self, include=()):
+        """Serialize; assets, blueprint and content only when named in `include`."""
+        data = {
             "id": self.id,
             "pipeline_run_id": self.pipeline_run_id,
             "name": self.name,
@@ -47,8 +66,12 @@ class Product(db.Model):
             "status": self.status,
             "description": self.description,
             "price": self.price,
-            "assets": self.assets,
             "funnel_url": self.funnel_url,
+            "thumbnail_url": self.thumbnail_url(),
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "published_at": self.published_at.isoformat() if self.published_at else None,
         }
+        for field in self.HEAVY_FIELDS:
+            if field in include:
+                data[field] = getattr(self, field)
+        return data
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+from app import db
+
+
+class ProductPerformance(db.Model):
+    """Lifetime ad totals per product, rolled up from ad_performance by the sync."""
+
+    __tablename__ = "product_performance"
+
+    product_id = db.Column(db.String(36), db.ForeignKey("products.id"), primary_key=True)
+    impressions = db.Column(db.BigInteger, nullable=False, default=0)
+    clicks = db.Column(db.BigInteger, nullable=False, default=0)
+    conversions = db.Column(db.BigInteger, nullable=False, default=0)
+    spend = db.Column(db.Float, nullable=False, default=0.0)
+    revenue = db.Column(db.Float, nullable=False, default=0.0)
+    roas = db.Column(db.Float, nullable=True)
+    score = db.Column(db.Float, nullable=True)  # ROAS normalized to 0-100 (3x = 75)
+    updated_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self):
+        return {
+            "product_id": self.product_id,
+            "impressions": self.impressions,
+            "clicks": self.clicks,
+            "conversions": self.conversions,
+            "spend": self.spend,
+            "revenue": self.revenue,
+            "roas": self.roas,
+            "score": self.score,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
@@ -0,0 +1,47 @@
+import uuid
+from datetime import datetime, timezone
+
+from app import db
+
+
+class PromptTestRun(db.Model):
+    """A background prompt test.
+
+    matrix — prompt versions x sample variable sets x providers.
+    replay — one prompt version's agent re-run on historical phase inputs.
+    """
+
+    __tablename__ = "prompt_test_runs"
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    template_key = db.Column(db.String(100), nullable=False, index=True)
+    kind = db.Column(db.String(20), nullable=False, default="matrix")  # matrix | replay
+    status = db.Column(
+        db.String(20),
+        nullable=False,
+        default="queued",
+    )  # queued | running | completed | failed
+    config = db.Column(db.JSON, nullable=False, default=dict)  # what to run, per kind
+    results = db.deferred(db.Column(db.JSON, nullable=True))  # one entry per cell
+    summary = db.Column(db.JSON, nullable=True)  # latency, token and quality totals per group
+    error_message = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    started_at = db.Column(db.DateTime, nullable=True)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self, include=()):
+        data = {
+            "id": self.id,
+            "template_key": self.template_key,
+            "kind": self.kind,
+            "status": self.status,
+            "config": self.config,
+            "summary": self.summary,
+            "error_message": self.error_message,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+        if "results" in include:
+            data["results"] = self.results
+        return data
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from app import db
+
+
+class SyncState(db.Model):
+    """High-water mark for an incremental sync, e.g. Meta insights per ad account."""
+
+    __tablename__ = "sync_states"
+
+    key = db.Column(db.String(150), primary_key=True)  # e.g. "meta_insights:act_123"
+    synced_through = db.Column(db.Date, nullable=True)  # last day fully fetched
+    last_run_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def to_dict(self):
+        return {
+            "key": self.key,
+            "synced_through": self.synced_through.isoformat() if self.synced_through else None,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 import structlog
 
 from app import db
+from app.models.approval import Approval
 from app.models.pipeline_run import PipelineRun
 from app.models.phase_result import PhaseResult
 from app.orchestrator.state import (
@@ -18,6 +19,7 @@ from app.orchestrator.state import (
     can_transition_pipeline,
 )
 from app.orchestrator.gates import requires_approval, create_approval_gate
+from app.services import events
 
 logger = structlog.get_logger(__name__)
 
@@ -50,6 +52,7 @@ class PipelineOrchestrator:
         pipeline.status = PipelineStatus.RUNNING
         pipeline.started_at = pipeline.started_at or datetime.now(timezone.utc)
         db.session.commit()
+        events.publish("pipeline_started", self.pipeline_run_id, phase=pipeline.current_phase)
 
         return self.run_phase(pipeline.current_phase)
 
@@ -83,10 +86,26 @@ class PipelineOrchestrator:
         db.session.add(phase_result)
         pipeline.current_phase = phase_number
         db.session.commit()
+        events.publish(
+            "phase_started",
+            self.pipeline_run_id,
+            phase=phase_number,
+            phase_name=phase_name,
+            agent=agent_name,
+            phase_result_id=phase_result.id,
+        )
 
         try:
-            # Get the agent and execute
-            agent = self._get_agent(agent_name)
+            # Get the agent and execute; a rejected output must not come back from the LLM cache
+            rerun = self._last_approval_status(phase_number) == "rejected"
+            if rerun:
+                logger.info(
+                    "phase.rerun_after_rejection",
+                    pipeline_id=self.pipeline_run_id,
+                    phase=phase_number,
+                    trace_id=self.trace_id,
+                )
+            agent = get_agent(agent_name, bypass_cache=rerun)
             input_data = self._gather_phase_input(phase_number)
 
             phase_result.input_data = input_data
@@ -113,9 +132,17 @@ class PipelineOrchestrator:
 
             # Check if approval is needed
             if requires_approval(phase_number, pipeline.config):
-                create_approval_gate(phase_result)
+                approval = create_approval_gate(phase_result)
                 pipeline.status = PipelineStatus.PAUSED
                 db.session.commit()
+                events.publish(
+                    "approval_created",
+                    self.pipeline_run_id,
+                    phase=phase_number,
+                    phase_name=phase_name,
+                    approval_id=approval.id,
+                    duration_seconds=phase_result.duration_seconds,
+                )
 
                 logger.info(
                     "phase.waiting_approval",
@@ -135,6 +162,13 @@ class PipelineOrchestrator:
             phase_result.status = PhaseStatus.COMPLETED
             phase_result.completed_at = datetime.now(timezone.utc)
             db.session.commit()
+            events.publish(
+                "phase_completed",
+                self.pipeline_run_id,
+                phase=phase_number,
+                phase_name=phase_name,
+                duration_seconds=phase_result.duration_seconds,
+            )
 
             return self._advance_to_next_phase(phase_number)
 
@@ -151,6 +185,7 @@ class PipelineOrchestrator:
             pipeline.status = PipelineStatus.FAILED
             pipeline.error_message = f"Phase {phase_number} failed: {str(e)}"
             db.session.commit()
+            events.publish("phase_failed", self.pipeline_run_id, phase=phase_number, phase_name=phase_name, error=str(e))
             raise
 
     def resume_after_approval(self, phase_number: int):
@@ -176,6 +211,7 @@ class PipelineOrchestrator:
 
         pipeline.status = PipelineStatus.RUNNING
         db.session.commit()
+        events.publish("phase_completed", self.pipeline_run_id, phase=phase_number, phase_name=PHASE_NAMES[phase_number])
 
         return self._advance_to_next_phase(phase_number)
 
@@ -192,6 +228,7 @@ class PipelineOrchestrator:
         pipeline.status = PipelineStatus.COMPLETED
         pipeline.completed_at = datetime.now(timezone.utc)
         db.session.commit()
+        events.publish("pipeline_completed", self.pipeline_run_id)
 
         logger.info(
             "pipeline.completed",
@@ -201,31 +238,13 @@ class PipelineOrchestrator:
         )
         return {"status": "completed", "pipeline_id": self.pipeline_run_id}
 
-    def _get_agent(self, agent_name: str):
-        """Get the agent instance for a given agent name."""
-        from app.agents.trend_discovery import TrendDiscoveryAgent
-        from app.agents.niche_validator import NicheValidatorAgent
-        from app.agents.audience_profiler import AudienceProfilerAgent
-        from app.agents.product_architect import ProductArchitectAgent
-        from app.agents.content_writer import ContentWriterAgent
-        from app.agents.designer import DesignerAgent
-        from app.agents.funnel_builder import FunnelBuilderAgent
-        from app.agents.campaign_launcher import CampaignLauncherAgent
-
-        agents = {
-            "trend_discovery": TrendDiscoveryAgent,
-            "niche_validator": NicheValidatorAgent,
-            "audience_profiler": AudienceProfilerAgent,
-            "product_architect": ProductArchitectAgent,
-            "content_writer": ContentWriterAgent,
-            "designer": DesignerAgent,
-            "funnel_builder": FunnelBuilderAgent,
-            "campaign_launcher": CampaignLauncherAgent,
-        }
-        agent_class = agents.get(agent_name)
-        if not agent_class:
-            raise ValueError(f"Unknown agent: {agent_name}")
-        return agent_class()
+    def _last_approval_status(self, phase_number: int) -> str | None:
+        """Status of the latest approval gate for a phase, if it ever had one."""
+        approval = Approval.query.filter_by(
+            pipeline_run_id=self.pipeline_run_id,
+            phase_number=phase_number,
+        ).order_by(Approval.created_at.desc()).first()
+        return approval.status if approval else None
 
     def _gather_phase_input(self, phase_number: int) -> dict:
         """Gather input data for a phase from previous phase results."""
@@ -241,7 +260,7 @@ class PipelineOrchestrator:
             PhaseResult.pipeline_run_id == self.pipeline_run_id,
             PhaseResult.phase_number < phase_number,
             PhaseResult.status == PhaseStatus.COMPLETED,
-        ).order_by(PhaseResult.phase_number).all()
+        ).options(db.undefer(PhaseResult.output_data)).order_by(PhaseResult.phase_number).all()
 
         for result in previous_results:
             key = f"phase_{result.phase_number}_output"
@@ -250,6 +269,33 @@ class PipelineOrchestrator:
         return input_data
 
 
+def get_agent(agent_name: str, **options):
+    """Get the agent instance for a given agent name (options go to BaseAgent)."""
+    from app.agents.trend_discovery import TrendDiscoveryAgent
+    from app.agents.niche_validator import NicheValidatorAgent
+    from app.agents.audience_profiler import AudienceProfilerAgent
+    from app.agents.product_architect import ProductArchitectAgent
+    from app.agents.content_writer import ContentWriterAgent
+    from app.agents.designer import DesignerAgent
+    from app.agents.funnel_builder import FunnelBuilderAgent
+    from app.agents.campaign_launcher import CampaignLauncherAgent
+
+    agents = {
+        "trend_discovery": TrendDiscoveryAgent,
+        "niche_validator": NicheValidatorAgent,
+        "audience_profiler": AudienceProfilerAgent,
+        "product_architect": ProductArchitectAgent,
+        "content_writer": ContentWriterAgent,
+        "designer": DesignerAgent,
+        "funnel_builder": FunnelBuilderAgent,
+        "campaign_launcher": CampaignLauncherAgent,
+    }
+    agent_class = agents.get(agent_name)
+    if not agent_class:
+        raise ValueError(f"Unknown agent: {agent_name}")
+    return agent_class(**options)
+
+
 def create_pipeline(niche: str, topic: str = None, config: dict = None) -> PipelineRun:
     """Create a new pipeline run."""
     pipeline = PipelineRun(
@@ -6,7 +6,9 @@ from app import db
 from app.models.phase_toggle import PhaseToggle
 from app.models.approval import Approval
 from app.models.phase_result import PhaseResult
+from app.models.pipeline_run import PipelineRun
 from app.models.learning import LearningLog
+from app.services import events
 
 
 def requires_approval(phase_number: int, pipeline_config: dict = None) -> bool:
@@ -43,6 +45,9 @@ def create_approval_gate(phase_result: PhaseResult) -> Approval:
     return approval
 
 
+DECISIONS = ("approved", "rejected", "edited")
+
+
 def resolve_approval(approval_id: str, decision: str, notes: str = None, edited_output: dict = None) -> Approval:
     """Resolve an approval gate (approve, reject, or edit)."""
     approval = Approval.query.get(approval_id)
@@ -52,6 +57,92 @@ def resolve_approval(approval_id: str, decision: str, notes: str = None, edited_
     if approval.status != "pending":
         raise ValueError(f"Approval {approval_id} already resolved: {approval.status}")
 
+    phase_result = approval.phase_result
+    niche = phase_result.pipeline_run.niche if phase_result.pipeline_run else None
+    db.session.add(_apply_decision(approval, phase_result, niche, decision, notes, edited_output))
+
+    db.session.commit()
+    events.publish(
+        "approval_resolved",
+        approval.pipeline_run_id,
+        phase=approval.phase_number,
+        approval_id=approval.id,
+        decision=approval.status,
+    )
+    return approval
+
+
+def resolve_approvals(items: list) -> list:
+    """Resolve many approval gates in one transaction.
+
+    `items` are {"approval_id", "decision", "notes", "edited_output"} dicts.
+    Items that can't be resolved (unknown, already resolved, bad decision)
+    are reported and skipped; the rest commit together. Returns one result
+    per item, in order: {"approval_id", "ok", "status", "pipeline_run_id",
+    "phase_number"} or {"approval_id", "ok", "error"}.
+    """
+    ids = [item.get("approval_id") for item in items]
+    rows = db.session.query(Approval, PhaseResult, PipelineRun.niche).join(
+        PhaseResult, PhaseResult.id == Approval.phase_result_id
+    ).join(
+        PipelineRun, PipelineRun.id == Approval.pipeline_run_id
+    ).options(
+        db.undefer(PhaseResult.output_data)  # for the learning log summary
+    ).filter(
+        Approval.id.in_([i for i in ids if i])
+    ).with_for_update(of=Approval).all()
+    found = {approval.id: (approval, phase_result, niche) for approval, phase_result, niche in rows}
+
+    results, logs, seen = [], [], set()
+    for item, approval_id in zip(items, ids):
+        decision = item.get("decision")
+        if approval_id not in found:
+            error = f"Approval {approval_id} not found"
+        elif approval_id in seen:
+            error = f"Approval {approval_id} listed more than once"
+        elif decision not in DECISIONS:
+            error = "decision must be 'approved', 'rejected', or 'edited'"
+        elif found[approval_id][0].status != "pending":
+            error = f"Approval {approval_id} already resolved: {found[approval_id][0].status}"
+        else:
+            error = None
+
+        if error:
+            results.append({"approval_id": approval_id, "ok": False, "error": error})
+            continue
+
+        seen.add(approval_id)
+        approval, phase_result, niche = found[approval_id]
+        logs.append(_apply_decision(
+            approval, phase_result, niche, decision, item.get("notes"), item.get("edited_output")
+        ))
+        # Read before the commit expires the rows, so reporting costs no SELECTs
+        results.append({
+            "approval_id": approval_id,
+            "ok": True,
+            "status": approval.status,
+            "pipeline_run_id": approval.pipeline_run_id,
+            "phase_number": approval.phase_number,
+        })
+
+    # One flush: the ORM batches the learning log INSERTs into multi-row statements
+    db.session.add_all(logs)
+    db.session.commit()
+
+    for result in results:
+        if result["ok"]:
+            events.publish(
+                "approval_resolved",
+                result["pipeline_run_id"],
+                phase=result["phase_number"],
+                approval_id=result["approval_id"],
+                decision=result["status"],
+            )
+    return results
+
+
+def _apply_decision(approval, phase_result, niche, decision, notes=None, edited_output=None) -> LearningLog:
+    """Record a decision on an approval and its phase result; returns the learning log to add."""
     approval.status = decision  # approved | rejected | edited
     approval.reviewer_notes = notes
     approval.resolved_at = datetime.now(timezone.utc)
@@ -61,7 +152,6 @@ def resolve_approval(approval_id: str, decision: str, notes: str = None, edited_
         approval.edited_output = edited_output
 
     # Update the phase result
-    phase_result = approval.phase_result
     if decision in ("approved", "edited"):
         phase_result.status = "approved"
         phase_result.approved_at = datetime.now(timezone.utc)
@@ -71,16 +161,12 @@ def resolve_approval(approval_id: str, decision: str, notes: str = None, edited_
         phase_result.status = "rejected"
 
     # Log to learning system
-    log = LearningLog(
+    return LearningLog(
         pipeline_run_id=approval.pipeline_run_id,
         phase_number=approval.phase_number,
         agent_name=phase_result.agent_name,
         prompt_used=phase_result.prompt_used,
         output_summary=str(phase_result.output_data)[:1000],
         feedback=decision,
-        niche=phase_result.pipeline_run.niche if phase_result.pipeline_run else None,
+        niche=niche,
     )
-    db.session.add(log)
-
-    db.session.commit()
-    return approval
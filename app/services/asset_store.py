@@ -0,0 +1,233 @@
+"""Asset store — content-addressed local copies of generated images, covers and PDFs.
+
+Each file is stored once under ASSETS_DIR/objects/<sha256[:2]>/<sha256>,
+however many pipelines or products reference it. The `assets` table is the
+manifest: one row per (pipeline, file, kind) with size, mime type and
+dimensions, so listings never touch the filesystem. Image thumbnails are
+rendered on first request and kept next to the objects, keyed the same way.
+"""
+
+import hashlib
+import mimetypes
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import structlog
+from PIL import Image
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app import db
+from app.integrations.http import get_client
+from app.models.asset import Asset
+from config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+DOWNLOAD_WORKERS = 4
+THUMBNAIL_WIDTHS = (160, 320, 640)
+
+
+def object_path(sha256: str) -> str:
+    """Location of a stored object on disk."""
+    return os.path.join(settings.ASSETS_DIR, "objects", sha256[:2], sha256)
+
+
+def public_url(sha256: str) -> str:
+    """URL the API serves an object from (relative unless PUBLIC_BASE_URL is set)."""
+    return f"{settings.PUBLIC_BASE_URL}/api/assets/{sha256}"
+
+
+def external_url(sha256: str, source_url: str = None) -> str | None:
+    """Absolute URL a third party (Meta, Bannerbear) can fetch an object from.
+
+    Our own copy when PUBLIC_BASE_URL is set, else the provider URL it was
+    downloaded from (which may expire); None when there is neither.
+    """
+    if settings.PUBLIC_BASE_URL:
+        return public_url(sha256)
+    return source_url
+
+
+def thumbnail_url(sha256: str, width: int = THUMBNAIL_WIDTHS[1]) -> str:
+    """URL the API serves an image object's thumbnail from."""
+    return f"{public_url(sha256)}/thumbnail?w={width}"
+
+
+def thumbnail_path(sha256: str, width: int) -> str | None:
+    """A WebP thumbnail of a stored image, at most `width` pixels wide, rendered once.
+
+    None when the object is missing or isn't an image Pillow can read.
+    """
+    path = os.path.join(settings.ASSETS_DIR, "thumbnails", str(width), sha256[:2], f"{sha256}.webp")
+    if os.path.exists(path):
+        return path
+    source = object_path(sha256)
+    if not os.path.exists(source):
+        return None
+
+    tmp_path = _temp_file()
+    try:
+        with Image.open(source) as image:
+            image.thumbnail((width, width * 4))  # bound the width; keep the aspect ratio
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            image.save(tmp_path, format="WEBP", quality=80)
+    except Exception as e:
+        os.remove(tmp_path)
+        logger.warning("asset.thumbnail.failed", sha256=sha256, error=str(e))
+        return None
+
+    _commit_object(tmp_path, path)
+    return path
+
+
+def put_bytes(
+    data: bytes,
+    pipeline_run_id: str,
+    kind: str,
+    product_id: str = None,
+    name: str = None,
+    mime_type: str = None,
+) -> Asset:
+    """Store in-memory content (e.g. a locally rendered image) and register it."""
+    sha256 = hashlib.sha256(data).hexdigest()
+    path = object_path(sha256)
+    if not os.path.exists(path):
+        tmp_path = _temp_file()
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        _commit_object(tmp_path, path)
+
+    asset = _register(
+        {"sha256": sha256, "size": len(data), "mime_type": mime_type or _guess_mime(name)},
+        pipeline_run_id=pipeline_run_id, kind=kind, product_id=product_id, name=name,
+    )
+    db.session.commit()
+    return asset
+
+
+def store_urls(items: list, pipeline_run_id: str) -> list:
+    """Download provider-hosted files concurrently and register them.
+
+    Args:
+        items: Dicts with `url`, `kind` and optionally `product_id`, `name`.
+        pipeline_run_id: Pipeline the assets belong to.
+
+    Returns the stored Asset (or None if its download failed) for each item, in order.
+    """
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        downloads = list(pool.map(_safe_download, [item["url"] for item in items]))
+
+    assets = []
+    for item, blob in zip(items, downloads):
+        if blob is None:
+            assets.append(None)
+            continue
+        assets.append(_register(
+            blob,
+            pipeline_run_id=pipeline_run_id,
+            kind=item["kind"],
+            product_id=item.get("product_id"),
+            name=item.get("name"),
+            source_url=item["url"],
+        ))
+
+    db.session.commit()
+    return assets
+
+
+def list_assets(pipeline_run_id: str, product_id: str = None, kind: str = None) -> list:
+    """List a pipeline's assets from the manifest."""
+    query = Asset.query.filter(Asset.pipeline_run_id == pipeline_run_id)
+    if product_id:
+        query = query.filter(Asset.product_id == product_id)
+    if kind:
+        query = query.filter(Asset.kind == kind)
+    return query.order_by(Asset.created_at).all()
+
+
+def _safe_download(url: str) -> dict | None:
+    try:
+        return _download(url)
+    except Exception as e:
+        logger.warning("asset.download.failed", url=url, error=str(e))
+        return None
+
+
+def _download(url: str) -> dict:
+    """Stream a URL to disk, hashing as it goes, and move it into the object store."""
+    digest = hashlib.sha256()
+    size = 0
+    tmp_path = _temp_file()
+
+    try:
+        with get_client("downloads").stream("GET", url, timeout=120) as response:
+            response.raise_for_status()
+            mime_type = response.headers.get("content-type", "").split(";")[0] or None
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_bytes(CHUNK_SIZE):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+    sha256 = digest.hexdigest()
+    _commit_object(tmp_path, object_path(sha256))
+    return {"sha256": sha256, "size": size, "mime_type": mime_type or _guess_mime(url)}
+
+
+def _register(blob: dict, pipeline_run_id: str, kind: str, product_id: str = None,
+              name: str = None, source_url: str = None) -> Asset:
+    """Add a manifest row for a stored object unless this pipeline already has it."""
+    key = {"pipeline_run_id": pipeline_run_id, "sha256": blob["sha256"], "kind": kind}
+    width, height = _dimensions(blob["sha256"], blob["mime_type"])
+    # Concurrent phases may store the same file; let the unique key pick one row
+    stmt = pg_insert(Asset).values(
+        **key,
+        product_id=product_id,
+        name=name,
+        source_url=source_url,
+        size=blob["size"],
+        mime_type=blob["mime_type"],
+        width=width,
+        height=height,
+    ).on_conflict_do_nothing(index_elements=list(key))
+    db.session.execute(stmt)
+    return Asset.query.filter_by(**key).one()
+
+
+def _dimensions(sha256: str, mime_type: str | None) -> tuple:
+    if not mime_type or not mime_type.startswith("image/"):
+        return None, None
+    try:
+        with Image.open(object_path(sha256)) as image:
+            return image.size
+    except Exception:
+        return None, None
+
+
+def _temp_file() -> str:
+    tmp_dir = os.path.join(settings.ASSETS_DIR, "objects", "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=tmp_dir)
+    os.close(fd)
+    return path
+
+
+def _commit_object(tmp_path: str, path: str):
+    """Move a finished temp file into place; identical content may already be there."""
+    if os.path.exists(path):
+        os.remove(tmp_path)
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(tmp_path, path)
+
+
+def _guess_mime(name: str | None) -> str | None:
+    if not name:
+        return None
+    return mimetypes.guess_type(name.split("?")[0])[0]
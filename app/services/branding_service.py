@@ -0,0 +1,179 @@
+"""Branding service — renders branded ad overlays from declarative templates.
+
+Templates live in config/templates/*.yaml. Rendering is local by default;
+Bannerbear can still be used as a remote backend via BRANDING_BACKEND.
+"""
+
+import functools
+import os
+
+import structlog
+import yaml
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+from app.services.asset_store import put_bytes, public_url
+from app.services.image_service import load_image, parse_brand_colors, to_png_bytes
+from config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "config", "templates")
+DEFAULT_TEMPLATE = "ad_overlay"
+DEFAULT_BRAND_COLORS = ["#1a1a2e", "#16213e", "#e94560"]
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(name: str = DEFAULT_TEMPLATE) -> dict:
+    """Load a template definition from config/templates/<name>.yaml."""
+    filepath = os.path.join(TEMPLATES_DIR, f"{name}.yaml")
+    if not os.path.exists(filepath):
+        raise ValueError(f"Branding template '{name}' not found")
+    with open(filepath, "r") as f:
+        return yaml.safe_load(f)
+
+
+def apply_branding(
+    modifications: dict,
+    brand_colors: str | list = None,
+    template: str = DEFAULT_TEMPLATE,
+    pipeline_run_id: str = None,
+    product_id: str = None,
+    name: str = None,
+) -> dict:
+    """Brand a creative with the configured backend.
+
+    Args:
+        modifications: Layer values keyed by layer name (text or image source).
+        brand_colors: Pipeline brand colors, e.g. "#1a1a2e, #e94560".
+        template: Local template name.
+        pipeline_run_id, product_id, name: Where the local render is filed in the asset store.
+    """
+    if settings.BRANDING_BACKEND == "bannerbear":
+        from app.integrations.bannerbear_client import generate_image
+        return generate_image(settings.BANNERBEAR_TEMPLATE_ID, modifications)
+
+    image = render_template(load_template(template), modifications, brand_colors)
+    asset = put_bytes(
+        to_png_bytes(image),
+        pipeline_run_id=pipeline_run_id,
+        kind="branded_creative",
+        product_id=product_id,
+        name=name,
+        mime_type="image/png",
+    )
+    return {
+        "status": "completed",
+        "backend": "local",
+        "template": template,
+        "sha256": asset.sha256,
+        "url": public_url(asset.sha256),
+    }
+
+
+def render_template(template: dict, modifications: dict, brand_colors: str | list = None) -> Image.Image:
+    """Composite a template's layers into an image. Deterministic for equal inputs."""
+    palette = parse_brand_colors(brand_colors) or parse_brand_colors(DEFAULT_BRAND_COLORS)
+    width, height = template.get("size", [1080, 1080])
+    canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+
+    for layer in template.get("layers", []):
+        name = layer.get("name")
+        value = modifications.get(name) if name else None
+        if name and not value:
+            continue
+
+        layer_type = layer.get("type")
+        if layer_type == "fill":
+            canvas.alpha_composite(Image.new("RGBA", canvas.size, _color(layer, palette)))
+        elif layer_type == "rect":
+            _draw_rect(canvas, layer, palette)
+        elif layer_type == "image":
+            _draw_image(canvas, layer, value)
+        elif layer_type == "text":
+            _draw_text(canvas, layer, str(value), palette)
+        else:
+            raise ValueError(f"Unknown layer type: {layer_type}")
+
+    return canvas.convert("RGB")
+
+
+def _color(layer: dict, palette: list, key: str = "color") -> tuple:
+    """Resolve a layer color ("#hex" or "brand:N") to RGBA, applying its opacity."""
+    spec = str(layer.get(key, "#000000"))
+    if spec.startswith("brand:"):
+        rgb = palette[int(spec.split(":", 1)[1]) % len(palette)]
+    else:
+        rgb = parse_brand_colors([spec])[0]
+    return (*rgb[:3], round(255 * float(layer.get("opacity", 1))))
+
+
+def _draw_rect(canvas: Image.Image, layer: dict, palette: list):
+    overlay = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
+    ImageDraw.Draw(overlay).rectangle(layer["box"], fill=_color(layer, palette))
+    canvas.alpha_composite(overlay)
+
+
+def _draw_image(canvas: Image.Image, layer: dict, source):
+    """Place an image in the layer box, cropped to fill it (cover) or letterboxed (contain)."""
+    try:
+        image = source if isinstance(source, Image.Image) else load_image(source)
+    except Exception as e:
+        logger.warning("branding.image.failed", layer=layer.get("name"), error=str(e))
+        return
+
+    left, top, right, bottom = layer["box"]
+    size = (right - left, bottom - top)
+    image = image.convert("RGBA")
+
+    if layer.get("fit", "cover") == "cover":
+        image = ImageOps.fit(image, size, method=Image.Resampling.LANCZOS)
+        canvas.alpha_composite(image, (left, top))
+    else:
+        image = ImageOps.contain(image, size, method=Image.Resampling.LANCZOS)
+        offset = (left + (size[0] - image.width) // 2, top + (size[1] - image.height) // 2)
+        canvas.alpha_composite(image, offset)
+
+
+def _draw_text(canvas: Image.Image, layer: dict, text: str, palette: list):
+    """Word-wrap text into the layer box, truncating with an ellipsis past max_lines."""
+    left, top, right, bottom = layer["box"]
+    font = _font(layer.get("font"), int(layer.get("font_size", 32)))
+    draw = ImageDraw.Draw(canvas)
+
+    lines = _wrap(draw, text, font, right - left)
+    max_lines = int(layer.get("max_lines", len(lines) or 1))
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        last = lines[-1]
+        while last and draw.textlength(last + "…", font=font) > right - left:
+            last = last[:-1]
+        lines[-1] = last.rstrip() + "…"
+
+    line_height = round(font.size * float(layer.get("line_spacing", 1.2)))
+    y = top
+    for line in lines:
+        if y + font.size > bottom:
+            break
+        draw.text((left, y), line, font=font, fill=_color(layer, palette))
+        y += line_height
+
+
+def _wrap(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> list:
+    lines, current = [], ""
+    for word in text.split():
+        candidate = f"{current} {word}".strip()
+        if current and draw.textlength(candidate, font=font) > max_width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+@functools.lru_cache(maxsize=32)
+def _font(path: str, size: int):
+    if path:
+        return ImageFont.truetype(os.path.join(TEMPLATES_DIR, path), size)
+    return ImageFont.load_default(size=size)
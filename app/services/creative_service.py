@@ -25,14 +25,18 @@ def build_creative_brief(product_name: str, ad_copy: dict, brand_config: dict) -
 
     return {
         "product_name": product_name,
-        "total_images_needed": len(briefs) * 3,  # 3 formats each
+        "total_images_needed": len(briefs),  # one render each; other formats derived locally
         "briefs": briefs,
     }
 
 
-def estimate_creative_cost(num_variations: int = 4, formats_per_variation: int = 3) -> dict:
-    """Estimate the cost of generating ad creatives."""
-    total_images = num_variations * formats_per_variation
+def estimate_creative_cost(num_variations: int = 4, renders_per_variation: int = 1) -> dict:
+    """Estimate the cost of generating ad creatives.
+
+    Only the master image of each variation is rendered by Ideogram; the
+    other formats are derived locally at no cost.
+    """
+    total_images = num_variations * renders_per_variation
     cost_per_image = 0.03  # Ideogram Flash/Turbo pricing
 
     return {
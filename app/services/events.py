@@ -0,0 +1,88 @@
+"""Pipeline progress events — published to Redis Streams, pushed to clients over SSE.
+
+The orchestrator and agents publish structured events (phase started, step
+done, approval created, failed, ...). Each event is appended to the
+pipeline's own stream and to a global stream for the dashboard and live log.
+Stream entry ids double as SSE event ids, so a client that reconnects with
+Last-Event-ID resumes right after the last event it saw.
+"""
+
+import json
+import re
+import time
+from datetime import datetime, timezone
+
+import redis
+import structlog
+
+from app.utils.cache import get_redis
+from config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+GLOBAL_STREAM = "zeule:events"
+_ENTRY_ID = re.compile(r"^\d+(-\d+)?$")
+
+
+def pipeline_stream(pipeline_run_id: str) -> str:
+    return f"zeule:events:pipeline:{pipeline_run_id}"
+
+
+def publish(event_type: str, pipeline_run_id: str, **data):
+    """Publish a progress event. Never raises — progress is best-effort."""
+    payload = {
+        "type": event_type,
+        "pipeline_run_id": pipeline_run_id,
+        "at": datetime.now(timezone.utc).isoformat(),
+        **data,
+    }
+    fields = {"type": event_type, "data": json.dumps(payload, default=str)}
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        stream = pipeline_stream(pipeline_run_id)
+        pipe.xadd(stream, fields, maxlen=settings.EVENTS_PIPELINE_MAXLEN, approximate=True)
+        pipe.expire(stream, settings.EVENTS_RETENTION)
+        pipe.xadd(GLOBAL_STREAM, fields, maxlen=settings.EVENTS_GLOBAL_MAXLEN, approximate=True)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("events.publish_failed", event=event_type, pipeline_id=pipeline_run_id, error=str(e))
+
+
+def resume_id(last_event_id: str | None, default: str) -> str:
+    """Stream id to read after: the client's Last-Event-ID if valid, else `default`.
+
+    `default` is "0" to replay the whole stream or "$" for new events only.
+    """
+    if last_event_id and _ENTRY_ID.match(last_event_id):
+        return last_event_id
+    return default
+
+
+def sse_stream(stream: str, last_id: str):
+    """Generator of SSE frames for a Redis stream, starting after `last_id`.
+
+    Sends a keepalive comment every SSE_HEARTBEAT seconds and ends after
+    SSE_MAX_DURATION so server threads are recycled; EventSource reconnects
+    on its own and resumes via Last-Event-ID.
+    """
+    r = get_redis()
+    yield f"retry: {settings.SSE_RETRY_MS}\n\n"
+
+    try:
+        if last_id == "$":
+            # Pin "$" to a concrete id so events between reads aren't missed
+            latest = r.xrevrange(stream, count=1)
+            last_id = latest[0][0] if latest else "0"
+
+        deadline = time.monotonic() + settings.SSE_MAX_DURATION
+        while time.monotonic() < deadline:
+            entries = r.xread({stream: last_id}, count=100, block=settings.SSE_HEARTBEAT * 1000)
+            if not entries:
+                yield ": keepalive\n\n"
+                continue
+            for _, messages in entries:
+                for entry_id, fields in messages:
+                    last_id = entry_id
+                    yield f"id: {entry_id}\nevent: {fields.get('type', 'message')}\ndata: {fields.get('data', '{}')}\n\n"
+    except redis.RedisError as e:
+        logger.warning("events.stream_failed", stream=stream, error=str(e))
@@ -0,0 +1,127 @@
+"""Image service — local post-processing of generated images (Pillow)."""
+
+import io
+import os
+
+import structlog
+from PIL import Image, ImageColor
+
+from app.integrations.http import get_client
+from config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_PAD_COLOR = (26, 26, 46)  # #1a1a2e, the default brand background
+MAX_CROP_LOSS = 0.25  # crop when at most this share of the image is lost, else pad
+CROP_CANDIDATES = 9  # window positions tried by the smart crop
+
+
+def parse_aspect_ratio(aspect_ratio: str) -> float:
+    """Turn "4:5" into width / height."""
+    width, height = aspect_ratio.split(":")
+    return int(width) / int(height)
+
+
+def parse_brand_colors(brand_colors: str | list) -> list:
+    """Parse "#1a1a2e, #e94560" (or a list of colors) into RGB tuples, skipping bad values."""
+    if isinstance(brand_colors, str):
+        brand_colors = brand_colors.split(",")
+
+    colors = []
+    for value in brand_colors or []:
+        try:
+            colors.append(ImageColor.getrgb(str(value).strip()))
+        except ValueError:
+            continue
+    return colors
+
+
+def download_image(url: str, timeout: int = 60) -> Image.Image:
+    """Fetch an image from a URL into memory."""
+    response = get_client("downloads").get(url, timeout=timeout)
+    response.raise_for_status()
+    image = Image.open(io.BytesIO(response.content))
+    image.load()
+    return image
+
+
+def load_image(source: str) -> Image.Image:
+    """Load an image from a URL, or from a path (relative paths are under ASSETS_DIR)."""
+    if source.startswith(("http://", "https://")):
+        return download_image(source)
+
+    path = source if os.path.isabs(source) else os.path.join(settings.ASSETS_DIR, source)
+    image = Image.open(path)
+    image.load()
+    return image
+
+
+def to_png_bytes(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def derive_format(image: Image.Image, aspect_ratio: str, brand_colors: str | list = None) -> Image.Image:
+    """Re-frame an image to a new aspect ratio.
+
+    Small changes (e.g. 1:1 -> 4:5) use an entropy-guided crop that keeps the
+    busiest part of the image. Large ones (e.g. 1:1 -> 9:16) would cut too much
+    of the subject, so the image is padded with the first brand color instead.
+    """
+    image = image.convert("RGB")
+    width, height = image.size
+    target = parse_aspect_ratio(aspect_ratio)
+    current = width / height
+
+    if abs(current - target) < 1e-3:
+        return image.copy()
+
+    crop_loss = 1 - min(current, target) / max(current, target)
+    if crop_loss <= MAX_CROP_LOSS:
+        return _smart_crop(image, target)
+
+    colors = parse_brand_colors(brand_colors)
+    return _pad(image, target, colors[0] if colors else DEFAULT_PAD_COLOR)
+
+
+def _smart_crop(image: Image.Image, target: float) -> Image.Image:
+    """Crop to the target ratio, sliding the window to the highest-entropy position."""
+    width, height = image.size
+    if width / height > target:
+        crop_w, crop_h = round(height * target), height
+    else:
+        crop_w, crop_h = width, round(width / target)
+
+    # Score candidate windows on a small grayscale copy to keep this cheap
+    scale = 256 / max(width, height)
+    preview = image.convert("L").resize((max(1, round(width * scale)), max(1, round(height * scale))))
+
+    # Try positions from the centre outwards so ties (e.g. flat images) stay centred
+    middle = (CROP_CANDIDATES - 1) / 2
+    positions = sorted(range(CROP_CANDIDATES), key=lambda i: abs(i - middle))
+
+    best_box, best_score = None, -1.0
+    for i in positions:
+        offset_x = round((width - crop_w) * i / (CROP_CANDIDATES - 1))
+        offset_y = round((height - crop_h) * i / (CROP_CANDIDATES - 1))
+        box = (offset_x, offset_y, offset_x + crop_w, offset_y + crop_h)
+        score = preview.crop(tuple(round(v * scale) for v in box)).entropy()
+        if score > best_score + 1e-6:
+            best_box, best_score = box, score
+
+    return image.crop(best_box)
+
+
+def _pad(image: Image.Image, target: float, color: tuple) -> Image.Image:
+    """Letterbox the image onto a brand-colored canvas of the target ratio."""
+    width, height = image.size
+    if width / height > target:
+        canvas_size = (width, round(width / target))
+    else:
+        canvas_size = (round(height * target), height)
+
+    canvas = Image.new("RGB", canvas_size, color)
+    canvas.paste(image, ((canvas_size[0] - width) // 2, (canvas_size[1] - height) // 2))
+    return canvas
+
@@ -1,15 +1,27 @@
 """Learning service — feedback loops and performance tracking."""
 
+import uuid
 import structlog
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app import db
 from app.models.learning import LearningLog
 from app.models.ad_performance import AdPerformance
 from app.models.product import Product
+from app.models.product_performance import ProductPerformance
+from app.models.sync_state import SyncState
+from app.services import rollups, timeseries
+from config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+PURCHASE_ACTION_TYPES = ("omni_purchase", "purchase", "offsite_conversion.fb_pixel_purchase")
+UPSERT_KEY = ("product_id", "campaign_id", "ad_id", "date")
+UPSERT_BATCH_SIZE = 1000
+
 
 def get_niche_insights(niche: str, phase_number: int = None) -> dict:
     """Get accumulated learning insights for a niche."""
@@ -39,87 +51,192 @@ def get_niche_insights(niche: str, phase_number: int = None) -> dict:
 
 
 def sync_all_ad_performance():
-    """Sync Meta Ads performance data for all active products."""
-    products = Product.query.filter_by(status="published").all()
+    """Sync Meta Ads performance for the ad account — one row per ad per day.
+
+    Pulls account-level insights incrementally: from the account's
+    high-water mark, minus META_INSIGHTS_LOOKBACK_DAYS that Meta may still
+    restate through late attribution, up to today.
+    """
+    campaigns = _campaign_products()
+    if not campaigns:
+        return
 
-    for product in products:
-        if not product.assets:
-            continue
+    key = f"meta_insights:act_{settings.META_ADS_ACCOUNT_ID}"
+    state = SyncState.query.get(key) or SyncState(key=key)
+    today = date.today()
+    if state.synced_through:
+        since = state.synced_through - timedelta(days=settings.META_INSIGHTS_LOOKBACK_DAYS)
+    else:
+        since = today - timedelta(days=settings.META_INSIGHTS_INITIAL_DAYS)
+
+    from app.integrations.meta_ads import get_account_insights
+    rows = get_account_insights(since.isoformat(), today.isoformat())
+
+    records = [
+        _performance_record(campaigns[row["campaign_id"]], row)
+        for row in rows
+        if row.get("campaign_id") in campaigns  # skip non-ZEULE campaigns
+    ]
+    changed = upsert_ad_performance(records)
+    if changed:
+        refresh_product_performance(changed)
+        timeseries.refresh_ad_rollups(changed, since)
+        rescored_since = _update_learning_scores(changed)
+        if rescored_since:
+            timeseries.refresh_learning_rollups(rescored_since)
+
+    state.synced_through = today
+    state.last_run_at = datetime.now(timezone.utc)
+    db.session.add(state)
+    db.session.commit()
 
-        campaign_id = (product.assets or {}).get("campaign_id")
-        if not campaign_id:
-            continue
+    logger.info("sync.ads.done", since=since.isoformat(), rows=len(rows), changed_products=len(changed))
 
-        try:
-            from app.integrations.meta_ads import get_campaign_insights
-            insights = get_campaign_insights(campaign_id)
 
-            for day_data in insights.get("data", []):
-                _save_daily_performance(product.id, campaign_id, day_data)
+def _campaign_products() -> dict:
+    """Map Meta campaign id -> product id for published products."""
+    products = Product.query.filter_by(status="published").all()
+    return {
+        product.assets["campaign_id"]: product.id
+        for product in products
+        if (product.assets or {}).get("campaign_id")
+    }
 
-            # Update learning log scores
-            _update_learning_scores(product)
 
-        except Exception as e:
-            logger.warning("sync.product.failed", product_id=product.id, error=str(e))
+def upsert_ad_performance(records: list) -> set:
+    """Bulk insert-or-update AdPerformance rows keyed on (product, campaign, ad, date).
+
+    Runs one INSERT ... ON CONFLICT DO UPDATE per UPSERT_BATCH_SIZE records;
+    rows whose metrics are unchanged are left alone. Returns the ids of
+    products with new or changed rows. The caller commits.
+    """
+    # A statement may touch each key only once; the latest record wins
+    records = list({tuple(r[k] for k in UPSERT_KEY): r for r in records}.values())
+    update_columns = [c for c in records[0] if c not in (*UPSERT_KEY, "id")] if records else []
+    metric_columns = [c for c in update_columns if c != "fetched_at"]
+    table = AdPerformance.__table__
+
+    changed = set()
+    for start in range(0, len(records), UPSERT_BATCH_SIZE):
+        stmt = pg_insert(AdPerformance).values(records[start:start + UPSERT_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(UPSERT_KEY),
+            set_={column: stmt.excluded[column] for column in update_columns},
+            where=or_(*[table.c[column].is_distinct_from(stmt.excluded[column]) for column in metric_columns]),
+        ).returning(table.c.product_id)
+        changed.update(db.session.execute(stmt).scalars())
+    return changed
+
+
+def refresh_product_performance(product_ids: set):
+    """Recompute the product_performance rollup for these products in one statement.
+
+    The dashboard's ad totals move by the difference.
+    """
+    spend, revenue = func.sum(AdPerformance.spend), func.sum(AdPerformance.revenue)
+    roas = case((spend > 0, revenue / spend), else_=None)
+    totals = (
+        db.select(
+            AdPerformance.product_id,
+            func.coalesce(func.sum(AdPerformance.impressions), 0),
+            func.coalesce(func.sum(AdPerformance.clicks), 0),
+            func.coalesce(func.sum(AdPerformance.conversions), 0),
+            func.coalesce(spend, 0),
+            func.coalesce(revenue, 0),
+            roas,
+            func.least(100, roas * 25),  # ROAS of 3x = score of 75
+            func.now(),
+        )
+        .where(AdPerformance.product_id.in_(product_ids))
+        .group_by(AdPerformance.product_id)
+    )
+    columns = [
+        "product_id", "impressions", "clicks", "conversions",
+        "spend", "revenue", "roas", "score", "updated_at",
+    ]
+    stmt = pg_insert(ProductPerformance).from_select(columns, totals)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["product_id"],
+        set_={column: stmt.excluded[column] for column in columns[1:]},
+    )
+    before = rollups.ad_totals(product_ids)
+    db.session.execute(stmt)
+    rollups.add_ad_totals(before, rollups.ad_totals(product_ids))
 
 
-def _save_daily_performance(product_id: str, campaign_id: str, data: dict):
-    """Save daily ad performance data."""
-    today = date.today()
+def _performance_record(product_id: str, data: dict) -> dict:
+    """One ad's insights for one day, as an ad_performance row."""
+    spend = float(data.get("spend", 0))
+    revenue = _purchase_total(data.get("action_values"))
+    return {
+        "id": str(uuid.uuid4()),
+        "product_id": product_id,
+        "campaign_id": data.get("campaign_id"),
+        "ad_id": data.get("ad_id"),
+        "date": date.fromisoformat(data["date_start"]),
+        "ad_set_id": data.get("adset_id"),
+        "creative_variant": _creative_variant(data.get("ad_name")),
+        "impressions": int(data.get("impressions", 0)),
+        "clicks": int(data.get("clicks", 0)),
+        "spend": spend,
+        "ctr": float(data.get("ctr", 0)),
+        "cpc": float(data.get("cpc", 0)),
+        "conversions": int(_purchase_total(data.get("actions"))),
+        "revenue": revenue,
+        "roas": revenue / spend if spend else None,
+        "fetched_at": datetime.now(timezone.utc),
+    }
 
-    existing = AdPerformance.query.filter_by(
-        product_id=product_id,
-        campaign_id=campaign_id,
-        date=today,
-    ).first()
-
-    if existing:
-        existing.impressions = int(data.get("impressions", 0))
-        existing.clicks = int(data.get("clicks", 0))
-        existing.spend = float(data.get("spend", 0))
-        existing.ctr = float(data.get("ctr", 0))
-        existing.cpc = float(data.get("cpc", 0))
-    else:
-        perf = AdPerformance(
-            product_id=product_id,
-            campaign_id=campaign_id,
-            impressions=int(data.get("impressions", 0)),
-            clicks=int(data.get("clicks", 0)),
-            spend=float(data.get("spend", 0)),
-            ctr=float(data.get("ctr", 0)),
-            cpc=float(data.get("cpc", 0)),
-            date=today,
-        )
-        db.session.add(perf)
 
-    db.session.commit()
+def _purchase_total(actions: list) -> float:
+    """Purchases (or their value) from an insights actions list.
 
+    Meta reports the same purchases under several action types, so take the
+    first one present rather than summing them.
+    """
+    by_type = {a.get("action_type"): float(a.get("value", 0)) for a in actions or []}
+    for action_type in PURCHASE_ACTION_TYPES:
+        if action_type in by_type:
+            return by_type[action_type]
+    return 0.0
 
-def _update_learning_scores(product: Product):
-    """Back-fill performance scores on learning logs based on ad data."""
-    # Calculate average ROAS for this product
-    performances = AdPerformance.query.filter_by(product_id=product.id).all()
-    if not performances:
-        return
 
-    total_spend = sum(p.spend or 0 for p in performances)
-    total_revenue = sum(p.revenue or 0 for p in performances)
+def _creative_variant(ad_name: str) -> str | None:
+    """Ad name "<product> - Ad 2" -> "variation_2" (see meta_ads.ad_name)."""
+    from app.integrations.meta_ads import ad_variation
 
-    if total_spend > 0:
-        roas = total_revenue / total_spend
-        # Normalize to 0-100 score (ROAS of 3x = score of 75)
-        score = min(100, roas * 25)
-    else:
-        score = None
+    if not ad_name:
+        return None
+    variation = ad_variation(ad_name)
+    return f"variation_{variation}" if variation else ad_name[:100]
 
-    # Update learning logs for this product's pipeline
-    logs = LearningLog.query.filter_by(
-        pipeline_run_id=product.pipeline_run_id
-    ).all()
 
-    for log in logs:
-        log.performance_score = score
+def _update_learning_scores(product_ids: set) -> date | None:
+    """Back-fill performance scores on the learning logs of these products' pipelines.
 
-    db.session.commit()
-    logger.info("learning.scores_updated", product_id=product.id, score=score)
+    One UPDATE: each pipeline's score is its products' combined ROAS from the
+    rollup, normalized to 0-100 (ROAS of 3x = score of 75). Returns the day
+    of the oldest log updated, if any.
+    """
+    spend, revenue = func.sum(ProductPerformance.spend), func.sum(ProductPerformance.revenue)
+    pipeline_scores = (
+        db.select(
+            Product.pipeline_run_id,
+            case((spend > 0, func.least(100, revenue / spend * 25)), else_=None).label("score"),
+        )
+        .join(ProductPerformance, ProductPerformance.product_id == Product.id)
+        .where(Product.pipeline_run_id.in_(
+            db.select(Product.pipeline_run_id).where(Product.id.in_(product_ids))
+        ))
+        .group_by(Product.pipeline_run_id)
+        .subquery()
+    )
+    created = db.session.execute(
+        db.update(LearningLog)
+        .where(LearningLog.pipeline_run_id == pipeline_scores.c.pipeline_run_id)
+        .values(performance_score=pipeline_scores.c.score)
+        .returning(LearningLog.created_at)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+    logger.info("learning.scores_updated", products=len(product_ids), logs=len(created))
+    return min(created).date() if created else None
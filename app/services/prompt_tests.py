@@ -0,0 +1,410 @@
+"""Prompt test runs, run in the background.
+
+matrix — versions x sample variable sets x providers. Every cell renders a
+         prompt version and calls a provider; responses are diffed against
+         the first version's for the same variables and provider.
+replay — offline regression: the prompt's agent is re-run in dry-run mode
+         with the candidate version on the inputs of past completed phases,
+         and each new output is compared with the output the phase produced.
+
+The API creates a PromptTestRun and queues it; a Celery worker runs the cells
+in parallel and stores per-cell latency, token usage and quality scores.
+"""
+
+import difflib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import structlog
+from flask import current_app
+
+from app import db
+from app.models.learning import LearningLog
+from app.models.phase_result import PhaseResult
+from app.models.pipeline_run import PipelineRun
+from app.models.prompt_template import PromptTemplate
+from app.models.prompt_test_run import PromptTestRun
+from app.orchestrator.engine import get_agent
+from app.orchestrator.state import PhaseStatus
+from app.utils.llm_usage import track_usage
+from config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+PROVIDERS = ("openai", "anthropic")
+
+# Agents whose output is driven by their prompts. The designer and campaign
+# launcher generate images and launch campaigns — nothing to replay offline.
+REPLAYABLE_AGENTS = (
+    "trend_discovery",
+    "niche_validator",
+    "audience_profiler",
+    "product_architect",
+    "content_writer",
+    "funnel_builder",
+)
+
+# Bookkeeping and side-effect keys in agent outputs, left out of comparisons
+IGNORED_OUTPUT_KEYS = ("phase", "agent", "products_created", "stripe", "ghl")
+
+COMPARE_CHARS = 20000  # similarity is quadratic in the worst case
+AVERAGED = ("similarity", "key_coverage", "original_latency_ms")
+
+
+def create_run(
+    prompt: PromptTemplate,
+    versions: list = None,
+    variable_sets: list = None,
+    providers: list = None,
+    bypass_cache: bool = False,
+) -> PromptTestRun:
+    """Validate a test matrix for `prompt`'s template and store it as a queued run.
+
+    `versions` defaults to just this prompt's version; raises ValueError for
+    unknown versions or providers, or a matrix over PROMPT_TEST_MAX_CELLS.
+    """
+    versions = versions or [prompt.version]
+    variable_sets = variable_sets or [{}]
+    providers = providers or ["openai"]
+
+    unknown = [p for p in providers if p not in PROVIDERS]
+    if unknown:
+        raise ValueError(f"Unknown providers: {unknown}. Allowed: {', '.join(PROVIDERS)}")
+
+    templates = {
+        t.version: t
+        for t in PromptTemplate.query.filter(
+            PromptTemplate.template_key == prompt.template_key,
+            PromptTemplate.version.in_(versions),
+        )
+    }
+    missing = [v for v in versions if v not in templates]
+    if missing:
+        raise ValueError(f"Versions not found for {prompt.template_key}: {missing}")
+
+    cells = len(versions) * len(variable_sets) * len(providers)
+    if cells > settings.PROMPT_TEST_MAX_CELLS:
+        raise ValueError(f"{cells} test cells requested, the limit is {settings.PROMPT_TEST_MAX_CELLS}")
+
+    run = PromptTestRun(
+        template_key=prompt.template_key,
+        kind="matrix",
+        config={
+            "prompt_ids": [templates[v].id for v in versions],
+            "versions": versions,
+            "variable_sets": variable_sets,
+            "providers": providers,
+            "bypass_cache": bypass_cache,
+        },
+    )
+    db.session.add(run)
+    db.session.commit()
+    return run
+
+
+def create_replay(
+    prompt: PromptTemplate,
+    limit: int = None,
+    phase_result_ids: list = None,
+    niche: str = None,
+) -> PromptTestRun:
+    """Queue a replay of `prompt` on the latest completed phases of its agent.
+
+    Picks up to `limit` (capped at PROMPT_REPLAY_MAX_INPUTS) phase results,
+    optionally restricted to `phase_result_ids` or a niche; the selection is
+    stored with the run so it can be compared across prompt versions.
+    Raises ValueError if the agent can't be replayed or has no history.
+    """
+    if prompt.agent_name not in REPLAYABLE_AGENTS:
+        raise ValueError(
+            f"{prompt.agent_name} prompts can't be replayed. Allowed agents: {', '.join(REPLAYABLE_AGENTS)}"
+        )
+    limit = min(limit or settings.PROMPT_REPLAY_DEFAULT_INPUTS, settings.PROMPT_REPLAY_MAX_INPUTS)
+
+    query = db.session.query(PhaseResult.id).filter(
+        PhaseResult.agent_name == prompt.agent_name,
+        PhaseResult.status == PhaseStatus.COMPLETED,
+        PhaseResult.input_data.isnot(None),
+    )
+    if phase_result_ids:
+        query = query.filter(PhaseResult.id.in_(phase_result_ids))
+    if niche:
+        query = query.join(PipelineRun, PipelineRun.id == PhaseResult.pipeline_run_id).filter(
+            PipelineRun.niche == niche
+        )
+    ids = [row.id for row in query.order_by(PhaseResult.created_at.desc()).limit(limit)]
+    if not ids:
+        raise ValueError(f"No completed {prompt.agent_name} phases to replay")
+
+    run = PromptTestRun(
+        template_key=prompt.template_key,
+        kind="replay",
+        config={
+            "prompt_id": prompt.id,
+            "version": prompt.version,
+            "agent_name": prompt.agent_name,
+            "phase_result_ids": ids,
+        },
+    )
+    db.session.add(run)
+    db.session.commit()
+    return run
+
+
+def execute_run(run_id: str) -> PromptTestRun:
+    """Run every cell of a queued test run, in parallel, and store the results."""
+    run = PromptTestRun.query.get(run_id)
+    if not run:
+        raise ValueError(f"Prompt test run {run_id} not found")
+
+    run.status = "running"
+    run.started_at = datetime.now(timezone.utc)
+    db.session.commit()
+
+    try:
+        if run.kind == "replay":
+            results = _execute_replay(run.config)
+            run.summary = _summarize(results, group_by=("version",))
+        else:
+            results = _execute_matrix(run.template_key, run.config)
+            run.summary = _summarize(results, group_by=("version", "provider"))
+        run.results = results
+        run.status = "completed"
+    except Exception as e:
+        logger.error("prompt_test.failed", run_id=run_id, kind=run.kind, error=str(e))
+        run.status = "failed"
+        run.error_message = str(e)
+
+    run.completed_at = datetime.now(timezone.utc)
+    db.session.commit()
+    return run
+
+
+def _run_parallel(fn, cells: list) -> list:
+    """fn(cell) for every cell on PROMPT_TEST_CONCURRENCY threads, each in its own app context."""
+    app = current_app._get_current_object()
+
+    def call(cell):
+        with app.app_context():
+            return fn(cell)
+
+    workers = max(1, min(settings.PROMPT_TEST_CONCURRENCY, len(cells)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(call, cells))
+
+
+def _measure(result: dict, fn, *args):
+    """Run fn, recording its output (or error), latency and token usage on `result`."""
+    with track_usage() as usage:
+        start = time.perf_counter()
+        try:
+            output, error = fn(*args), None
+        except Exception as e:
+            output, error = None, str(e)
+        result["latency_ms"] = round((time.perf_counter() - start) * 1000)
+
+    result["error"] = error
+    result["input_tokens"] = usage.input_tokens
+    result["output_tokens"] = usage.output_tokens
+    result["cached"] = error is None and usage.calls == 0
+    return output
+
+
+# --- matrix -----------------------------------------------------------------
+
+def _execute_matrix(template_key: str, config: dict) -> list:
+    templates = {t.id: t for t in PromptTemplate.query.filter(PromptTemplate.id.in_(config["prompt_ids"]))}
+    cells = [
+        {
+            "version": templates[prompt_id].version,
+            "prompt_id": prompt_id,
+            "variables_index": index,
+            "provider": provider,
+            "rendered_prompt": templates[prompt_id].render(**variables),
+        }
+        for prompt_id in config["prompt_ids"]
+        for index, variables in enumerate(config["variable_sets"])
+        for provider in config["providers"]
+    ]
+    bypass_cache = config.get("bypass_cache", False)
+
+    def run_cell(cell):
+        result = dict(cell)
+        result["response"] = _measure(
+            result, _call, cell["provider"], cell["rendered_prompt"], template_key, bypass_cache
+        )
+        return result
+
+    results = _run_parallel(run_cell, cells)
+    _add_diffs(results, baseline_version=config["versions"][0])
+    return results
+
+
+def _call(provider: str, prompt: str, template_key: str, bypass_cache: bool):
+    # Same cache as the pipeline: re-testing unchanged text is free unless bypassed
+    if provider == "anthropic":
+        from app.integrations.anthropic_client import call_anthropic
+        return call_anthropic(prompt, json_mode=False, cache_template=template_key, bypass_cache=bypass_cache)
+    from app.integrations.openai_client import call_openai
+    return call_openai(prompt, json_mode=False, cache_template=template_key, bypass_cache=bypass_cache)
+
+
+def _add_diffs(results: list, baseline_version: int):
+    """Diff each response against the baseline version's for the same variables and provider."""
+    baselines = {
+        (r["variables_index"], r["provider"]): r
+        for r in results
+        if r["version"] == baseline_version
+    }
+    for result in results:
+        baseline = baselines.get((result["variables_index"], result["provider"]))
+        if result["version"] == baseline_version or not baseline or result["error"] or baseline["error"]:
+            result["diff"] = None
+            continue
+        result.update(_compare(
+            str(baseline["response"]), str(result["response"]),
+            f"v{baseline_version}", f"v{result['version']}",
+        ))
+
+
+# --- replay -----------------------------------------------------------------
+
+def _execute_replay(config: dict) -> list:
+    phase_results = (
+        PhaseResult.query.filter(PhaseResult.id.in_(config["phase_result_ids"]))
+        .options(db.undefer_group("payload"))
+        .order_by(PhaseResult.created_at.desc())
+        .all()
+    )
+    feedback = _original_feedback(phase_results)
+    cells = [
+        {
+            "version": config["version"],
+            "phase_result_id": pr.id,
+            "pipeline_run_id": pr.pipeline_run_id,
+            "niche": (pr.input_data or {}).get("niche"),
+            "input_data": pr.input_data,
+            "original_output": pr.output_data,
+            "original_latency_ms": round(pr.duration_seconds * 1000) if pr.duration_seconds is not None else None,
+            "original_feedback": feedback.get((pr.pipeline_run_id, pr.phase_number), {}).get("feedback"),
+            "original_performance_score": feedback.get((pr.pipeline_run_id, pr.phase_number), {}).get("score"),
+        }
+        for pr in phase_results
+    ]
+
+    def run_cell(cell):
+        candidate = PromptTemplate.query.get(config["prompt_id"])
+        agent = get_agent(
+            config["agent_name"], dry_run=True, prompt_overrides={candidate.template_key: candidate}
+        )
+        # Cells already run in parallel; nested step threads would multiply DB connections
+        agent.max_concurrency = 1
+        result = {k: v for k, v in cell.items() if k != "input_data"}
+        # No pipeline id: replays publish no progress events
+        result["output"] = _measure(result, agent.execute, None, cell["input_data"], cell["phase_result_id"])
+        if result["error"] is None:
+            result.update(_score_output(cell["original_output"], result["output"], config["version"]))
+        return result
+
+    return _run_parallel(run_cell, cells)
+
+
+def _original_feedback(phase_results: list) -> dict:
+    """Latest approval feedback and ad performance score per (pipeline, phase)."""
+    if not phase_results:
+        return {}
+    logs = (
+        db.session.query(
+            LearningLog.pipeline_run_id, LearningLog.phase_number,
+            LearningLog.feedback, LearningLog.performance_score,
+        )
+        .filter(
+            LearningLog.pipeline_run_id.in_({pr.pipeline_run_id for pr in phase_results}),
+            LearningLog.phase_number == phase_results[0].phase_number,
+        )
+        .order_by(LearningLog.created_at)
+        .all()
+    )
+    return {(log.pipeline_run_id, log.phase_number): {"feedback": log.feedback, "score": log.performance_score} for log in logs}
+
+
+def _score_output(original: dict, output: dict, version: int) -> dict:
+    """Quality of a replayed output relative to the phase's original output.
+
+    key_coverage — share of the original's non-empty sections that are
+                   non-empty and not an {"error": ...} in the new output.
+    step_errors  — sections of the new output that are {"error": ...}.
+    similarity / diff — over the outputs as pretty-printed JSON.
+    """
+    original = {k: v for k, v in (original or {}).items() if k not in IGNORED_OUTPUT_KEYS}
+    output = {k: v for k, v in (output or {}).items() if k not in IGNORED_OUTPUT_KEYS}
+
+    def failed(value):
+        return isinstance(value, dict) and "error" in value
+
+    def present(value):
+        return value not in (None, "", [], {}) and not failed(value)
+
+    sections = [k for k, v in original.items() if present(v)]
+    scores = {
+        "key_coverage": round(sum(1 for k in sections if present(output.get(k))) / len(sections), 3) if sections else None,
+        "step_errors": sum(1 for v in output.values() if failed(v)),
+    }
+    scores.update(_compare(_as_text(original), _as_text(output), "original", f"v{version}"))
+    return scores
+
+
+def _as_text(value) -> str:
+    return json.dumps(value, indent=1, sort_keys=True, ensure_ascii=False, default=str)
+
+
+# --- scoring ----------------------------------------------------------------
+
+def _compare(before: str, after: str, before_name: str, after_name: str) -> dict:
+    diff = list(difflib.unified_diff(
+        before.splitlines(), after.splitlines(), fromfile=before_name, tofile=after_name, lineterm="",
+    ))
+    similarity = difflib.SequenceMatcher(None, before[:COMPARE_CHARS], after[:COMPARE_CHARS]).ratio()
+    return {
+        "diff": "\n".join(diff[:settings.PROMPT_TEST_MAX_DIFF_LINES]),
+        "similarity": round(similarity, 3),
+    }
+
+
+def _summarize(results: list, group_by: tuple) -> list:
+    """Latency, token totals and average quality scores per group."""
+    groups = {}
+    for r in results:
+        group = groups.setdefault(tuple(r[k] for k in group_by), {
+            **{k: r[k] for k in group_by},
+            "cells": 0,
+            "errors": 0,
+            "cached": 0,
+            "latency_ms": [],
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "averaged": {name: [] for name in AVERAGED},
+        })
+        group["cells"] += 1
+        group["errors"] += 1 if r["error"] else 0
+        group["cached"] += 1 if r["cached"] else 0
+        group["input_tokens"] += r["input_tokens"]
+        group["output_tokens"] += r["output_tokens"]
+        if not r["error"] and not r["cached"]:
+            group["latency_ms"].append(r["latency_ms"])
+        for name in AVERAGED:
+            if r.get(name) is not None:
+                group["averaged"][name].append(r[name])
+
+    summary = []
+    for group in groups.values():
+        latencies = sorted(group.pop("latency_ms"))
+        group["avg_latency_ms"] = round(sum(latencies) / len(latencies)) if latencies else None
+        group["max_latency_ms"] = latencies[-1] if latencies else None
+        for name, values in group.pop("averaged").items():
+            if values:
+                group[f"avg_{name}"] = round(sum(values) / len(values), 3)
+        summary.append(group)
+    return summary
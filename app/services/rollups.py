@@ -0,0 +1,185 @@
+"""Dashboard rollups — counters kept current as data changes, read in one query.
+
+Pipeline status counts, product status and niche counts, and approval
+feedback per phase are adjusted by deltas in the same transaction as the
+change that causes them (an after_flush hook), and ad spend/revenue totals
+are adjusted whenever the ad sync refreshes product_performance. Dashboard
+endpoints read the dashboard_counters table, cached for a few seconds, so
+their cost doesn't grow with history. rebuild_counters() recomputes
+everything from the base tables (run by seed.py).
+
+Only ORM flushes are counted: bulk `query.update()` / `query.delete()` and
+Core statements on tracked tables skip the hook, so the counters drift until
+rebuild_counters() corrects them. The counter rows a flush touches stay
+locked until its transaction commits; they are always upserted in
+(metric, key) order so concurrent transactions can't deadlock on them.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app import db
+from app.models.dashboard_counter import DashboardCounter
+from app.models.learning import LearningLog
+from app.models.pipeline_run import PipelineRun
+from app.models.product import Product
+from app.models.product_performance import ProductPerformance
+from app.utils.cache import MISS, RedisCache
+from config.settings import settings
+
+AD_TOTALS = ("spend", "revenue", "clicks", "impressions", "conversions")
+
+dashboard_cache = RedisCache("dashboard", max_entries=8)
+
+# model -> (tracked attributes, counters an instance with those values falls under)
+TRACKED = {
+    PipelineRun: (("status",), lambda v: [("pipelines.status", v["status"])]),
+    Product: (("status", "niche"), lambda v: [("products.status", v["status"]), ("products.niche", v["niche"])]),
+    LearningLog: (
+        ("phase_number", "feedback"),
+        lambda v: [("learning.feedback", f"{v['phase_number']}:{v['feedback'] or ''}")],
+    ),
+}
+
+
+def _noop(target, value, oldvalue, initiator):
+    pass
+
+
+# active_history loads the old value on assignment, so the flush hook can
+# decrement the counter a changed row leaves even if it was expired
+for _model, (_attrs, _) in TRACKED.items():
+    for _attr in _attrs:
+        event.listen(getattr(_model, _attr), "set", _noop, active_history=True)
+
+
+def _values(obj, attrs, old: bool) -> dict:
+    values = {}
+    for attr in attrs:
+        history = inspect(obj).attrs[attr].history
+        if old and history.deleted:
+            values[attr] = history.deleted[0]
+        elif history.unchanged:
+            values[attr] = history.unchanged[0]
+        elif history.added and not old:
+            values[attr] = history.added[0]
+        else:
+            values[attr] = getattr(obj, attr)
+    return values
+
+
+@event.listens_for(Session, "after_flush")
+def _count_changes(session, flush_context):
+    deltas = defaultdict(float)
+
+    for obj in session.new:
+        if type(obj) in TRACKED:
+            attrs, counters = TRACKED[type(obj)]
+            for counter in counters(_values(obj, attrs, old=False)):
+                deltas[counter] += 1
+
+    for obj in session.deleted:
+        if type(obj) in TRACKED:
+            attrs, counters = TRACKED[type(obj)]
+            for counter in counters(_values(obj, attrs, old=True)):
+                deltas[counter] -= 1
+
+    for obj in session.dirty:
+        if type(obj) not in TRACKED or obj in session.deleted:
+            continue
+        attrs, counters = TRACKED[type(obj)]
+        state = inspect(obj)
+        if not any(state.attrs[attr].history.has_changes() for attr in attrs):
+            continue
+        for counter in counters(_values(obj, attrs, old=True)):
+            deltas[counter] -= 1
+        for counter in counters(_values(obj, attrs, old=False)):
+            deltas[counter] += 1
+
+    deltas = {counter: delta for counter, delta in deltas.items() if delta}
+    if deltas:
+        increment(deltas, connection=session.connection())
+
+
+def increment(deltas: dict, connection=None):
+    """Add {(metric, key): delta} to the counters in one upsert."""
+    now = datetime.now(timezone.utc)
+    # Rows are locked in VALUES order; a fixed order keeps opposite moves
+    # (X -> Y vs Y -> X) in concurrent transactions from deadlocking
+    rows = [
+        {"metric": metric, "key": str(key), "value": delta, "updated_at": now}
+        for (metric, key), delta in deltas.items()
+    ]
+    rows.sort(key=lambda row: (row["metric"], row["key"]))
+    stmt = pg_insert(DashboardCounter).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["metric", "key"],
+        set_={
+            "value": DashboardCounter.value + stmt.excluded.value,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    (connection or db.session).execute(stmt)
+
+
+def ad_totals(product_ids) -> dict:
+    """Current product_performance totals over these products."""
+    row = db.session.execute(
+        db.select(*[func.coalesce(func.sum(getattr(ProductPerformance, m)), 0) for m in AD_TOTALS])
+        .where(ProductPerformance.product_id.in_(product_ids))
+    ).one()
+    return dict(zip(AD_TOTALS, row))
+
+
+def add_ad_totals(before: dict, after: dict):
+    """Apply the change in ad totals from a product_performance refresh."""
+    deltas = {("ads", m): float(after[m]) - float(before[m]) for m in AD_TOTALS if after[m] != before[m]}
+    if deltas:
+        increment(deltas)
+
+
+def counters() -> dict:
+    """All counters as {metric: {key: value}}, cached for DASHBOARD_CACHE_TTL seconds."""
+    cached = dashboard_cache.get("counters", group="counters")
+    if cached is not MISS:
+        return cached
+
+    result = defaultdict(dict)
+    for metric, key, value in db.session.execute(
+        db.select(DashboardCounter.metric, DashboardCounter.key, DashboardCounter.value)
+    ):
+        result[metric][key] = value
+    result = dict(result)
+    dashboard_cache.set("counters", result, settings.DASHBOARD_CACHE_TTL)
+    return result
+
+
+def rebuild_counters():
+    """Recompute every counter from the base tables. The caller commits."""
+    db.session.query(DashboardCounter).delete()
+    deltas = {}
+
+    for status, count in db.session.query(PipelineRun.status, func.count()).group_by(PipelineRun.status):
+        deltas[("pipelines.status", status)] = count
+    for status, count in db.session.query(Product.status, func.count()).group_by(Product.status):
+        deltas[("products.status", status)] = count
+    for niche, count in db.session.query(Product.niche, func.count()).group_by(Product.niche):
+        deltas[("products.niche", niche)] = count
+    for phase, feedback, count in db.session.query(
+        LearningLog.phase_number, LearningLog.feedback, func.count()
+    ).group_by(LearningLog.phase_number, LearningLog.feedback):
+        deltas[("learning.feedback", f"{phase}:{feedback or ''}")] = count
+
+    totals = db.session.execute(
+        db.select(*[func.coalesce(func.sum(getattr(ProductPerformance, m)), 0) for m in AD_TOTALS])
+    ).one()
+    for metric, total in zip(AD_TOTALS, totals):
+        deltas[("ads", metric)] = float(total)
+
+    if deltas:
+        increment(deltas)
+    dashboard_cache.delete("counters")
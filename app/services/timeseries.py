@@ -0,0 +1,255 @@
+"""Time-series analytics — daily and weekly rollups plus ad-hoc slicing in memory.
+
+The ad sync keeps two rollup tables current:
+
+- ad_rollups: ad metrics per bucket, product and creative variant (with the
+  product's niche and type), refreshed for the products and days it synced.
+- learning_rollups: approval feedback and performance scores per bucket,
+  phase, agent, niche and outcome.
+
+query() answers "ROAS by niche by week" style questions from those tables
+only: it loads the rollup rows for the range as columns and aggregates them
+by whatever dimensions were asked for, then derives ratios from the summed
+measures. The raw ad_performance and learning_logs tables are never scanned
+at query time.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import Date, cast, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app import db
+from app.models.ad_performance import AdPerformance
+from app.models.ad_rollup import AdRollup
+from app.models.learning import LearningLog
+from app.models.learning_rollup import LearningRollup
+from app.models.product import Product
+from config.settings import settings
+
+BUCKETS = ("day", "week")
+
+SOURCES = {
+    "ads": {
+        "model": AdRollup,
+        "dimensions": {
+            "niche": "niche",
+            "product_type": "product_type",
+            "creative_variant": "creative_variant",
+            "product_id": "product_id",
+        },
+        "measures": ("impressions", "clicks", "conversions", "spend", "revenue"),
+        "metrics": {
+            "impressions": lambda m: m["impressions"],
+            "clicks": lambda m: m["clicks"],
+            "conversions": lambda m: m["conversions"],
+            "spend": lambda m: round(m["spend"], 2),
+            "revenue": lambda m: round(m["revenue"], 2),
+            "roas": lambda m: _ratio(m["revenue"], m["spend"]),
+            "ctr": lambda m: _ratio(m["clicks"] * 100, m["impressions"]),
+            "cpc": lambda m: _ratio(m["spend"], m["clicks"]),
+            "cvr": lambda m: _ratio(m["conversions"] * 100, m["clicks"]),
+        },
+        "default_metrics": ("spend", "revenue", "roas", "ctr"),
+    },
+    "learning": {
+        "model": LearningRollup,
+        "dimensions": {
+            "phase": "phase_number",
+            "agent": "agent_name",
+            "niche": "niche",
+            "feedback": "feedback",
+        },
+        "measures": ("logs", "approved", "score_sum", "scored"),
+        "metrics": {
+            "logs": lambda m: m["logs"],
+            "approval_rate": lambda m: _ratio(m["approved"], m["logs"]),
+            "avg_score": lambda m: _ratio(m["score_sum"], m["scored"]),
+        },
+        "default_metrics": ("logs", "approval_rate", "avg_score"),
+    },
+}
+
+
+def _ratio(numerator, denominator):
+    return round(numerator / denominator, 4) if denominator else None
+
+
+def _bucket_start(bucket: str, column):
+    if bucket == "day":
+        return column
+    return cast(func.date_trunc("week", column), Date)  # Monday
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def refresh_ad_rollups(product_ids: set, since: date):
+    """Recompute ad_rollups for these products from `since` on (whole weeks). The caller commits."""
+    for bucket in BUCKETS:
+        start = since if bucket == "day" else _week_start(since)
+        bucket_start = _bucket_start(bucket, AdPerformance.date)
+        variant = func.coalesce(AdPerformance.creative_variant, "")
+        totals = (
+            db.select(
+                db.literal(bucket),
+                bucket_start,
+                AdPerformance.product_id,
+                variant,
+                Product.niche,
+                Product.product_type,
+                func.coalesce(func.sum(AdPerformance.impressions), 0),
+                func.coalesce(func.sum(AdPerformance.clicks), 0),
+                func.coalesce(func.sum(AdPerformance.conversions), 0),
+                func.coalesce(func.sum(AdPerformance.spend), 0),
+                func.coalesce(func.sum(AdPerformance.revenue), 0),
+                func.now(),
+            )
+            .join(Product, Product.id == AdPerformance.product_id)
+            .where(AdPerformance.product_id.in_(product_ids), AdPerformance.date >= start)
+            .group_by(bucket_start, AdPerformance.product_id, variant, Product.niche, Product.product_type)
+        )
+        columns = [
+            "bucket", "bucket_start", "product_id", "creative_variant", "niche", "product_type",
+            "impressions", "clicks", "conversions", "spend", "revenue", "updated_at",
+        ]
+        stmt = pg_insert(AdRollup).from_select(columns, totals)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=columns[:4],
+            set_={column: stmt.excluded[column] for column in columns[4:]},
+        )
+        db.session.execute(stmt)
+
+
+def refresh_learning_rollups(since: date = None):
+    """Recompute learning_rollups from `since` on (whole weeks). The caller commits.
+
+    Defaults to the last ANALYTICS_ROLLUP_LOOKBACK_DAYS, which picks up the
+    approvals logged since the previous run.
+    """
+    since = since or date.today() - timedelta(days=settings.ANALYTICS_ROLLUP_LOOKBACK_DAYS)
+    created_on = cast(LearningLog.created_at, Date)
+    for bucket in BUCKETS:
+        start = since if bucket == "day" else _week_start(since)
+        bucket_start = _bucket_start(bucket, created_on)
+        niche = func.coalesce(LearningLog.niche, "")
+        feedback = func.coalesce(LearningLog.feedback, "")
+        totals = (
+            db.select(
+                db.literal(bucket),
+                bucket_start,
+                LearningLog.phase_number,
+                LearningLog.agent_name,
+                niche,
+                feedback,
+                func.count(),
+                func.coalesce(func.sum(LearningLog.performance_score), 0),
+                func.count(LearningLog.performance_score),
+                func.now(),
+            )
+            .where(LearningLog.created_at >= datetime.combine(start, datetime.min.time()))
+            .group_by(bucket_start, LearningLog.phase_number, LearningLog.agent_name, niche, feedback)
+        )
+        columns = [
+            "bucket", "bucket_start", "phase_number", "agent_name", "niche", "feedback",
+            "logs", "score_sum", "scored", "updated_at",
+        ]
+        stmt = pg_insert(LearningRollup).from_select(columns, totals)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=columns[:6],
+            set_={column: stmt.excluded[column] for column in columns[6:]},
+        )
+        db.session.execute(stmt)
+
+
+def rebuild_rollups():
+    """Recompute both rollup tables over all history (e.g. on a fresh deploy). The caller commits."""
+    product_ids = db.session.execute(db.select(AdPerformance.product_id).distinct()).scalars().all()
+    if product_ids:
+        refresh_ad_rollups(set(product_ids), date.min)
+    refresh_learning_rollups(date.min)
+
+
+def query(
+    source: str = "ads",
+    bucket: str = "week",
+    group_by: list = (),
+    metrics: list = None,
+    since: date = None,
+    until: date = None,
+    filters: dict = None,
+) -> list:
+    """One row per (bucket_start, *group_by) with the requested metrics.
+
+    Raises ValueError for an unknown source, bucket, dimension or metric.
+    """
+    spec = SOURCES.get(source)
+    if spec is None:
+        raise ValueError(f"source must be one of: {', '.join(SOURCES)}")
+    if bucket not in BUCKETS:
+        raise ValueError(f"bucket must be one of: {', '.join(BUCKETS)}")
+    dimensions = spec["dimensions"]
+    metrics = list(metrics or spec["default_metrics"])
+    for name in group_by:
+        if name not in dimensions:
+            raise ValueError(f"Unknown dimension '{name}'. Allowed: {', '.join(dimensions)}")
+    for name in metrics:
+        if name not in spec["metrics"]:
+            raise ValueError(f"Unknown metric '{name}'. Allowed: {', '.join(spec['metrics'])}")
+    for name in filters or {}:
+        if name not in dimensions:
+            raise ValueError(f"Unknown filter '{name}'. Allowed: {', '.join(dimensions)}")
+
+    until = until or date.today()
+    since = since or until - timedelta(days=settings.ANALYTICS_DEFAULT_RANGE_DAYS)
+    if bucket == "week":
+        since = _week_start(since)  # include the week `since` falls in
+    model = spec["model"]
+
+    # Only the columns this slice needs, read column-wise
+    key_columns = ["bucket_start", *[dimensions[name] for name in group_by]]
+    measure_columns = _measure_columns(source, model)
+    stmt = db.select(*[getattr(model, c) for c in key_columns], *measure_columns.values()).where(
+        model.bucket == bucket, model.bucket_start >= since, model.bucket_start <= until
+    )
+    for name, value in (filters or {}).items():
+        column = getattr(model, dimensions[name])
+        stmt = stmt.where(column == (int(value) if name == "phase" else value))
+
+    rows = db.session.execute(stmt).all()
+    columns = list(zip(*rows)) if rows else [()] * (len(key_columns) + len(measure_columns))
+    keys = list(zip(*columns[:len(key_columns)]))
+    measures = dict(zip(measure_columns, columns[len(key_columns):]))
+
+    sums = aggregate(keys, measures)
+
+    series = []
+    for key in sorted(sums, key=lambda k: tuple("" if v is None else str(v) for v in k)):
+        totals = sums[key]
+        row = {"bucket_start": key[0].isoformat()}
+        row.update({name: key[i + 1] for i, name in enumerate(group_by)})
+        row.update({name: spec["metrics"][name](totals) for name in metrics})
+        series.append(row)
+    return series
+
+
+def _measure_columns(source: str, model) -> dict:
+    if source == "learning":
+        return {
+            "logs": model.logs,
+            "approved": db.case((model.feedback.in_(("approved", "edited")), model.logs), else_=0),
+            "score_sum": model.score_sum,
+            "scored": model.scored,
+        }
+    return {name: getattr(model, name) for name in SOURCES[source]["measures"]}
+
+
+def aggregate(keys: list, measures: dict) -> dict:
+    """Sum each measure column over rows sharing a key: {key: {measure: total}}."""
+    sums = defaultdict(lambda: dict.fromkeys(measures, 0))
+    for name, values in measures.items():
+        for key, value in zip(keys, values):
+            sums[key][name] += value or 0
+    return sums
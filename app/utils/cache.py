@@ -0,0 +1,115 @@
+"""Redis-backed caches shared by all workers and API processes."""
+
+import json
+import threading
+import time
+
+import redis
+import structlog
+
+from config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+MISS = object()  # returned by RedisCache.get() when there is no usable entry
+
+_redis = None
+_redis_lock = threading.Lock()
+
+
+def get_redis() -> redis.Redis:
+    """Shared Redis client (connection-pooled and thread-safe)."""
+    global _redis
+    with _redis_lock:
+        if _redis is None:
+            _redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        return _redis
+
+
+class RedisCache:
+    """Namespaced JSON cache with per-entry TTLs, LRU eviction and hit/miss counters.
+
+    A sorted set of last-access times tracks every entry; once it holds more
+    than `max_entries`, the least recently used entries are evicted. Hits and
+    misses are counted per `group` (e.g. prompt template). Redis errors are
+    logged and treated as misses, so a cache outage never fails the caller.
+    """
+
+    def __init__(self, namespace: str, max_entries: int):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self._lru_key = f"zeule:cache:{namespace}:lru"
+        self._stats_key = f"zeule:cache:{namespace}:stats"
+
+    def _entry_key(self, key: str) -> str:
+        return f"zeule:cache:{self.namespace}:entry:{key}"
+
+    def get(self, key: str, group: str = "default"):
+        try:
+            r = get_redis()
+            raw = r.get(self._entry_key(key))
+            pipe = r.pipeline(transaction=False)
+            if raw is None:
+                pipe.hincrby(self._stats_key, f"{group}:misses", 1)
+            else:
+                pipe.hincrby(self._stats_key, f"{group}:hits", 1)
+                pipe.zadd(self._lru_key, {key: time.time()})
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("cache.get.failed", namespace=self.namespace, error=str(e))
+            return MISS
+        return MISS if raw is None else json.loads(raw)
+
+    def set(self, key: str, value, ttl: int):
+        try:
+            r = get_redis()
+            pipe = r.pipeline(transaction=False)
+            pipe.set(self._entry_key(key), json.dumps(value), ex=ttl)
+            pipe.zadd(self._lru_key, {key: time.time()})
+            pipe.zcard(self._lru_key)
+            size = pipe.execute()[-1]
+
+            if size > self.max_entries:
+                evicted = [member for member, _ in r.zpopmin(self._lru_key, size - self.max_entries)]
+                if evicted:
+                    r.delete(*[self._entry_key(member) for member in evicted])
+        except redis.RedisError as e:
+            logger.warning("cache.set.failed", namespace=self.namespace, error=str(e))
+
+    def delete(self, key: str):
+        try:
+            r = get_redis()
+            pipe = r.pipeline(transaction=False)
+            pipe.delete(self._entry_key(key))
+            pipe.zrem(self._lru_key, key)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("cache.delete.failed", namespace=self.namespace, error=str(e))
+
+    def claim(self, key: str, ttl: int) -> bool:
+        """Take a short-lived lock on `key` (e.g. to refresh it); False if someone holds it."""
+        try:
+            return bool(get_redis().set(f"zeule:cache:{self.namespace}:claim:{key}", 1, nx=True, ex=ttl))
+        except redis.RedisError as e:
+            logger.warning("cache.claim.failed", namespace=self.namespace, error=str(e))
+            return False
+
+    def stats(self) -> dict:
+        """Hit/miss counts and hit rate per group, plus the number of tracked entries."""
+        r = get_redis()
+        counters = r.hgetall(self._stats_key)
+
+        groups = {}
+        for field, count in counters.items():
+            group, _, kind = field.rpartition(":")
+            groups.setdefault(group, {"hits": 0, "misses": 0})[kind] = int(count)
+
+        for counts in groups.values():
+            total = counts["hits"] + counts["misses"]
+            counts["hit_rate"] = round(counts["hits"] / total, 3) if total else 0.0
+
+        return {
+            "entries": r.zcard(self._lru_key),
+            "max_entries": self.max_entries,
+            "groups": groups,
+        }
@@ -0,0 +1,133 @@
+"""Per-provider circuit breakers, shared by every worker through Redis.
+
+closed    — calls go through; consecutive outage-like failures are counted.
+open      — after BREAKER_FAILURE_THRESHOLD of them, calls fail immediately
+            with CircuitOpenError for BREAKER_RESET_TIMEOUT seconds.
+half-open — then a single trial call is let through: success closes the
+            breaker, failure re-opens it.
+
+Only failures that point at the provider being unhealthy (timeouts, failed
+connections, 429/5xx) count; bad requests don't. Agents and integrations
+already turn exceptions into their `{"error": ...}` results, so an open
+breaker degrades exactly like an outage — just without the wait.
+"""
+
+import functools
+import time
+
+import redis
+import structlog
+
+from app.utils.cache import get_redis
+from app.utils.retry import is_retryable
+from config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+OPEN_STATE_TTL = 24 * 3600  # forget an abandoned open breaker eventually
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose breaker is open."""
+
+    def __init__(self, provider: str):
+        super().__init__(f"{provider} is unavailable (circuit open), skipping call")
+        self.provider = provider
+
+
+def _state_key(provider: str) -> str:
+    return f"zeule:breaker:{provider}"
+
+
+def _trial_key(provider: str) -> str:
+    return f"zeule:breaker:{provider}:trial"
+
+
+def _allow(provider: str) -> tuple[bool, bool]:
+    """Returns (allowed, tracked) — tracked means there is breaker state to clear on success."""
+    r = get_redis()
+    state = r.hgetall(_state_key(provider))
+    if state.get("state") != "open":
+        return True, bool(state)
+    if time.time() - float(state.get("opened_at", 0)) < settings.BREAKER_RESET_TIMEOUT:
+        return False, True
+    # Half-open: exactly one caller across all workers gets the trial call
+    return bool(r.set(_trial_key(provider), 1, nx=True, ex=max(1, int(settings.BREAKER_RESET_TIMEOUT)))), True
+
+
+def _record_success(provider: str):
+    get_redis().delete(_state_key(provider), _trial_key(provider))
+
+
+def _record_failure(provider: str):
+    r = get_redis()
+    key = _state_key(provider)
+    pipe = r.pipeline()
+    pipe.hget(key, "state")
+    pipe.hincrby(key, "failures", 1)
+    pipe.expire(key, settings.BREAKER_FAILURE_WINDOW)
+    state, failures, _ = pipe.execute()
+
+    if state == "open" or failures >= settings.BREAKER_FAILURE_THRESHOLD:
+        pipe = r.pipeline()
+        pipe.hset(key, mapping={"state": "open", "opened_at": time.time()})
+        pipe.expire(key, OPEN_STATE_TTL)
+        pipe.delete(_trial_key(provider))
+        pipe.execute()
+        logger.warning("breaker.opened", provider=provider, failures=failures)
+
+
+def circuit_breaker(provider: str):
+    """Decorator guarding a provider call with the provider's shared breaker.
+
+    Redis being unreachable never blocks calls — the breaker just stays out of the way.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                allowed, tracked = _allow(provider)
+            except redis.RedisError as e:
+                logger.warning("breaker.unavailable", provider=provider, error=str(e))
+                return fn(*args, **kwargs)
+
+            if not allowed:
+                raise CircuitOpenError(provider)
+
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                try:
+                    if is_retryable(e):
+                        _record_failure(provider)
+                    elif tracked and getattr(e, "response", None) is not None:
+                        _record_success(provider)  # it answered, so it's up
+                except redis.RedisError:
+                    pass
+                raise
+
+            if tracked:
+                try:
+                    _record_success(provider)
+                except redis.RedisError:
+                    pass
+            return result
+
+        return wrapper
+    return decorator
+
+
+def breaker_states() -> dict:
+    """Current state of every breaker that has recorded failures."""
+    r = get_redis()
+    states = {}
+    for key in r.scan_iter("zeule:breaker:*"):
+        if key.endswith(":trial"):
+            continue
+        state = r.hgetall(key)
+        states[key.rsplit(":", 1)[-1]] = {
+            "state": state.get("state", "closed"),
+            "failures": int(state.get("failures", 0)),
+            "opened_at": float(state["opened_at"]) if "opened_at" in state else None,
+        }
+    return states
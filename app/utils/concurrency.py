@@ -0,0 +1,111 @@
+"""Concurrency helpers — per-provider limits and request coalescing shared by all threads in a worker."""
+
+import threading
+import time
+
+from config.settings import settings
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+class ProviderLimiter:
+    """Counting limiter whose limit can be changed while it is in use.
+
+    The limit also adapts to the provider (AIMD): `throttled()` halves it after
+    a rate-limit response, and `succeeded()` adds a slot back after a run of
+    successes, up to the configured ceiling.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = self.ceiling = max(1, limit)
+        self.active = 0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.active >= self.limit:
+                self._cond.wait()
+            self.active += 1
+
+    def release(self):
+        with self._cond:
+            self.active -= 1
+            self._cond.notify()
+
+    def set_limit(self, limit: int):
+        with self._cond:
+            self.limit = self.ceiling = max(1, limit)
+            self._cond.notify_all()
+
+    def throttled(self):
+        with self._cond:
+            now = time.monotonic()
+            # Calls already in flight will report the same 429 — count it once
+            if now - self._last_decrease < settings.AIMD_DECREASE_COOLDOWN:
+                return
+            self._last_decrease = now
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+
+    def succeeded(self):
+        with self._cond:
+            if self.limit >= self.ceiling:
+                return
+            self._successes += 1
+            if self._successes >= self.limit:
+                self._successes = 0
+                self.limit += 1
+                self._cond.notify()
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    """Get the limiter for a provider, creating it from settings on first use."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limit = settings.PROVIDER_CONCURRENCY.get(provider, settings.DEFAULT_PROVIDER_CONCURRENCY)
+            limiter = _limiters[provider] = ProviderLimiter(limit)
+        return limiter
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def singleflight(key, fn):
+    """Run `fn` once for concurrent callers sharing `key`; they all get its result.
+
+    The first caller makes the call, callers arriving while it is in flight wait
+    for it and receive the same result (or exception). Coalescing is per process.
+    """
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = fn()
+        return flight.result
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
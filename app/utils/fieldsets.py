@@ -0,0 +1,33 @@
+"""Sparse fieldsets for API responses: `?fields=` and `?include=` query params.
+
+`fields=id,status` trims a response to the named keys; `include=output_data`
+opts in to heavy fields that are left out (and left unloaded) by default.
+"""
+
+from flask import request
+
+
+def parse_list(name: str) -> set | None:
+    """Comma-separated query param as a set; None when the param is absent."""
+    value = request.args.get(name)
+    if value is None:
+        return None
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
+def parse_include(allowed) -> set:
+    """The `include` param, validated against the heavy fields an endpoint offers."""
+    include = parse_list("include") or set()
+    unknown = include - set(allowed)
+    if unknown:
+        raise ValueError(
+            f"Unknown include: {', '.join(sorted(unknown))}. Allowed: {', '.join(sorted(allowed))}"
+        )
+    return include
+
+
+def sparse(data: dict, fields: set | None) -> dict:
+    """Keep only `fields` (plus id) of a serialized object; everything when None."""
+    if fields is None:
+        return data
+    return {key: value for key, value in data.items() if key in fields or key == "id"}
@@ -35,20 +35,14 @@ def save_text(filepath: str, content: str):
 
 
 def list_assets(pipeline_run_id: str) -> list:
-    """List all assets for a pipeline run."""
-    base = os.path.join(settings.ASSETS_DIR, pipeline_run_id)
-    if not os.path.exists(base):
-        return []
-
-    assets = []
-    for root, dirs, files in os.walk(base):
-        for f in files:
-            full_path = os.path.join(root, f)
-            rel_path = os.path.relpath(full_path, settings.ASSETS_DIR)
-            assets.append({
-                "path": rel_path,
-                "name": f,
-                "size": os.path.getsize(full_path),
-            })
-
-    return assets
+    """List all assets for a pipeline run, from the asset manifest."""
+    from app.services.asset_store import list_assets as list_stored_assets, object_path
+
+    return [
+        {
+            "path": os.path.relpath(object_path(asset.sha256), settings.ASSETS_DIR),
+            "name": asset.name or asset.sha256,
+            "size": asset.size,
+        }
+        for asset in list_stored_assets(pipeline_run_id)
+    ]
@@ -0,0 +1,55 @@
+"""LLM response cache — opt-in, keyed on everything that shapes the response.
+
+Calls opt in by passing `cache_template` (the prompt template key) to an
+integration wrapped with `cached_llm`. The TTL comes from
+LLM_CACHE_TTLS[template] (falling back to LLM_CACHE_DEFAULT_TTL); a TTL of 0
+disables caching for that template. `bypass_cache=True` always calls the
+provider and refreshes the entry.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+
+from app.utils.cache import MISS, RedisCache
+from config.settings import settings
+
+KEY_FIELDS = ("model", "system_prompt", "prompt", "temperature", "max_tokens", "json_mode")
+
+llm_cache = RedisCache("llm", max_entries=settings.LLM_CACHE_MAX_ENTRIES)
+
+
+def cache_key(provider: str, params: dict) -> str:
+    payload = {"provider": provider, **{field: params.get(field) for field in KEY_FIELDS}}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def cached_llm(provider: str):
+    """Decorator adding `cache_template` and `bypass_cache` kwargs to an LLM call."""
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, cache_template: str = None, bypass_cache: bool = False, **kwargs):
+            ttl = settings.LLM_CACHE_TTLS.get(cache_template, settings.LLM_CACHE_DEFAULT_TTL)
+            if not (cache_template and settings.LLM_CACHE_ENABLED and ttl > 0):
+                return fn(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = cache_key(provider, bound.arguments)
+
+            if not bypass_cache:
+                cached = llm_cache.get(key, group=cache_template)
+                if cached is not MISS:
+                    return cached
+
+            result = fn(*args, **kwargs)
+            # A JSON-mode call that came back as text failed to parse — don't pin it
+            if not (bound.arguments.get("json_mode") and isinstance(result, str)):
+                llm_cache.set(key, result, ttl)
+            return result
+
+        return wrapper
+    return decorator
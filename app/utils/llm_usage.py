@@ -0,0 +1,56 @@
+"""Token usage of LLM calls, collected per block of code.
+
+    with track_usage() as usage:
+        call_openai(prompt)
+    usage.input_tokens, usage.output_tokens, usage.calls
+
+Integrations report each provider response with record_usage(); calls served
+from the LLM cache report nothing, since they cost nothing. Tracking follows
+the context (contextvars), so parallel callers each see only their own calls,
+while an agent's parallel steps (run_steps) count towards the agent's caller.
+"""
+
+import contextvars
+import threading
+from contextlib import contextmanager
+
+
+class Usage:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.models = set()
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "models": sorted(self.models),
+        }
+
+
+_current = contextvars.ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def track_usage():
+    usage = Usage()
+    token = _current.set(usage)
+    try:
+        yield usage
+    finally:
+        _current.reset(token)
+
+
+def record_usage(model: str, input_tokens: int, output_tokens: int):
+    usage = _current.get()
+    if usage is None:
+        return
+    with usage._lock:
+        usage.calls += 1
+        usage.input_tokens += input_tokens or 0
+        usage.output_tokens += output_tokens or 0
+        usage.models.add(model)
@@ -0,0 +1,79 @@
+"""Keyset (cursor) pagination for append-mostly tables.
+
+Pages are ordered newest first on (sort column, id) and continue strictly
+after the last row of the previous page, so every page is an index range
+scan — no OFFSET, no COUNT(*). The cursor is an opaque token encoding that
+last (sort value, id) pair. Totals are opt-in: `total=approx` uses the
+planner's row estimate, `total=exact` counts.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import tuple_
+
+from app import db
+
+MAX_PER_PAGE = 200
+
+
+def encode_cursor(sort_value, row_id: str) -> str:
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column) -> tuple:
+    """The (sort value, id) pair in a cursor; ValueError when it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        python_type = sort_column.type.python_type
+        if python_type in (date, datetime):
+            sort_value = python_type.fromisoformat(sort_value)
+        return sort_value, row_id
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def keyset_page(query, sort_column, id_column, cursor: str = None, per_page: int = 50, total: str = None) -> dict:
+    """One page of `query`, newest first, after `cursor`.
+
+    Returns {"items", "next_cursor", "total"}: next_cursor is None on the
+    last page; total is only computed when `total` is "approx" or "exact".
+    """
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+
+    count = None
+    if total == "exact":
+        count = query.order_by(None).count()
+    elif total == "approx":
+        count = approximate_count(query)
+
+    if cursor:
+        query = query.filter(tuple_(sort_column, id_column) < decode_cursor(cursor, sort_column))
+
+    rows = query.order_by(sort_column.desc(), id_column.desc()).limit(per_page + 1).all()
+    items = rows[:per_page]
+    next_cursor = None
+    if len(rows) > per_page:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return {"items": items, "next_cursor": next_cursor, "total": count}
+
+
+def approximate_count(query) -> int:
+    """Row estimate from the Postgres planner (free, roughly right); exact elsewhere."""
+    if db.engine.dialect.name != "postgresql":
+        return query.order_by(None).count()
+
+    compiled = query.order_by(None).statement.compile(dialect=db.engine.dialect)
+    plan = db.session.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,83 @@
+"""Research API cache — shares SERP, Reddit, Hotmart, Ad Library and Perplexity
+results across phases and pipelines.
+
+Each source has its own freshness TTL (RESEARCH_CACHE_TTLS). Past that, an
+entry is still served for RESEARCH_CACHE_STALE_TTL seconds while one
+background thread re-fetches it (stale-while-revalidate). Exceptions and
+results carrying an "error" key are never cached.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+
+import structlog
+
+from app.utils.cache import MISS, RedisCache
+from config.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+REFRESH_LOCK_TTL = 60
+
+research_cache = RedisCache("research", max_entries=settings.RESEARCH_CACHE_MAX_ENTRIES)
+
+
+def _is_error(result) -> bool:
+    return isinstance(result, dict) and bool(result.get("error"))
+
+
+def _store(key: str, result, ttl: int):
+    if not _is_error(result):
+        research_cache.set(
+            key,
+            {"value": result, "fetched_at": time.time()},
+            ttl + settings.RESEARCH_CACHE_STALE_TTL,
+        )
+
+
+def _refresh(fn, args, kwargs, key: str, ttl: int, name: str):
+    try:
+        _store(key, fn(*args, **kwargs), ttl)
+    except Exception as e:
+        logger.warning("research_cache.refresh.failed", call=name, error=str(e))
+
+
+def cached_research(source: str):
+    """Decorator caching a research call's result under its source's TTL.
+
+    Adds a `bypass_cache` kwarg that forces a fresh call (and re-caches it).
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        name = f"{source}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, bypass_cache: bool = False, **kwargs):
+            ttl = settings.RESEARCH_CACHE_TTLS.get(source, 0)
+            if not (settings.RESEARCH_CACHE_ENABLED and ttl > 0):
+                return fn(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            payload = json.dumps([name, bound.arguments], sort_keys=True, default=str)
+            key = hashlib.sha256(payload.encode()).hexdigest()
+
+            if not bypass_cache:
+                entry = research_cache.get(key, group=name)
+                if entry is not MISS:
+                    if time.time() - entry["fetched_at"] > ttl and research_cache.claim(key, REFRESH_LOCK_TTL):
+                        threading.Thread(
+                            target=_refresh, args=(fn, args, kwargs, key, ttl, name), daemon=True,
+                        ).start()
+                    return entry["value"]
+
+            result = fn(*args, **kwargs)
+            _store(key, result, ttl)
+            return result
+
+        return wrapper
+    return decorator
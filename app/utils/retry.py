@@ -1,38 +1,182 @@
-"""Retry utilities with exponential backoff."""
+"""Retry policy for provider calls — rate-limit aware, jittered, adaptive.
 
+`adaptive_retry(provider)` wraps an integration call so that each attempt
+holds one of the provider's concurrency slots, retryable failures are retried
+after the delay the provider asks for (Retry-After and rate-limit headers) or
+a full-jitter exponential backoff, and 429s shrink the provider's concurrency
+while successes grow it back (see ProviderLimiter).
+"""
+
+import email.utils
 import functools
+import json
+import random
+import re
+import time
+
+import httpx
 import structlog
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log,
-)
+
+from app.utils.concurrency import get_limiter
+from config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+THROTTLE_STATUSES = {429}
+TRANSIENT_STATUSES = {408, 500, 502, 503, 504, 529}
+META_THROTTLE_CODES = {4, 17, 32, 613, 80004}  # Graph API rate-limit error codes
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)  # request never reached the provider
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _response(exc):
+    return getattr(exc, "response", None)
+
+
+def _status(exc) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if status is None and _response(exc) is not None:
+        status = _response(exc).status_code
+    return status
+
+
+def is_throttled(exc) -> bool:
+    """True when the provider rejected the call for rate limiting."""
+    if _status(exc) in THROTTLE_STATUSES:
+        return True
+    response = _response(exc)
+    if response is not None and _status(exc) == 400:
+        try:
+            return response.json().get("error", {}).get("code") in META_THROTTLE_CODES
+        except (ValueError, AttributeError):
+            return False
+    return False
+
+
+def is_retryable(exc, idempotent: bool = True) -> bool:
+    """Whether another attempt can succeed (and is safe to make).
+
+    Rate limits and failed connections are always retried. Server errors and
+    timeouts only are when the call is idempotent — otherwise the first
+    attempt may have taken effect.
+    """
+    if is_throttled(exc) or isinstance(exc, CONNECT_ERRORS):
+        return True
+    if not idempotent:
+        return False
+    if _status(exc) in TRANSIENT_STATUSES:
+        return True
+    # httpx transport errors and the OpenAI/Anthropic SDK equivalents
+    return isinstance(exc, httpx.TransportError) or type(exc).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+def _parse_duration(value: str) -> float | None:
+    parts = _DURATION.findall(value or "")
+    if not parts:
+        return None
+    return sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+
+
+def retry_after(exc) -> float | None:
+    """Seconds the provider asked us to wait, if it said."""
+    response = _response(exc)
+    if response is None:
+        return None
+    headers = response.headers
+
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            try:
+                parsed = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                parsed = None  # malformed header — fall back to backoff
+            if parsed is not None:
+                return max(0.0, parsed.timestamp() - time.time())
+
+    # OpenAI-style reset hints, e.g. "6m0s" or "20ms"
+    resets = [_parse_duration(headers.get(h)) for h in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")]
+    resets = [r for r in resets if r is not None]
+    if resets:
+        return max(resets)
+
+    # Meta: minutes until the business use case regains access
+    usage = headers.get("x-business-use-case-usage")
+    if usage:
+        try:
+            minutes = [
+                entry.get("estimated_time_to_regain_access", 0)
+                for entries in json.loads(usage).values()
+                for entry in entries
+            ]
+            if any(minutes):
+                return max(minutes) * 60
+        except (ValueError, AttributeError):
+            pass
+
+    return None
+
+
+def backoff(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given (0-based) attempt."""
+    return random.uniform(0, min(settings.RETRY_MAX_WAIT, settings.RETRY_BASE_WAIT * 2 ** attempt))
+
+
+def adaptive_retry(provider: str, max_attempts: int = None, idempotent: bool = True):
+    """Decorator applying the retry policy and concurrency limit to a provider call.
+
+    Args:
+        provider: Key into PROVIDER_CONCURRENCY; calls for the same provider share its limiter.
+        max_attempts: Total attempts, defaults to settings.MAX_RETRIES.
+        idempotent: False for calls with side effects (e.g. creating objects)
+            so they are only retried when the first attempt cannot have landed.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            attempts = max_attempts or settings.MAX_RETRIES
+            limiter = get_limiter(provider)
+
+            for attempt in range(attempts):
+                limiter.acquire()
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    if is_throttled(e):
+                        limiter.throttled()
+                    if attempt + 1 >= attempts or not is_retryable(e, idempotent):
+                        raise
+                    error = e
+                else:
+                    limiter.succeeded()
+                    return result
+                finally:
+                    limiter.release()
+
+                hinted = retry_after(error)
+                if hinted is not None and hinted > settings.RETRY_MAX_WAIT:
+                    raise error  # the provider won't take calls again in time
+                delay = hinted + random.uniform(0, 1) if hinted is not None else backoff(attempt)
+                logger.warning(
+                    "retry.scheduled",
+                    provider=provider,
+                    call=fn.__name__,
+                    attempt=attempt + 1,
+                    delay=round(delay, 2),
+                    status=_status(error),
+                    error=str(error),
+                )
+                time.sleep(delay)
 
-def with_retry(
-    max_attempts: int = 3,
-    min_wait: int = 1,
-    max_wait: int = 30,
-    retry_on: tuple = (Exception,),
-):
-    """Decorator for retrying functions with exponential backoff."""
-    return retry(
-        stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
-        retry=retry_if_exception_type(retry_on),
-        before_sleep=before_sleep_log(logger, "warning"),
-        reraise=True,
-    )
-
-
-def retry_api_call(func):
-    """Decorator specifically for API calls — retries on network/rate limit errors."""
-    @functools.wraps(func)
-    @with_retry(max_attempts=3, min_wait=2, max_wait=60)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-    return wrapper
+        return wrapper
+    return decorator
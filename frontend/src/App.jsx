@@ -60,6 +60,11 @@ const PHASES = [
   "Funnel & Copy", "Campaign Launch"
 ];
 
+const PROGRESS_EVENTS = [
+  "pipeline_started", "phase_started", "step_done", "step_failed", "phase_completed",
+  "phase_failed", "approval_created", "approval_resolved", "pipeline_completed", "pipeline_stopped"
+];
+
 // --- API Service Layer ---
 const api = {
   request: async (endpoint, method = 'GET', data = null) => {
@@ -81,6 +86,17 @@ const api = {
       console.error(error);
       throw error;
     }
+  },
+
+  // Server-Sent Events instead of polling. EventSource reconnects by itself
+  // and resumes from the last event id it saw. Returns an unsubscribe function.
+  subscribe: (endpoint, onEvent) => {
+    if (USE_MOCK_API) return () => {};
+    const source = new EventSource(`${API_BASE_URL}${endpoint}`);
+    PROGRESS_EVENTS.forEach(type =>
+      source.addEventListener(type, e => onEvent(JSON.parse(e.data), e.lastEventId))
+    );
+    return () => source.close();
   }
 };
 
@@ -107,8 +123,8 @@ let mockPipelines = [
 ];
 
 let mockProducts = [
-  { id: "prod1", name: "Ultimate Notion Brain", niche: "AI Productivity", type: "main", status: "published", price: 49, created: "2023-10-25" },
-  { id: "prod2", name: "Keto Quickstart Guide", niche: "Keto Diet", type: "lead_magnet", status: "draft", price: 0, created: "2023-10-26" },
+  { id: "prod1", name: "Ultimate Notion Brain", niche: "AI Productivity", product_type: "main", status: "published", price: 49, created: "2023-10-25" },
+  { id: "prod2", name: "Keto Quickstart Guide", niche: "Keto Diet", product_type: "lead_magnet", status: "draft", price: 0, created: "2023-10-26" },
 ];
 
 let mockPrompts = PHASES.map((phase, i) => ({
@@ -156,7 +172,7 @@ const mockBackend = (endpoint, method, data) => {
       dailyOutput: 12
     };
   }
-  if (endpoint === '/api/products') return { products: mockProducts };
+  if (endpoint.startsWith('/api/products')) return { products: mockProducts, next_cursor: null };
   if (endpoint === '/api/prompts') return { prompts: mockPrompts };
 
   return {};
@@ -252,6 +268,10 @@ const Dashboard = ({ navigate }) => {
       setPipelines(p.pipelines);
     };
     fetchData();
+    // Refresh on pipeline-level changes only; step events are too chatty for the dashboard
+    return api.subscribe('/api/pipelines/events', (event) => {
+      if (!event.type.startsWith('step_')) fetchData();
+    });
   }, []);
 
   const handleCreate = async () => {
@@ -375,6 +395,9 @@ const PipelineView = ({ id, navigate }) => {
       setPipeline(data);
     };
     load();
+    return api.subscribe(`/api/pipelines/${id}/events`, (event) => {
+      if (!event.type.startsWith('step_')) load();
+    });
   }, [id]);
 
   if (!pipeline) return <div>Loading Pipeline {id}...</div>;
@@ -466,10 +489,19 @@ const PipelineView = ({ id, navigate }) => {
 // 3. Products List
 const ProductsList = () => {
   const [products, setProducts] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [filter, setFilter] = useState('');
 
+  const loadPage = (cursor) => {
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+    api.request(`/api/products${query}`).then(d => {
+      setProducts(prev => cursor ? [...prev, ...d.products] : d.products);
+      setNextCursor(d.next_cursor);
+    });
+  };
+
   useEffect(() => {
-    api.request('/api/products').then(d => setProducts(d.products));
+    loadPage(null);
   }, []);
 
   const filtered = products.filter(p => p.name.toLowerCase().includes(filter.toLowerCase()));
@@ -505,9 +537,16 @@ const ProductsList = () => {
           <tbody>
             {filtered.map((product) => (
               <tr key={product.id} className="border-b border-slate-100 dark:border-slate-700">
-                <td className="px-6 py-4 font-medium">{product.name}</td>
+                <td className="px-6 py-4 font-medium">
+                  <div className="flex items-center gap-3">
+                    {product.thumbnail_url && (
+                      <img src={product.thumbnail_url} alt="" loading="lazy" className="h-12 w-8 rounded object-cover" />
+                    )}
+                    {product.name}
+                  </div>
+                </td>
                 <td className="px-6 py-4">{product.niche}</td>
-                <td className="px-6 py-4 capitalize">{product.type.replace('_', ' ')}</td>
+                <td className="px-6 py-4 capitalize">{product.product_type.replace('_', ' ')}</td>
                 <td className="px-6 py-4">${product.price}</td>
                 <td className="px-6 py-4">
                   <Badge variant={product.status === 'published' ? 'success' : 'secondary'}>
@@ -523,6 +562,11 @@ const ProductsList = () => {
           </tbody>
         </table>
       </Card>
+      {nextCursor && (
+        <div className="flex justify-center">
+          <Button variant="outline" onClick={() => loadPage(nextCursor)}>Load more</Button>
+        </div>
+      )}
     </div>
   );
 };
@@ -710,8 +754,21 @@ const LogsPage = () => {
   const [logs, setLogs] = useState([]);
   const logsEndRef = useRef(null);
 
+  // Live progress events from every pipeline
+  useEffect(() => api.subscribe('/api/pipelines/events', (event, eventId) => {
+    const level = event.type.endsWith('_failed') ? 'error' : event.type === 'approval_created' ? 'warning' : 'info';
+    const detail = event.step ? `step ${event.step}` : event.phase_name || (event.phase ? `phase ${event.phase}` : '');
+    setLogs(prev => [...prev.slice(-99), {
+      id: eventId,
+      timestamp: new Date(event.at).toLocaleTimeString(),
+      level,
+      message: `${event.type.replace(/_/g, ' ')}${detail ? ` — ${detail}` : ''} (pipeline ${event.pipeline_run_id.slice(0, 8)})${event.error ? `: ${event.error}` : ''}`
+    }]);
+  }), []);
+
   // Simulate incoming logs
   useEffect(() => {
+    if (!USE_MOCK_API) return;
     const interval = setInterval(() => {
       if (Math.random() > 0.7) {
         const levels = ['info', 'info', 'info', 'warning', 'error'];
@@ -2,9 +2,54 @@
 
 import yaml
 import os
+from sqlalchemy import inspect, text
+
 from app import create_app, db
 from app.models.phase_toggle import PhaseToggle
 from app.models.prompt_template import PromptTemplate
+from app.services.rollups import rebuild_counters
+from app.services.timeseries import rebuild_rollups
+
+
+# Databases created before the upsert key may hold duplicate daily rows; keep the
+# most recently fetched copy of each (product, campaign, ad, day) so the index builds
+DEDUPE_AD_PERFORMANCE = """
+    DELETE FROM ad_performance a USING ad_performance b
+    WHERE a.product_id = b.product_id
+      AND a.campaign_id IS NOT DISTINCT FROM b.campaign_id
+      AND a.ad_id IS NOT DISTINCT FROM b.ad_id
+      AND a.date = b.date
+      AND (a.fetched_at, a.id) < (b.fetched_at, b.id)
+"""
+
+# Single-column indexes since replaced by composite ones in the models
+DROPPED_INDEXES = (
+    "ix_ad_performance_product_id",  # ix_ad_performance_product_date_id
+    "ix_learning_logs_niche",  # ix_learning_logs_niche_created_at_id
+    "ix_pipeline_runs_status",  # ix_pipeline_runs_status_created_at_id
+    "ix_products_status",  # ix_products_status_created_at_id
+)
+
+
+def sync_indexes():
+    """Create model indexes missing from tables that predate them.
+
+    create_all() only creates missing tables, so indexes added to existing
+    models (e.g. the ad performance upsert key) are created here, and the
+    ones they replaced are dropped.
+    """
+    indexes = {index["name"] for index in inspect(db.engine).get_indexes("ad_performance")}
+    if "uq_ad_performance_product_campaign_ad_date" not in indexes:
+        db.session.execute(text(DEDUPE_AD_PERFORMANCE))
+        db.session.commit()
+
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+    for name in DROPPED_INDEXES:
+        db.session.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    db.session.commit()
+    print("Indexes synced.")
 
 
 def seed_toggles():
@@ -50,10 +95,20 @@ def seed_prompts():
     print("Prompt templates seeded.")
 
 
+def seed_counters():
+    """Rebuild dashboard counters and analytics rollups from the existing data."""
+    rebuild_counters()
+    rebuild_rollups()
+    db.session.commit()
+    print("Dashboard counters and analytics rollups rebuilt.")
+
+
 if __name__ == "__main__":
     app = create_app()
     with app.app_context():
         db.create_all()
+        sync_indexes()
         seed_toggles()
         seed_prompts()
+        seed_counters()
         print("Database seeded successfully.")
@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+# Settings are read at import time; point them at an in-memory database first
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app import create_app, db  # noqa: E402
+from app.services import events  # noqa: E402
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(events, "publish", lambda *args, **kwargs: None)
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
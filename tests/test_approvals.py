@@ -0,0 +1,44 @@
+from app import db
+from app.models.approval import Approval
+from app.models.phase_result import PhaseResult
+from app.orchestrator.engine import create_pipeline
+from app.orchestrator.gates import create_approval_gate
+
+
+def _pending_approval(phase_number=1):
+    pipeline = create_pipeline("home fitness")
+    phase_result = PhaseResult(
+        pipeline_run_id=pipeline.id, phase_number=phase_number, agent_name="trend_discovery", output_data={},
+    )
+    db.session.add(phase_result)
+    db.session.commit()
+    return create_approval_gate(phase_result)
+
+
+def test_bulk_resolve_reports_each_item(app):
+    approval = _pending_approval()
+    approval_id = approval.id
+
+    response = app.test_client().post("/api/approvals/resolve", json={
+        "approval_ids": [approval_id, "missing"], "decision": "rejected",
+    })
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["resolved"] == 1 and body["failed"] == 1
+    assert body["results"][0] == {
+        "approval_id": approval_id,
+        "ok": True,
+        "status": "rejected",
+        "pipeline_run_id": approval.pipeline_run_id,
+        "phase_number": 1,
+    }
+    assert db.session.get(Approval, approval_id).status == "rejected"
+
+
+def test_bulk_resolve_rejects_non_string_ids(app):
+    response = app.test_client().post("/api/approvals/resolve", json={
+        "approval_ids": [["not", "an", "id"]], "decision": "approved",
+    })
+
+    assert response.status_code == 400
@@ -0,0 +1,49 @@
+from app.agents.base import BaseAgent
+from app.orchestrator import engine
+from app.orchestrator.gates import resolve_approval
+from app.models.approval import Approval
+
+
+class FakeAgent:
+    def __init__(self, **options):
+        self.options = options
+
+    def execute(self, pipeline_run_id, input_data, phase_result_id):
+        return {"trends": []}
+
+
+def test_rerun_after_rejection_bypasses_llm_cache(app, monkeypatch):
+    created = []
+
+    def fake_get_agent(agent_name, **options):
+        created.append(options)
+        return FakeAgent(**options)
+
+    monkeypatch.setattr(engine, "get_agent", fake_get_agent)
+    pipeline = engine.create_pipeline("home fitness")
+    orchestrator = engine.PipelineOrchestrator(pipeline.id)
+
+    assert orchestrator.run_phase(1)["status"] == "paused"
+    approval = Approval.query.filter_by(pipeline_run_id=pipeline.id, phase_number=1).one()
+    resolve_approval(approval.id, "rejected", notes="too generic")
+
+    assert orchestrator.start()["status"] == "paused"
+    assert created == [{"bypass_cache": False}, {"bypass_cache": True}]
+
+
+def test_bypass_cache_reaches_the_provider(monkeypatch):
+    from app.integrations import openai_client
+
+    calls = []
+    monkeypatch.setattr(openai_client, "call_openai", lambda prompt, **kwargs: calls.append(kwargs) or {})
+
+    class Agent(BaseAgent):
+        agent_name = "trend_discovery"
+
+        def run(self, input_data, learning_context):
+            return {}
+
+    Agent(bypass_cache=True).call_llm("openai", "prompt", template_key="trend_discovery.discover")
+    Agent().call_llm("openai", "prompt", template_key="trend_discovery.discover")
+
+    assert [c["bypass_cache"] for c in calls] == [True, False]
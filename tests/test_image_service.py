@@ -0,0 +1,58 @@
+import random
+
+from PIL import Image
+
+from app.services.image_service import DEFAULT_PAD_COLOR, derive_format
+
+
+def _noise(size):
+    rng = random.Random(0)
+    image = Image.new("L", size)
+    image.putdata([rng.randrange(256) for _ in range(size[0] * size[1])])
+    return image.convert("RGB")
+
+
+def test_small_change_is_cropped():
+    image = derive_format(Image.new("RGB", (1000, 1000), "white"), "4:5")
+
+    assert image.size == (800, 1000)
+
+
+def test_crop_keeps_the_busiest_region():
+    image = Image.new("RGB", (1000, 1000), "black")
+    image.paste(_noise((200, 1000)), (800, 0))
+
+    cropped = derive_format(image, "4:5")
+
+    # The window slides right to keep the detailed strip
+    assert cropped.getpixel((0, 500)) == (0, 0, 0)
+    assert cropped.crop((600, 0, 800, 1000)).getextrema() != ((0, 0), (0, 0), (0, 0))
+
+
+def test_crop_loss_at_the_threshold_still_crops():
+    # 4:3 -> 1:1 loses exactly MAX_CROP_LOSS (25%) of the width
+    image = derive_format(Image.new("RGB", (400, 300), "white"), "1:1")
+
+    assert image.size == (300, 300)
+    assert image.getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_large_change_is_padded_with_the_brand_color():
+    image = derive_format(Image.new("RGB", (1000, 1000), "white"), "9:16", brand_colors="#e94560, #1a1a2e")
+
+    assert image.size == (1000, 1778)
+    assert image.getpixel((500, 0)) == (0xE9, 0x45, 0x60)
+    assert image.getpixel((500, 889)) == (255, 255, 255)
+
+
+def test_padding_falls_back_to_the_default_color():
+    image = derive_format(Image.new("RGB", (1600, 900), "white"), "1:1", brand_colors="not-a-color")
+
+    assert image.size == (1600, 1600)
+    assert image.getpixel((800, 0)) == DEFAULT_PAD_COLOR
+
+
+def test_same_ratio_is_returned_unchanged():
+    source = Image.new("RGB", (400, 500), "white")
+
+    assert derive_format(source, "4:5").size == (400, 500)
@@ -0,0 +1,51 @@
+from urllib.parse import parse_qs
+
+from app.integrations import meta_ads
+
+
+def _creative(variation, aspect_ratio="1:1"):
+    return {"variation": variation, "aspect_ratio": aspect_ratio, "url": f"https://cdn/{variation}-{aspect_ratio}.png"}
+
+
+def test_one_ad_per_variation_with_its_own_copy(monkeypatch):
+    batches = []
+
+    def fake_batch(operations):
+        batches.append(operations)
+        return {op["name"]: {"id": f"id-{op['name']}"} for op in operations}
+
+    monkeypatch.setattr(meta_ads, "_batch", fake_batch)
+    ad_copy = {"variations": [{"primary_text": "first"}, {"primary_text": "second"}]}
+    # Every format of each variation, as Phase 8 used to pass them
+    creatives = [_creative(1), _creative(1, "4:5"), _creative(1, "9:16"), _creative(2), _creative(2, "4:5")]
+
+    result = meta_ads.create_campaign("Book", ad_copy=ad_copy, creatives=creatives)
+
+    operations = {op["name"]: parse_qs(op["body"]) for op in batches[0]}
+    assert operations["ad_0"]["name"] == ["Book - Ad 1"]
+    assert operations["ad_1"]["name"] == ["Book - Ad 2"]
+    assert '"message": "first"' in operations["creative_0"]["object_story_spec"][0]
+    assert '"image_url": "https://cdn/1-1:1.png"' in operations["creative_0"]["object_story_spec"][0]
+    assert '"message": "second"' in operations["creative_1"]["object_story_spec"][0]
+    assert [ad["variation"] for ad in result["ads"]] == [1, 2]
+
+
+def test_failed_creative_keeps_its_variation(monkeypatch):
+    monkeypatch.setattr(meta_ads, "_batch", lambda operations: {op["name"]: {"id": "x"} for op in operations})
+    ad_copy = {"variations": [{"primary_text": "first"}, {"primary_text": "second"}]}
+
+    result = meta_ads.create_campaign(
+        "Book", ad_copy=ad_copy, creatives=[{"variation": 1, "error": "branding failed"}, _creative(2)],
+    )
+
+    assert result["ads"][0] == {"error": "branding failed", "variation": 1}
+    assert result["ads"][1]["variation"] == 2
+
+
+def test_synced_ads_map_back_to_their_variation():
+    from app.services.learning_service import _creative_variant
+
+    assert meta_ads.ad_variation(meta_ads.ad_name("ZEULE - Book", 3)) == 3
+    assert _creative_variant("ZEULE - Book - Ad 2") == "variation_2"
+    assert _creative_variant("Manually created ad") == "Manually created ad"
+    assert _creative_variant(None) is None
@@ -0,0 +1,62 @@
+from app.services.prompt_tests import _score_output, _summarize
+
+
+def _cell(version, error=None, cached=False, latency_ms=100, **scores):
+    return {
+        "version": version,
+        "error": error,
+        "cached": cached,
+        "latency_ms": latency_ms,
+        "input_tokens": 10,
+        "output_tokens": 20,
+        **scores,
+    }
+
+
+def test_summarize_groups_cells():
+    summary = _summarize([
+        _cell(1, latency_ms=100, similarity=1.0),
+        _cell(1, latency_ms=300, similarity=0.5),
+        _cell(2, error="timeout", latency_ms=5000),
+        _cell(2, cached=True, latency_ms=1, similarity=0.8),
+    ], group_by=("version",))
+
+    assert summary == [
+        {
+            "version": 1, "cells": 2, "errors": 0, "cached": 0,
+            "input_tokens": 20, "output_tokens": 40,
+            "avg_latency_ms": 200, "max_latency_ms": 300, "avg_similarity": 0.75,
+        },
+        {
+            # Errors and cache hits say nothing about the provider's latency
+            "version": 2, "cells": 2, "errors": 1, "cached": 1,
+            "input_tokens": 20, "output_tokens": 40,
+            "avg_latency_ms": None, "max_latency_ms": None, "avg_similarity": 0.8,
+        },
+    ]
+
+
+def test_score_output_against_the_original():
+    original = {"phase": 3, "avatar": {"age": 35}, "pain_points": ["time"], "quotes": [], "hooks": ["a"]}
+    output = {"phase": 3, "avatar": {"age": 35}, "pain_points": {"error": "LLM timeout"}, "hooks": ["b"]}
+
+    scores = _score_output(original, output, version=4)
+
+    # quotes was empty in the original, so three sections count; pain_points failed
+    assert scores["key_coverage"] == round(2 / 3, 3)
+    assert scores["step_errors"] == 1
+    assert 0 < scores["similarity"] < 1
+    assert scores["diff"].startswith("--- original\n+++ v4")
+
+
+def test_score_output_ignores_bookkeeping_keys():
+    original = {"phase": 7, "stripe": {"id": "price_a"}, "copy": "x"}
+    output = {"phase": 7, "stripe": {"id": "price_b"}, "copy": "x"}
+
+    scores = _score_output(original, output, version=2)
+
+    assert scores == {"key_coverage": 1.0, "step_errors": 0, "diff": "", "similarity": 1.0}
+
+
+def test_score_output_with_nothing_to_cover():
+    assert _score_output(None, {"copy": "x"}, 2)["key_coverage"] is None
@@ -0,0 +1,97 @@
+import email.utils
+import json
+import time
+
+import httpx
+import pytest
+
+from app.utils import retry
+from app.utils.retry import adaptive_retry, retry_after
+
+
+def _error(status=429, headers=None):
+    request = httpx.Request("POST", "https://api.example.com/v1")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"retry-after-ms": "1500"}, 1.5),
+    ({"retry-after": "7"}, 7.0),
+    ({"x-ratelimit-reset-requests": "20ms", "x-ratelimit-reset-tokens": "6m0s"}, 360.0),
+    ({"x-business-use-case-usage": json.dumps({"123": [{"estimated_time_to_regain_access": 2}]})}, 120.0),
+    ({}, None),
+])
+def test_retry_after_headers(headers, expected):
+    assert retry_after(_error(headers=headers)) == expected
+
+
+def test_retry_after_http_date():
+    when = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+    assert 25 < retry_after(_error(headers={"retry-after": when})) <= 30
+
+
+@pytest.mark.parametrize("value", ["soon", "Mon, 99 Foo 2026 99:99:99 GMT", "  "])
+def test_malformed_retry_after_falls_back_to_backoff(value):
+    assert retry_after(_error(headers={"retry-after": value})) is None
+
+
+def test_retry_after_without_a_response():
+    assert retry_after(ValueError("no response")) is None
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(retry.time, "sleep", delays.append)
+    return delays
+
+
+def _flaky(errors, idempotent=True):
+    calls = []
+
+    @adaptive_retry("test", max_attempts=3, idempotent=idempotent)
+    def call():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return call, calls
+
+
+def test_throttled_call_waits_as_told_then_succeeds(sleeps):
+    call, calls = _flaky([_error(headers={"retry-after": "2"})])
+
+    assert call() == "ok"
+    assert len(calls) == 2
+    assert 2 <= sleeps[0] <= 3
+
+
+def test_gives_up_after_max_attempts(sleeps):
+    call, calls = _flaky([_error(503)] * 3)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call()
+    assert len(calls) == 3
+
+
+def test_non_idempotent_calls_retry_only_what_never_landed(sleeps):
+    call, calls = _flaky([_error(500)], idempotent=False)
+    with pytest.raises(httpx.HTTPStatusError):
+        call()
+    assert len(calls) == 1
+
+    call, calls = _flaky([httpx.ConnectError("refused")], idempotent=False)
+    assert call() == "ok"
+
+
+def test_hint_beyond_max_wait_fails_fast(sleeps, monkeypatch):
+    monkeypatch.setattr(retry.settings, "RETRY_MAX_WAIT", 60)
+    call, calls = _flaky([_error(headers={"retry-after": "3600"})])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call()
+    assert len(calls) == 1
+    assert sleeps == []
@@ -0,0 +1,26 @@
+from sqlalchemy.dialects import postgresql
+
+from app.services import rollups
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_counters_are_upserted_in_key_order():
+    connection = RecordingConnection()
+
+    rollups.increment({
+        ("products.status", "review"): 1,
+        ("pipelines.status", "running"): -1,
+        ("products.status", "draft"): -1,
+        ("pipelines.status", "completed"): 1,
+    }, connection=connection)
+
+    params = connection.statements[0].params
+    keys = [(params[f"metric_m{i}"], params[f"key_m{i}"]) for i in range(4)]
+    assert keys == sorted(keys)
@@ -0,0 +1,62 @@
+import pytest
+
+from app.agents.base import BaseAgent, Step
+
+
+class Agent(BaseAgent):
+    agent_name = "test"
+
+    def run(self, input_data, learning_context):
+        return {}
+
+
+def test_results_flow_to_dependent_steps():
+    results = Agent().run_steps({
+        "a": Step(lambda: 1),
+        "b": Step(lambda: 2),
+        "sum": Step(lambda a, b: a + b, after=("a", "b")),
+        "renamed": Step(lambda x, **_: x * 10, after={"sum": "x"}),
+    })
+
+    assert results == {"a": 1, "b": 2, "sum": 3, "renamed": 30}
+
+
+def test_failure_skips_dependents_and_is_reraised():
+    ran = []
+
+    def boom():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        Agent().run_steps({
+            "fails": Step(boom),
+            "independent": Step(lambda: ran.append("independent")),
+            "dependent": Step(lambda fails: ran.append("dependent"), after=("fails",)),
+            "transitive": Step(lambda dependent: ran.append("transitive"), after=("dependent",)),
+        })
+
+    assert ran == ["independent"]
+
+
+def test_first_failure_in_declaration_order_wins():
+    def fail(message):
+        raise ValueError(message)
+
+    with pytest.raises(ValueError, match="first"):
+        Agent().run_steps({
+            "first": Step(fail, "first"),
+            "second": Step(fail, "second"),
+        })
+
+
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        Agent().run_steps({
+            "a": Step(lambda b: b, after=("b",)),
+            "b": Step(lambda a: a, after=("a",)),
+        })
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError, match="unknown steps"):
+        Agent().run_steps({"a": Step(lambda missing: missing, after=("missing",))})
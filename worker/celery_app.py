@@ -1,6 +1,7 @@
 """Celery application configuration."""
 
 from celery import Celery
+from celery.signals import worker_process_shutdown
 from config.settings import settings
 
 celery = Celery(
@@ -29,3 +30,9 @@ celery.conf.update(
 )
 
 celery.autodiscover_tasks(["worker"])
+
+
+@worker_process_shutdown.connect
+def _close_http_clients(**kwargs):
+    from app.integrations.http import close_clients
+    close_clients()
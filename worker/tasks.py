@@ -66,13 +66,36 @@ def resume_after_approval(self, pipeline_run_id: str, phase_number: int):
 @celery.task(name="worker.tasks.sync_ad_performance")
 def sync_ad_performance():
     """Periodic task: sync Meta Ads performance data."""
-    from app import create_app
+    from app import create_app, db
     app = create_app()
 
     with app.app_context():
         from app.services.learning_service import sync_all_ad_performance
+        from app.services.timeseries import refresh_learning_rollups
         try:
             sync_all_ad_performance()
             logger.info("task.sync_ads.done")
         except Exception as e:
             logger.error("task.sync_ads.failed", error=str(e))
+
+        # Approvals logged since the last run, whether or not any ads synced
+        try:
+            refresh_learning_rollups()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("task.learning_rollups.failed", error=str(e))
+
+
+@celery.task(name="worker.tasks.run_prompt_test")
+def run_prompt_test(run_id: str):
+    """Run a queued prompt test — a version/provider matrix or a replay of past phases."""
+    from app import create_app
+    app = create_app()
+
+    with app.app_context():
+        from app.services.prompt_tests import execute_run
+
+        run = execute_run(run_id)
+        logger.info("task.prompt_test.done", run_id=run_id, status=run.status)
+        return run.status